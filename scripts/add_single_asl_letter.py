@@ -7,9 +7,13 @@ Helper script to add individual ASL letter images to the correct directories.
 import os
 import sys
 import shutil
-from PIL import Image
+import argparse
+from png_encoder import DEFAULT_MAX_ERROR, write_png
+from image_decode import RESAMPLING_TIERS, DEFAULT_TIER
+from normalize_images import normalize_images
 
-def add_single_asl_letter(input_image_path, letter, output_dirs):
+def add_single_asl_letter(input_image_path, letter, output_dirs, transparent=False,
+                          tier=DEFAULT_TIER):
     """
     Add a single ASL letter image to the alphabet directories.
     
@@ -17,6 +21,9 @@ def add_single_asl_letter(input_image_path, letter, output_dirs):
         input_image_path (str): Path to the input image
         letter (str): The letter this image represents (A-Z)
         output_dirs (list): List of output directories
+        transparent (bool): Keep a trimmed transparent background instead of
+            flattening onto a white 150x150 canvas
+        tier (str): Resampling tier from image_decode.RESAMPLING_TIERS
     """
     
     if not os.path.exists(input_image_path):
@@ -30,48 +37,44 @@ def add_single_asl_letter(input_image_path, letter, output_dirs):
     letter = letter.upper()
     filename = f"{letter.lower()}.png"
     
-    try:
-        # Open and process the image
-        with Image.open(input_image_path) as img:
-            # Convert to RGB if needed
-            if img.mode in ('RGBA', 'LA', 'P'):
-                # Create white background
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                img = background
-            
-            # Resize to standard size while maintaining aspect ratio
-            img.thumbnail((150, 150), Image.Resampling.LANCZOS)
-            
-            # Create a white background and center the image
-            final_img = Image.new('RGB', (150, 150), (255, 255, 255))
-            x = (150 - img.width) // 2
-            y = (150 - img.height) // 2
-            final_img.paste(img, (x, y))
-            
-            # Save to all output directories
-            for output_dir in output_dirs:
-                os.makedirs(output_dir, exist_ok=True)
-                output_path = os.path.join(output_dir, filename)
-                final_img.save(output_path, "PNG", quality=95)
-                print(f"✅ Saved ASL {letter} -> {output_path}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error processing image: {e}")
+    # Same normalization engine as setup_asl_images, run in-process
+    result = normalize_images(
+        [input_image_path], size=150, tier=tier, transparent=transparent,
+        max_error=DEFAULT_MAX_ERROR, workers=1
+    )[0]
+    
+    if result['error']:
+        print(f"❌ Error processing image: {result['error']}")
         return False
+    
+    # Save to all output directories
+    output_paths = []
+    for output_dir in output_dirs:
+        os.makedirs(output_dir, exist_ok=True)
+        output_paths.append(os.path.join(output_dir, filename))
+    
+    info = write_png(result['png'], result['info'], output_paths)
+    
+    # write_png reports per-path errors itself; fail if nothing was written
+    return bool(info['saved'])
 
 def main():
     if len(sys.argv) < 3:
-        print("Usage: python add_single_asl_letter.py <image_path> <letter>")
+        print("Usage: python add_single_asl_letter.py <image_path> <letter> [--transparent] [--resample TIER]")
         print("Example: python add_single_asl_letter.py /path/to/a_sign.png A")
         return
     
-    input_image = sys.argv[1]
-    letter = sys.argv[2]
+    parser = argparse.ArgumentParser(description="Add a single ASL letter image")
+    parser.add_argument('image_path')
+    parser.add_argument('letter')
+    parser.add_argument('--transparent', action='store_true',
+                        help="Write a trimmed RGBA/LA image with a transparent background")
+    parser.add_argument('--resample', choices=sorted(RESAMPLING_TIERS), default=DEFAULT_TIER,
+                        help="Resampling tier")
+    args = parser.parse_args()
+    
+    input_image = args.image_path
+    letter = args.letter
     
     # Project directories
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -85,7 +88,10 @@ def main():
     print(f"Input: {input_image}")
     print(f"Letter: {letter.upper()}")
     
-    success = add_single_asl_letter(input_image, letter, output_directories)
+    success = add_single_asl_letter(
+        input_image, letter, output_directories,
+        transparent=args.transparent, tier=args.resample
+    )
     
     if success:
         print(f"\n🎉 ASL letter {letter.upper()} added successfully!")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Transparent Sign Output
+Turns the near-white background of a sign image into alpha and trims the
+empty border, so signs can sit on any app theme without a white canvas.
+"""
+
+import numpy as np
+from PIL import Image
+
+# Pixels whose darkest channel is at or above this are treated as background
+DEFAULT_WHITE_THRESHOLD = 235
+
+# Width of the ramp (in channel levels) between fully opaque and transparent,
+# which keeps anti-aliased line-art edges smooth
+DEFAULT_SOFTNESS = 30
+
+def white_to_alpha(pixels, threshold=DEFAULT_WHITE_THRESHOLD, softness=DEFAULT_SOFTNESS):
+    """
+    Convert near-white pixels of an (..., 3) or (..., 4) array to alpha.
+
+    Works on a single (H, W, C) image or a stacked (N, H, W, C) batch. Colours
+    on the soft edge are un-blended from white so they don't leave a light
+    halo on dark backgrounds. Returns a uint8 array with 4 channels.
+    """
+    pixels = np.asarray(pixels, dtype=np.float32)
+    rgb = pixels[..., :3]
+
+    # Distance from white measured on the darkest channel
+    darkest = rgb.min(axis=-1)
+    alpha = np.clip((threshold - darkest) / max(softness, 1), 0.0, 1.0)
+
+    # Un-blend: c = a * fg + (1 - a) * 255  =>  fg = (c - (1 - a) * 255) / a
+    safe_alpha = np.maximum(alpha, 1e-3)[..., None]
+    foreground = (rgb - (1.0 - alpha[..., None]) * 255.0) / safe_alpha
+    foreground = np.where(alpha[..., None] > 0, foreground, rgb)
+
+    if pixels.shape[-1] == 4:
+        alpha = np.minimum(alpha, pixels[..., 3] / 255.0)
+
+    out = np.empty(pixels.shape[:-1] + (4,), dtype=np.uint8)
+    out[..., :3] = np.clip(foreground, 0, 255).astype(np.uint8)
+    out[..., 3] = np.round(alpha * 255.0).astype(np.uint8)
+    return out
+
+def trim_transparent(rgba, margin=2):
+    """
+    Crop an (H, W, 4) array to the bounding box of its visible pixels.
+
+    A small margin is kept so strokes don't touch the image edge. Fully
+    transparent input is returned unchanged.
+    """
+    visible = rgba[..., 3] > 0
+    rows = np.flatnonzero(visible.any(axis=1))
+    cols = np.flatnonzero(visible.any(axis=0))
+    if rows.size == 0:
+        return rgba
+
+    height, width = visible.shape
+    y1 = max(0, rows[0] - margin)
+    y2 = min(height, rows[-1] + 1 + margin)
+    x1 = max(0, cols[0] - margin)
+    x2 = min(width, cols[-1] + 1 + margin)
+    return rgba[y1:y2, x1:x2]
+
+def make_transparent(image, threshold=DEFAULT_WHITE_THRESHOLD, softness=DEFAULT_SOFTNESS):
+    """
+    Return a trimmed RGBA copy of a PIL image with its white background removed.
+    """
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA')
+
+    rgba = white_to_alpha(np.asarray(image), threshold=threshold, softness=softness)
+    return Image.fromarray(trim_transparent(rgba), 'RGBA')
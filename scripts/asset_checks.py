@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Asset Serving Checks
+Concurrent HEAD/GET checks of served sign assets over one pooled HTTP
+session, with per-asset latency, plus a local static-file server standing in
+for the frontend so the checks run in CI without a live dev server.
+"""
+
+import os
+import math
+import time
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from requests.adapters import HTTPAdapter
+from sign_catalog import PROJECT_ROOT
+from page_assets import PUBLIC_DIRS
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_TIMEOUT = 3
+
+def make_session(concurrency=DEFAULT_CONCURRENCY):
+    """A requests session whose connection pool fits `concurrency` workers"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def check_asset(session, base_url, url, method='HEAD', timeout=DEFAULT_TIMEOUT,
+                content_types=('image', 'svg')):
+    """
+    Request one asset and return its result:
+        {url, status, content_type, bytes, latency_ms, ok, error}
+    ok means HTTP 200 with a content type containing one of content_types.
+    """
+    result = {'url': url, 'status': None, 'content_type': '', 'bytes': 0,
+              'latency_ms': None, 'ok': False, 'error': None}
+    start = time.perf_counter()
+    try:
+        response = session.request(method, base_url.rstrip('/') + url, timeout=timeout)
+        if method == 'GET':
+            result['bytes'] = len(response.content)
+        result['latency_ms'] = (time.perf_counter() - start) * 1000
+        result['status'] = response.status_code
+        result['content_type'] = response.headers.get('content-type', '')
+        if response.status_code != 200:
+            result['error'] = f"HTTP {response.status_code}"
+        elif not any(kind in result['content_type'] for kind in content_types):
+            result['error'] = f"Wrong content type - {result['content_type']}"
+        else:
+            result['ok'] = True
+    except requests.exceptions.RequestException as e:
+        result['latency_ms'] = (time.perf_counter() - start) * 1000
+        result['error'] = str(e)
+    return result
+
+def check_assets(base_url, urls, concurrency=DEFAULT_CONCURRENCY, method='HEAD',
+                 timeout=DEFAULT_TIMEOUT, content_types=('image', 'svg')):
+    """
+    Check many assets concurrently over one pooled session.
+
+    Returns the results in the order of urls.
+    """
+    with make_session(concurrency) as session, ThreadPoolExecutor(concurrency) as pool:
+        check = functools.partial(check_asset, session, base_url, method=method,
+                                  timeout=timeout, content_types=content_types)
+        return list(pool.map(check, urls))
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers (None when empty)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(len(ordered) * fraction)) - 1]
+
+def print_check_report(results, label='assets', verbose=True):
+    """Print per-asset results and a latency summary; returns the error list"""
+    errors = []
+    for result in results:
+        latency = f"{result['latency_ms']:6.1f} ms" if result['latency_ms'] is not None else "   --   "
+        if result['ok']:
+            if verbose:
+                print(f"✅ {latency}  {result['url']}")
+        else:
+            print(f"❌ {latency}  {result['url']}: {result['error']}")
+            errors.append(f"{result['url']}: {result['error']}")
+
+    latencies = [result['latency_ms'] for result in results if result['latency_ms'] is not None]
+    ok_count = sum(result['ok'] for result in results)
+    print(f"\n📊 Results:")
+    print(f"✅ Successfully served: {ok_count}/{len(results)} {label}")
+    print(f"❌ Errors: {len(errors)}")
+    if latencies:
+        print(f"⏱️ Latency: p50 {percentile(latencies, 0.5):.1f} ms, "
+              f"p95 {percentile(latencies, 0.95):.1f} ms, max {max(latencies):.1f} ms")
+    return errors
+
+def local_web_root():
+    """The web root the frontend dev server serves (frontend/public, else public)"""
+    for public_dir in reversed(PUBLIC_DIRS):
+        path = os.path.join(PROJECT_ROOT, public_dir)
+        if os.path.isdir(path):
+            return path
+    return os.path.join(PROJECT_ROOT, PUBLIC_DIRS[0])
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that keeps the console quiet"""
+
+    # Keep-alive, as the dev server and CDN do
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+class _StaticHTTPServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 drops connections from concurrent
+    # checkers, which then stall a full second on SYN retry
+    request_queue_size = 128
+    daemon_threads = True
+
+class LocalStaticServer:
+    """
+    Serve a directory over HTTP on localhost in a background thread.
+
+    Usage:
+        with LocalStaticServer('frontend/public') as server:
+            check_assets(server.base_url, urls)
+
+    port=0 picks a free port.
+    """
+
+    handler_class = QuietHandler
+
+    def __init__(self, root, port=0):
+        self.root = os.path.abspath(root)
+        handler = functools.partial(self.handler_class, directory=self.root)
+        self.server = _StaticHTTPServer(('127.0.0.1', port), handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Asset Pack
+Bundles every generated sign asset under public/images/signs (PNGs, SVGs,
+dictionary JSON and shards) into one signs.pack file, so deploys upload a
+single object and cold reads open a single file.
+
+Pack layout:
+    MAGIC | blob data ... | index JSON | footer (index offset, index length, MAGIC)
+
+Identical files are stored once (blobs are keyed by SHA-256); the index maps
+each asset path to its blob offset, size, hash and content type. AssetPack
+memory-maps the pack, parses the footer and index only, then serves or
+extracts single entries by random access.
+"""
+
+import os
+import json
+import mmap
+import struct
+import shutil
+import hashlib
+import argparse
+import mimetypes
+from urllib.parse import unquote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from precompress import TEMP_SUFFIX
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACK_SOURCE = 'public/images/signs'
+PACK_OUTPUTS = ['public/images/signs.pack', 'frontend/public/images/signs.pack']
+
+MAGIC = b'LNKPACK1'
+FOOTER = struct.Struct('<QQ8s')
+
+# Precompressed siblings are a hosting detail; the pack stores originals.
+# Unfinished outputs of an interrupted build are never packed.
+SKIP_EXTENSIONS = ('.gz', '.br', TEMP_SUFFIX)
+
+def collect_assets(source_dir):
+    """
+    Relative paths (POSIX style, sorted) of every asset under source_dir,
+    skipping hidden directories (such as old '.spool-*' shard spools)
+    """
+    assets = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+        for filename in sorted(files):
+            if filename.endswith(SKIP_EXTENSIONS):
+                continue
+            full_path = os.path.join(root, filename)
+            assets.append(os.path.relpath(full_path, source_dir).replace(os.sep, '/'))
+    return assets
+
+def content_type(path):
+    """MIME type of an asset path"""
+    return mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+def write_pack(source_dir, pack_path):
+    """
+    Pack every asset under source_dir into pack_path.
+
+    Assets are written in sorted path order and deduplicated by SHA-256, so
+    the same inputs always produce a byte-identical pack. The pack is built
+    under a temporary name and only replaces pack_path once complete, so
+    readers never map a truncated pack. Returns the index.
+    """
+    temp_path = pack_path + TEMP_SUFFIX
+    blobs = {}
+    entries = {}
+    try:
+        with open(temp_path, 'wb') as pack:
+            pack.write(MAGIC)
+            for path in collect_assets(source_dir):
+                with open(os.path.join(source_dir, path), 'rb') as f:
+                    data = f.read()
+                digest = hashlib.sha256(data).hexdigest()
+                if digest not in blobs:
+                    blobs[digest] = pack.tell()
+                    pack.write(data)
+                entries[path] = {
+                    'offset': blobs[digest],
+                    'size': len(data),
+                    'sha256': digest,
+                    'type': content_type(path)
+                }
+
+            index = {'version': 1, 'entries': entries}
+            payload = json.dumps(index, separators=(',', ':')).encode('utf-8')
+            index_offset = pack.tell()
+            pack.write(payload)
+            pack.write(FOOTER.pack(index_offset, len(payload), MAGIC))
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    os.replace(temp_path, pack_path)
+    return index
+
+def build_pack(source=PACK_SOURCE, outputs=PACK_OUTPUTS):
+    """
+    Write the asset pack for source to every output path (relative to the
+    project root). The pack is built once and copied. Returns a summary dict.
+    """
+    source_dir = os.path.join(PROJECT_ROOT, source)
+    pack_paths = [os.path.join(PROJECT_ROOT, output) for output in outputs]
+    for pack_path in pack_paths:
+        os.makedirs(os.path.dirname(pack_path), exist_ok=True)
+
+    index = write_pack(source_dir, pack_paths[0])
+    for pack_path in pack_paths[1:]:
+        shutil.copyfile(pack_paths[0], pack_path + TEMP_SUFFIX)
+        os.replace(pack_path + TEMP_SUFFIX, pack_path)
+
+    entries = index['entries']
+    asset_bytes = sum(entry['size'] for entry in entries.values())
+    pack_bytes = os.path.getsize(pack_paths[0])
+    for pack_path in pack_paths:
+        print(f"  📦 Asset pack saved to: {pack_path}")
+    print(f"  📊 {len(entries)} assets ({len({e['sha256'] for e in entries.values()})} unique), "
+          f"{asset_bytes:,} bytes -> {pack_bytes:,} byte pack")
+
+    return {'assets': len(entries), 'asset_bytes': asset_bytes, 'pack_bytes': pack_bytes,
+            'paths': pack_paths}
+
+class AssetPack:
+    """
+    Random-access reader for a signs.pack file.
+
+    The pack is memory-mapped and only the footer and index are parsed on
+    open; read() slices one entry's blob, so a single reader can be shared
+    between threads.
+    """
+
+    def __init__(self, pack_path):
+        self.path = pack_path
+        self._file = open(pack_path, 'rb')
+        # mmap cannot map an empty file, so check the size before mapping
+        if os.fstat(self._file.fileno()).st_size < len(MAGIC) + FOOTER.size:
+            self._file.close()
+            raise ValueError(f"Not an asset pack: {pack_path}")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not an asset pack: {pack_path}")
+        index_offset, index_length, magic = FOOTER.unpack(self._map[-FOOTER.size:])
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not an asset pack: {pack_path}")
+        self.index = json.loads(self._map[index_offset:index_offset + index_length])
+        self.entries = self.index['entries']
+
+    def __contains__(self, path):
+        return path in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def info(self, path):
+        """Index entry (offset, size, sha256, type) for a path"""
+        return self.entries[path]
+
+    def read(self, path, verify=False):
+        """Bytes of one asset; with verify=True the SHA-256 is checked"""
+        entry = self.entries[path]
+        data = self._map[entry['offset']:entry['offset'] + entry['size']]
+        if verify and hashlib.sha256(data).hexdigest() != entry['sha256']:
+            raise ValueError(f"Checksum mismatch for {path}")
+        return data
+
+    def extract(self, dest_dir, paths=None, verify=True):
+        """
+        Extract the given paths (default: all) under dest_dir; returns the
+        count. An index path that would land outside dest_dir (absolute or
+        with '..' components) raises ValueError.
+        """
+        root = os.path.realpath(dest_dir)
+        count = 0
+        for path in paths if paths is not None else self.entries:
+            target = os.path.realpath(os.path.join(root, *path.split('/')))
+            if os.path.commonpath([root, target]) != root or target == root:
+                raise ValueError(f"Unsafe path in asset pack: {path}")
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as f:
+                f.write(self.read(path, verify=verify))
+            count += 1
+        return count
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def make_handler(pack):
+    """HTTP handler class serving entries of an open AssetPack by path"""
+
+    class PackHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self._respond(send_body=True)
+
+        def do_HEAD(self):
+            self._respond(send_body=False)
+
+        def _respond(self, send_body):
+            path = unquote(self.path.split('?', 1)[0].lstrip('/'))
+            if path not in pack:
+                self.send_error(404)
+                return
+            entry = pack.info(path)
+            etag = f'"{entry["sha256"]}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            data = pack.read(path)
+
+            self.send_response(200)
+            self.send_header('Content-Type', entry['type'])
+            self.send_header('Content-Length', str(len(data)))
+            self.send_header('ETag', etag)
+            self.end_headers()
+            if send_body:
+                self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return PackHandler
+
+def serve(pack_path, port=8765):
+    """Serve a pack over HTTP at http://localhost:port/<asset path>"""
+    with AssetPack(pack_path) as pack:
+        server = ThreadingHTTPServer(('localhost', port), make_handler(pack))
+        print(f"🌐 Serving {len(pack)} assets from {pack_path} at http://localhost:{port}/")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build, inspect and serve the sign asset pack")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('build', help="Pack public/images/signs into signs.pack")
+
+    list_parser = subparsers.add_parser('list', help="List the entries of a pack")
+    list_parser.add_argument('pack', nargs='?', default=os.path.join(PROJECT_ROOT, PACK_OUTPUTS[0]))
+
+    extract_parser = subparsers.add_parser('extract', help="Extract entries from a pack")
+    extract_parser.add_argument('dest', help="Destination directory")
+    extract_parser.add_argument('paths', nargs='*', help="Entries to extract (default: all)")
+    extract_parser.add_argument('--pack', default=os.path.join(PROJECT_ROOT, PACK_OUTPUTS[0]))
+
+    serve_parser = subparsers.add_parser('serve', help="Serve entries over HTTP")
+    serve_parser.add_argument('--pack', default=os.path.join(PROJECT_ROOT, PACK_OUTPUTS[0]))
+    serve_parser.add_argument('--port', type=int, default=8765)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        print("📦 Building sign asset pack")
+        print("=" * 50)
+        summary = build_pack()
+        return 0 if summary['assets'] else 1
+
+    if not os.path.exists(args.pack):
+        print(f"❌ Pack not found: {args.pack}")
+        return 1
+
+    if args.command == 'list':
+        with AssetPack(args.pack) as pack:
+            for path, entry in pack.entries.items():
+                print(f"{entry['size']:>10,}  {entry['sha256'][:12]}  {path}")
+            print(f"\n{len(pack)} entries")
+        return 0
+
+    if args.command == 'extract':
+        with AssetPack(args.pack) as pack:
+            missing = [path for path in args.paths if path not in pack]
+            if missing:
+                print(f"❌ Not in pack: {', '.join(missing)}")
+                return 1
+            count = pack.extract(args.dest, args.paths or None)
+        print(f"✅ Extracted {count} entries to {args.dest}")
+        return 0
+
+    serve(args.pack, args.port)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
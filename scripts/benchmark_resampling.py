@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Resampling Tier Benchmark
+Times decode, crop and resize of every mapped sign chart for each resampling
+tier, and scores the output against the full-resolution, high-quality build.
+"""
+
+import os
+import json
+import time
+import argparse
+import cv2
+import numpy as np
+from PIL import Image
+from precise_crop_signs import get_sign_mappings, crop_sign_from_grid
+from image_decode import RESAMPLING_TIERS, read_chart_bgr, resize
+
+PADDING = 8
+
+def psnr(reference, candidate):
+    """Peak signal-to-noise ratio in dB between two uint8 arrays"""
+    mse = np.mean((reference.astype(np.float32) - candidate.astype(np.float32)) ** 2)
+    if mse == 0:
+        return 99.0
+    return float(10.0 * np.log10(255.0 ** 2 / mse))
+
+def render_chart(image_path, mapping, size, tier, reduced=True):
+    """Decode a chart and produce every mapped sign at size x size"""
+    if reduced:
+        img, scale = read_chart_bgr(image_path, (size, size), mapping['grid_layout'], PADDING)
+    else:
+        img, scale = cv2.imread(image_path), 1
+
+    outputs = []
+    for _, col, row in mapping['signs']:
+        cropped = crop_sign_from_grid(img, col, row, mapping['grid_layout'], padding=PADDING // scale)
+        pil_image = Image.fromarray(cv2.cvtColor(cropped, cv2.COLOR_BGR2RGB))
+        outputs.append(np.asarray(resize(pil_image, (size, size), tier)))
+    return outputs, scale
+
+def benchmark(size=200, repeats=3):
+    """
+    Benchmark every resampling tier on the charts found in the working directory.
+
+    Returns a dict of per-tier results with the best-of-N wall time, speedup
+    over the quality tier and mean PSNR against a full-decode Lanczos build.
+    """
+    charts = [(path, mapping) for path, mapping in get_sign_mappings().items()
+              if os.path.exists(path)]
+    if not charts:
+        return {}
+
+    # Reference: full-resolution decode with the highest quality filter
+    references = {path: render_chart(path, mapping, size, 'quality', reduced=False)[0]
+                  for path, mapping in charts}
+
+    results = {}
+    for tier in RESAMPLING_TIERS:
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            rendered = {path: render_chart(path, mapping, size, tier)
+                        for path, mapping in charts}
+            timings.append(time.perf_counter() - start)
+
+        scores = [
+            psnr(reference, output)
+            for path, (outputs, _) in rendered.items()
+            for reference, output in zip(references[path], outputs)
+        ]
+        results[tier] = {
+            'seconds': min(timings),
+            'psnr_db': float(np.mean(scores)),
+            'decode_scales': {path: scale for path, (_, scale) in rendered.items()},
+            'signs': len(scores)
+        }
+
+    quality_time = results['quality']['seconds']
+    for tier_result in results.values():
+        tier_result['speedup'] = quality_time / tier_result['seconds'] if tier_result['seconds'] else 0.0
+
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark resampling tiers on the sign charts")
+    parser.add_argument('--size', type=int, default=200, help="Output size in pixels")
+    parser.add_argument('--repeats', type=int, default=3, help="Timed runs per tier (best is kept)")
+    parser.add_argument('--json', help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    print("⏱️ Resampling Tier Benchmark")
+    print("=" * 60)
+
+    results = benchmark(size=args.size, repeats=args.repeats)
+    if not results:
+        print("❌ No sign charts found. Run from the project root.")
+        return 1
+
+    print(f"{'Tier':<10} {'Time (ms)':>10} {'Speedup':>9} {'PSNR (dB)':>10}  Description")
+    for tier, result in results.items():
+        print(f"{tier:<10} {result['seconds'] * 1000:>10.1f} {result['speedup']:>8.1f}x "
+              f"{result['psnr_db']:>10.1f}  {RESAMPLING_TIERS[tier]['description']}")
+
+    scales = next(iter(results.values()))['decode_scales']
+    print(f"\n📐 JPEG decode scales at {args.size}px:")
+    for path, scale in scales.items():
+        print(f"  {path}: 1/{scale}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'size': args.size, 'tiers': results}, f, indent=2)
+        print(f"\n📝 Results saved to: {args.json}")
+
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Sign Record Memory Benchmark
+Compares the peak and retained memory of the dict-per-sign representation
+against the compact SignTable (struct-of-arrays) for a synthetic vocabulary.
+"""
+
+import gc
+import json
+import time
+import argparse
+import tracemalloc
+from sign_catalog import CATALOG_FIELDS, load_catalog
+from sign_records import SignTable
+
+COLUMNS = CATALOG_FIELDS + ('source_image', 'grid_position')
+SOURCES = ('sign.jpg', 'dict1.jpg', 'commonSign.jpeg', 'common sign language.jpg')
+
+def _fresh(text):
+    """A new string object equal to text (as a parser would allocate it)"""
+    return text.encode('utf-8').decode('utf-8')
+
+def synthetic_rows(count):
+    """
+    Yield (name, fields) for count signs, like rows parsed from a large import.
+
+    Every string is built fresh per row, as a parser would produce it, with
+    categories, difficulties and usage drawn from the real catalog.
+    """
+    templates = list(load_catalog()['signs'].values())
+    for i in range(count):
+        template = templates[i % len(templates)]
+        yield f"sign_{i:06d}", {
+            'category': _fresh(template['category']),
+            'description': f"{template['description']} (variant {i})",
+            'difficulty': _fresh(template['difficulty']),
+            'usage': _fresh(template['usage']),
+            'source_image': _fresh(SOURCES[i % len(SOURCES)]),
+            'grid_position': (i % 8, (i // 8) % 6)
+        }
+
+def build_dicts(count):
+    """Current representation: one dict per sign"""
+    return {name: fields for name, fields in synthetic_rows(count)}
+
+def build_table(count):
+    """Compact representation: SignTable columns with interned codes"""
+    table = SignTable(COLUMNS)
+    for name, fields in synthetic_rows(count):
+        table.append(name, **fields)
+    return table
+
+def measure(builder, count):
+    """Build a representation and return (retained_bytes, peak_bytes, seconds)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = builder(count)
+    seconds = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return retained, peak, seconds
+
+def benchmark(count=100000):
+    """Measure both representations; returns {name: result dict}"""
+    load_catalog()  # Load outside the traced region
+
+    results = {}
+    for name, builder in (('dicts', build_dicts), ('table', build_table)):
+        retained, peak, seconds = measure(builder, count)
+        results[name] = {
+            'retained_bytes': retained,
+            'peak_bytes': peak,
+            'bytes_per_sign': retained / count if count else 0.0,
+            'build_seconds': seconds
+        }
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark sign record memory use")
+    parser.add_argument('--signs', type=int, default=100000, help="Synthetic vocabulary size")
+    parser.add_argument('--json', help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    print("🧠 Sign Record Memory Benchmark")
+    print("=" * 60)
+
+    results = benchmark(args.signs)
+
+    print(f"{'Representation':<16} {'Retained (MB)':>14} {'Peak (MB)':>10} {'B/sign':>8} {'Build (s)':>10}")
+    for name, result in results.items():
+        print(f"{name:<16} {result['retained_bytes'] / 1e6:>14.1f} {result['peak_bytes'] / 1e6:>10.1f} "
+              f"{result['bytes_per_sign']:>8.0f} {result['build_seconds']:>10.2f}")
+
+    dicts, table = results['dicts']['retained_bytes'], results['table']['retained_bytes']
+    if table:
+        print(f"\n📉 SignTable uses {table / dicts:.0%} of the dict representation "
+              f"({dicts / table:.1f}x smaller) for {args.signs:,} signs")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'signs': args.signs, 'results': results}, f, indent=2)
+        print(f"\n📝 Results saved to: {args.json}")
+
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
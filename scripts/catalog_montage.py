@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Catalog Preview Montages
+Draws every sign image of an output directory (common crops by default)
+into preview pages, one series per catalog category, so reviewers can see
+the whole catalog at once.
+
+Thumbnails are made once and cached as raw arrays under
+processed_signs/cache/thumbnails, keyed by the source file's mtime and size,
+so later runs load them without decoding any image. Each page is assembled
+by writing a stack of labelled cells into a preallocated array and
+reshaping it into the grid, and pages are rendered in parallel.
+"""
+
+import os
+import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import cv2
+import numpy as np
+from PIL import Image
+from sign_catalog import PROJECT_ROOT, ASSET_DIRS, load_catalog
+from image_decode import open_reduced, thumbnail
+
+THUMBNAIL_CACHE = os.path.join(PROJECT_ROOT, 'processed_signs', 'cache', 'thumbnails')
+MONTAGE_DIR = os.path.join(PROJECT_ROOT, 'processed_signs', 'montages')
+
+THUMB_SIZE = 150
+LABEL_HEIGHT = 28
+MARGIN = 10
+DEFAULT_COLUMNS = 8
+DEFAULT_ROWS = 6
+
+RASTER_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+UNCATEGORIZED = 'uncategorized'
+
+def _cache_path(path, kind):
+    stat = os.stat(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(THUMBNAIL_CACHE, kind, f"{name}-{stat.st_mtime_ns:x}-{stat.st_size:x}.npy")
+
+def load_thumbnail(path, kind='common', size=THUMB_SIZE):
+    """
+    size x size RGB thumbnail of an image (letterboxed on white), from the
+    cache when the source is unchanged, otherwise made and cached.
+    """
+    cache_path = _cache_path(path, kind)
+    if os.path.exists(cache_path):
+        thumb = np.load(cache_path)
+        if thumb.shape == (size, size, 3):
+            return thumb
+
+    with open_reduced(path, (size, size)) as image:
+        image = thumbnail(image.convert('RGBA'), (size, size))
+    canvas = Image.new('RGBA', (size, size), (255, 255, 255, 255))
+    canvas.alpha_composite(image, ((size - image.width) // 2, (size - image.height) // 2))
+    thumb = np.asarray(canvas.convert('RGB'))
+
+    # Drop thumbnails of older versions of this file
+    name = os.path.splitext(os.path.basename(path))[0]
+    for stale in glob.glob(os.path.join(THUMBNAIL_CACHE, kind, glob.escape(name) + '-*.npy')):
+        os.remove(stale)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    np.save(cache_path, thumb)
+    return thumb
+
+def assemble_grid(thumbs, labels, columns, size=THUMB_SIZE):
+    """
+    Lay out thumbnails (an (n, size, size, 3) RGB stack) with labels in a
+    grid of `columns`; returns the BGR page.
+
+    All cells are written into one preallocated (rows*columns, cell_h,
+    cell_w, 3) array, then reshaped and transposed into the page, so
+    placement is a single vectorised copy.
+    """
+    count = len(thumbs)
+    rows = -(-count // columns)
+    cell_h, cell_w = size + LABEL_HEIGHT + MARGIN, size + MARGIN
+    cells = np.full((rows * columns, cell_h, cell_w, 3), 255, dtype=np.uint8)
+    cells[:count, MARGIN:MARGIN + size, MARGIN // 2:MARGIN // 2 + size] = np.asarray(thumbs)[..., ::-1]
+
+    for cell, label in zip(cells, labels):
+        cv2.putText(cell, label[:18], (MARGIN // 2 + 2, MARGIN + size + 18),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 0, 0), 1, cv2.LINE_AA)
+
+    return (cells.reshape(rows, columns, cell_h, cell_w, 3)
+                 .transpose(0, 2, 1, 3, 4)
+                 .reshape(rows * cell_h, columns * cell_w, 3))
+
+def _title_bar(title, width):
+    bar = np.full((36, width, 3), 255, dtype=np.uint8)
+    cv2.putText(bar, title, (MARGIN, 26), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (40, 40, 40), 2, cv2.LINE_AA)
+    return bar
+
+def render_page(page):
+    """Render one page ({title, items: [(name, path)], kind, columns, output}); returns the output path"""
+    thumbs = [load_thumbnail(path, page['kind']) for _, path in page['items']]
+    grid = assemble_grid(thumbs, [name for name, _ in page['items']], page['columns'])
+    cv2.imwrite(page['output'], np.vstack([_title_bar(page['title'], grid.shape[1]), grid]))
+    return page['output']
+
+def plan_pages(kind='common', columns=DEFAULT_COLUMNS, rows=DEFAULT_ROWS, output_dir=MONTAGE_DIR):
+    """
+    Group the images of an output directory by catalog category (in
+    catalog order) and split each group into pages of columns x rows.
+    """
+    directory = os.path.join(PROJECT_ROOT, ASSET_DIRS[kind][0])
+    if not os.path.isdir(directory):
+        return []
+    with os.scandir(directory) as entries:
+        images = {os.path.splitext(entry.name)[0]: entry.path for entry in entries
+                  if entry.name.lower().endswith(RASTER_EXTENSIONS) and entry.is_file()}
+
+    signs = load_catalog()['signs']
+    groups = {}
+    if kind == 'alphabet':
+        groups['alphabet'] = sorted(images)
+    else:
+        for name in signs:
+            if name in images:
+                groups.setdefault(signs[name]['category'], []).append(name)
+        leftovers = sorted(images.keys() - signs.keys())
+        if leftovers:
+            groups[UNCATEGORIZED] = leftovers
+
+    per_page = columns * rows
+    pages = []
+    for category, names in groups.items():
+        page_count = -(-len(names) // per_page)
+        for index in range(page_count):
+            chunk = names[index * per_page:(index + 1) * per_page]
+            suffix = f" ({index + 1}/{page_count})" if page_count > 1 else ""
+            pages.append({
+                'title': f"{kind} / {category}{suffix} - {len(chunk)} signs",
+                'items': [(name, images[name]) for name in chunk],
+                'kind': kind,
+                'columns': min(columns, len(chunk)),
+                'output': os.path.join(output_dir, f"{kind}_{category}_{index + 1}.jpg")
+            })
+    return pages
+
+def build_montages(kind='common', columns=DEFAULT_COLUMNS, rows=DEFAULT_ROWS,
+                   output_dir=MONTAGE_DIR, workers=None):
+    """Render every page in a process pool; returns the page paths"""
+    os.makedirs(output_dir, exist_ok=True)
+    pages = plan_pages(kind, columns, rows, output_dir)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render_page, pages))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render catalog-wide preview montages by category")
+    parser.add_argument('--kind', choices=[kind for kind in ASSET_DIRS if kind != 'dictionary'],
+                        default='common', help="Output directory to preview")
+    parser.add_argument('--columns', type=int, default=DEFAULT_COLUMNS)
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS)
+    parser.add_argument('--output-dir', default=MONTAGE_DIR)
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    print("🖼️ Catalog Preview Montages")
+    print("=" * 50)
+    paths = build_montages(args.kind, args.columns, args.rows, args.output_dir, args.workers)
+    if not paths:
+        print(f"❌ No {args.kind} images found")
+        return 1
+    for path in paths:
+        print(f"  ✅ {os.path.relpath(path, PROJECT_ROOT)}")
+    print(f"\n📊 {len(paths)} pages written to {args.output_dir}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,13 +5,60 @@ Creates a comprehensive set of ASL sign images for dictionary search functionali
 """
 
 import os
+import csv
+import json
+import time
+import argparse
+import itertools
+from functools import partial
+from collections.abc import Mapping
+from multiprocessing import Pool
 from PIL import Image, ImageDraw, ImageFont
+from placeholders import dictionary_svg_placeholders
+from search_index import build_search_index, normalize_text
+from voice_index import build_voice_index
+from dictionary_shards import INDEX_NAME, DictionaryShardWriter
+from metadata_writer import MetadataWriter
+from asset_pack import build_pack
+from inline_assets import DEFAULT_INLINE_THRESHOLD, inline_svg
+from sign_catalog import collection_signs
+from sign_records import SignTable
 
-def create_asl_dictionary_images():
-    """
-    Create ASL dictionary images for common words and phrases.
-    """
-    
+# Color scheme based on category
+CATEGORY_COLORS = {
+    'greetings': '#10B981',    # Green
+    'family': '#F59E0B',       # Yellow
+    'food': '#EF4444',         # Red
+    'colors': '#8B5CF6',       # Purple
+    'numbers': '#3B82F6',      # Blue
+    'time': '#06B6D4',         # Cyan
+    'verbs': '#F97316',        # Orange
+    'questions': '#EC4899',    # Pink
+    'pronouns': '#6366F1'      # Indigo
+}
+DEFAULT_CATEGORY_COLOR = '#6B7280'
+
+DIFFICULTY_LEVELS = ['easy', 'medium', 'hard']
+
+# Dictionary SVG layout, shared with the placeholders computed for it
+SVG_SIZE = 150
+BACKGROUND_RADIUS = 70
+BACKGROUND_OPACITY = 0.1
+BACKGROUND_STROKE_WIDTH = 2
+HAND_COLOR = '#FFDBAC'
+# Bounding box (left, top, right, bottom) of the hand shapes, relative to
+# the centre
+HAND_BOX = (-30, -40, 25, 25)
+
+# Difficulty-based styling
+DIFFICULTY_STYLES = {
+    'easy': {'stroke_width': '2', 'opacity': '0.9'},
+    'medium': {'stroke_width': '3', 'opacity': '0.8'},
+    'hard': {'stroke_width': '4', 'opacity': '0.7'}
+}
+
+def get_output_dirs():
+    """Create and return the dictionary image output directories"""
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
     # Define output directories
@@ -25,352 +72,29 @@ def create_asl_dictionary_images():
         os.makedirs(output_dir, exist_ok=True)
         print(f"Created directory: {output_dir}")
     
-    # ASL Dictionary data with categories
-    dictionary_data = {
-        # Basic Greetings & Polite Expressions
-        'hello': {
-            'category': 'greetings',
-            'description': 'Flat hand at forehead, move forward slightly',
-            'difficulty': 'easy',
-            'usage': 'Standard greeting in ASL'
-        },
-        'thank_you': {
-            'category': 'greetings',
-            'description': 'Flat hand touches chin, moves forward',
-            'difficulty': 'easy',
-            'usage': 'Express gratitude'
-        },
-        'please': {
-            'category': 'greetings',
-            'description': 'Flat hand circles on chest',
-            'difficulty': 'easy',
-            'usage': 'Polite request'
-        },
-        'sorry': {
-            'category': 'greetings',
-            'description': 'Fist on chest, circular motion',
-            'difficulty': 'easy',
-            'usage': 'Apologize or express sympathy'
-        },
-        'goodbye': {
-            'category': 'greetings',
-            'description': 'Wave hand or finger wiggle',
-            'difficulty': 'easy',
-            'usage': 'Farewell greeting'
-        },
-        'nice_to_meet_you': {
-            'category': 'greetings',
-            'description': 'Complex phrase: NICE + MEET + YOU',
-            'difficulty': 'medium',
-            'usage': 'First time meeting someone'
-        },
-        
-        # Family & Relationships
-        'mother': {
-            'category': 'family',
-            'description': 'Thumb touches chin',
-            'difficulty': 'easy',
-            'usage': 'Female parent'
-        },
-        'father': {
-            'category': 'family',
-            'description': 'Thumb touches forehead',
-            'difficulty': 'easy',
-            'usage': 'Male parent'
-        },
-        'sister': {
-            'category': 'family',
-            'description': 'L-hand at chin, moves down to meet other L-hand',
-            'difficulty': 'medium',
-            'usage': 'Female sibling'
-        },
-        'brother': {
-            'category': 'family',
-            'description': 'L-hand at forehead, moves down to meet other L-hand',
-            'difficulty': 'medium',
-            'usage': 'Male sibling'
-        },
-        'family': {
-            'category': 'family',
-            'description': 'F-hands form circle',
-            'difficulty': 'medium',
-            'usage': 'Related people group'
-        },
-        'friend': {
-            'category': 'family',
-            'description': 'Index fingers hook together twice',
-            'difficulty': 'medium',
-            'usage': 'Close companion'
-        },
-        
-        # Food & Drink
-        'eat': {
-            'category': 'food',
-            'description': 'Fingertips to mouth repeatedly',
-            'difficulty': 'easy',
-            'usage': 'Consume food'
-        },
-        'drink': {
-            'category': 'food',
-            'description': 'C-hand to mouth, tilt up',
-            'difficulty': 'easy',
-            'usage': 'Consume liquid'
-        },
-        'water': {
-            'category': 'food',
-            'description': 'W-hand taps chin',
-            'difficulty': 'easy',
-            'usage': 'Clear liquid, H2O'
-        },
-        'milk': {
-            'category': 'food',
-            'description': 'Squeeze fist alternately',
-            'difficulty': 'easy',
-            'usage': 'Dairy beverage'
-        },
-        'coffee': {
-            'category': 'food',
-            'description': 'S-hand grinds on top of other S-hand',
-            'difficulty': 'medium',
-            'usage': 'Caffeinated beverage'
-        },
-        'bread': {
-            'category': 'food',
-            'description': 'Knife hand slices other hand',
-            'difficulty': 'medium',
-            'usage': 'Baked staple food'
-        },
-        
-        # Colors
-        'red': {
-            'category': 'colors',
-            'description': 'Index finger brushes lips downward',
-            'difficulty': 'easy',
-            'usage': 'Color of blood, fire'
-        },
-        'blue': {
-            'category': 'colors',
-            'description': 'B-hand shakes slightly',
-            'difficulty': 'easy',
-            'usage': 'Color of sky, ocean'
-        },
-        'green': {
-            'category': 'colors',
-            'description': 'G-hand shakes slightly',
-            'difficulty': 'easy',
-            'usage': 'Color of grass, plants'
-        },
-        'yellow': {
-            'category': 'colors',
-            'description': 'Y-hand shakes slightly',
-            'difficulty': 'easy',
-            'usage': 'Color of sun, banana'
-        },
-        'black': {
-            'category': 'colors',
-            'description': 'Index finger across forehead',
-            'difficulty': 'easy',
-            'usage': 'Absence of color'
-        },
-        'white': {
-            'category': 'colors',
-            'description': 'Five-hand on chest, pull out to closed hand',
-            'difficulty': 'medium',
-            'usage': 'Color of snow, milk'
-        },
-        
-        # Numbers (basic)
-        'one': {
-            'category': 'numbers',
-            'description': 'Index finger extended up',
-            'difficulty': 'easy',
-            'usage': 'Number 1, single item'
-        },
-        'two': {
-            'category': 'numbers',
-            'description': 'Index and middle finger extended',
-            'difficulty': 'easy',
-            'usage': 'Number 2, pair'
-        },
-        'three': {
-            'category': 'numbers',
-            'description': 'Thumb, index, and middle finger extended',
-            'difficulty': 'easy',
-            'usage': 'Number 3, trio'
-        },
-        'five': {
-            'category': 'numbers',
-            'description': 'All five fingers extended',
-            'difficulty': 'easy',
-            'usage': 'Number 5, hand count'
-        },
-        'ten': {
-            'category': 'numbers',
-            'description': 'Thumb up, shake slightly',
-            'difficulty': 'easy',
-            'usage': 'Number 10, decimal base'
-        },
-        
-        # Time & Calendar
-        'today': {
-            'category': 'time',
-            'description': 'NOW + DAY combination',
-            'difficulty': 'medium',
-            'usage': 'Current day'
-        },
-        'tomorrow': {
-            'category': 'time',
-            'description': 'Thumbs-up moves forward from cheek',
-            'difficulty': 'medium',
-            'usage': 'Next day'
-        },
-        'yesterday': {
-            'category': 'time',
-            'description': 'Thumbs-up moves back from cheek',
-            'difficulty': 'medium',
-            'usage': 'Previous day'
-        },
-        'time': {
-            'category': 'time',
-            'description': 'Index finger taps wrist',
-            'difficulty': 'easy',
-            'usage': 'Clock time, duration'
-        },
-        'week': {
-            'category': 'time',
-            'description': 'One-hand slides across other palm',
-            'difficulty': 'medium',
-            'usage': 'Seven day period'
-        },
-        'month': {
-            'category': 'time',
-            'description': 'One-hand slides down other index finger',
-            'difficulty': 'medium',
-            'usage': 'Calendar month'
-        },
-        
-        # Common Verbs & Actions
-        'go': {
-            'category': 'verbs',
-            'description': 'Index fingers point and move forward',
-            'difficulty': 'easy',
-            'usage': 'Move, travel, leave'
-        },
-        'come': {
-            'category': 'verbs',
-            'description': 'Index fingers point and move toward body',
-            'difficulty': 'easy',
-            'usage': 'Move toward speaker'
-        },
-        'see': {
-            'category': 'verbs',
-            'description': 'V-hand from eyes moves forward',
-            'difficulty': 'easy',
-            'usage': 'Visual perception'
-        },
-        'help': {
-            'category': 'verbs',
-            'description': 'Fist on flat palm, lift together',
-            'difficulty': 'medium',
-            'usage': 'Assist, support'
-        },
-        'work': {
-            'category': 'verbs',
-            'description': 'S-hands tap wrists together',
-            'difficulty': 'medium',
-            'usage': 'Employment, labor'
-        },
-        'play': {
-            'category': 'verbs',
-            'description': 'Y-hands shake alternately',
-            'difficulty': 'medium',
-            'usage': 'Recreation, games'
-        },
-        
-        # Questions & Answers
-        'what': {
-            'category': 'questions',
-            'description': 'Index finger shakes side to side',
-            'difficulty': 'easy',
-            'usage': 'Question word for things'
-        },
-        'where': {
-            'category': 'questions',
-            'description': 'Index finger shakes back and forth',
-            'difficulty': 'easy',
-            'usage': 'Question word for location'
-        },
-        'when': {
-            'category': 'questions',
-            'description': 'Index finger circles around other index finger',
-            'difficulty': 'medium',
-            'usage': 'Question word for time'
-        },
-        'who': {
-            'category': 'questions',
-            'description': 'Index finger circles around lips',
-            'difficulty': 'medium',
-            'usage': 'Question word for person'
-        },
-        'why': {
-            'category': 'questions',
-            'description': 'Touch forehead, then Y-hand shakes',
-            'difficulty': 'medium',
-            'usage': 'Question word for reason'
-        },
-        'how': {
-            'category': 'questions',
-            'description': 'Bent hands turn up together',
-            'difficulty': 'medium',
-            'usage': 'Question word for method'
-        },
-        
-        # Personal Pronouns
-        'i': {
-            'category': 'pronouns',
-            'description': 'Index finger points to chest',
-            'difficulty': 'easy',
-            'usage': 'First person singular'
-        },
-        'you': {
-            'category': 'pronouns',
-            'description': 'Index finger points to person',
-            'difficulty': 'easy',
-            'usage': 'Second person'
-        },
-        'he': {
-            'category': 'pronouns',
-            'description': 'Point to male person or side',
-            'difficulty': 'easy',
-            'usage': 'Third person masculine'
-        },
-        'she': {
-            'category': 'pronouns',
-            'description': 'Point to female person or side',
-            'difficulty': 'easy',
-            'usage': 'Third person feminine'
-        },
-        'we': {
-            'category': 'pronouns',
-            'description': 'Index finger arcs from self to others',
-            'difficulty': 'medium',
-            'usage': 'First person plural'
-        },
-        'they': {
-            'category': 'pronouns',
-            'description': 'Point to multiple people or sweep',
-            'difficulty': 'medium',
-            'usage': 'Third person plural'
-        }
-    }
+    return output_dirs
+
+def create_asl_dictionary_images(pretty=False, inline_threshold=None, inline_raw=False):
+    """
+    Create ASL dictionary images for common words and phrases.
+    """
+    
+    output_dirs = get_output_dirs()
+    
+    # ASL Dictionary data with categories, from the shared sign catalog
+    dictionary_data = SignTable.from_records(collection_signs('dictionary'))
     
     processed_count = 0
+    # Rendered markup, kept for inlining so no SVG is rendered twice
+    svg_sources = {} if inline_threshold is not None else None
     
     for word, data in dictionary_data.items():
         print(f"Creating sign for: {word}")
         
         # Create SVG for the word
         svg_content = create_dictionary_sign_svg(word, data)
+        if svg_sources is not None:
+            svg_sources[word] = svg_content
         
         # Save to all output directories
         for output_dir in output_dirs:
@@ -382,7 +106,9 @@ def create_asl_dictionary_images():
         processed_count += 1
     
     # Create dictionary data JSON file
-    create_dictionary_data_file(dictionary_data, output_dirs)
+    create_dictionary_data_file(dictionary_data, output_dirs, pretty=pretty,
+                                inline_threshold=inline_threshold, inline_raw=inline_raw,
+                                svg_sources=svg_sources)
     
     return processed_count, len(dictionary_data)
 
@@ -391,55 +117,35 @@ def create_dictionary_sign_svg(word, data):
     Create an SVG representation for a dictionary word sign.
     """
     
-    # Color scheme based on category
-    category_colors = {
-        'greetings': '#10B981',    # Green
-        'family': '#F59E0B',       # Yellow
-        'food': '#EF4444',         # Red
-        'colors': '#8B5CF6',       # Purple
-        'numbers': '#3B82F6',      # Blue
-        'time': '#06B6D4',         # Cyan
-        'verbs': '#F97316',        # Orange
-        'questions': '#EC4899',    # Pink
-        'pronouns': '#6366F1'      # Indigo
-    }
-    
-    primary_color = category_colors.get(data['category'], '#6B7280')
-    
-    # Difficulty-based styling
-    difficulty_styles = {
-        'easy': {'stroke_width': '2', 'opacity': '0.9'},
-        'medium': {'stroke_width': '3', 'opacity': '0.8'},
-        'hard': {'stroke_width': '4', 'opacity': '0.7'}
-    }
-    
-    style = difficulty_styles.get(data['difficulty'], difficulty_styles['easy'])
+    primary_color = CATEGORY_COLORS.get(data['category'], DEFAULT_CATEGORY_COLOR)
+    style = DIFFICULTY_STYLES.get(data['difficulty'], DIFFICULTY_STYLES['easy'])
+    centre = SVG_SIZE // 2
     
     svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="150" height="150" viewBox="0 0 150 150" xmlns="http://www.w3.org/2000/svg">
+<svg width="{SVG_SIZE}" height="{SVG_SIZE}" viewBox="0 0 {SVG_SIZE} {SVG_SIZE}" xmlns="http://www.w3.org/2000/svg">
   <!-- Background Circle -->
-  <circle cx="75" cy="75" r="70" fill="{primary_color}" fill-opacity="0.1" stroke="{primary_color}" stroke-width="2"/>
+  <circle cx="{centre}" cy="{centre}" r="{BACKGROUND_RADIUS}" fill="{primary_color}" fill-opacity="{BACKGROUND_OPACITY}" stroke="{primary_color}" stroke-width="{BACKGROUND_STROKE_WIDTH}"/>
   
   <!-- Main Hand Illustration -->
-  <g transform="translate(75, 75)" opacity="{style['opacity']}">
+  <g transform="translate({centre}, {centre})" opacity="{style['opacity']}">
     <!-- Base hand shape -->
     <path d="M-25,-30 Q-30,-25 -30,-15 L-30,20 Q-25,25 -20,25 L20,25 Q25,20 25,15 L25,-15 Q25,-25 20,-30 Z" 
-          fill="#FFDBAC" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
+          fill="{HAND_COLOR}" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
     
     <!-- Thumb -->
-    <ellipse cx="-20" cy="0" rx="8" ry="15" fill="#FFDBAC" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
+    <ellipse cx="-20" cy="0" rx="8" ry="15" fill="{HAND_COLOR}" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
     
     <!-- Index finger -->
-    <rect x="-10" y="-35" width="6" height="25" rx="3" fill="#FFDBAC" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
+    <rect x="-10" y="-35" width="6" height="25" rx="3" fill="{HAND_COLOR}" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
     
     <!-- Middle finger -->
-    <rect x="-2" y="-40" width="6" height="30" rx="3" fill="#FFDBAC" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
+    <rect x="-2" y="-40" width="6" height="30" rx="3" fill="{HAND_COLOR}" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
     
     <!-- Ring finger -->
-    <rect x="6" y="-35" width="6" height="25" rx="3" fill="#FFDBAC" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
+    <rect x="6" y="-35" width="6" height="25" rx="3" fill="{HAND_COLOR}" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
     
     <!-- Pinky finger -->
-    <rect x="14" y="-30" width="5" height="20" rx="2.5" fill="#FFDBAC" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
+    <rect x="14" y="-30" width="5" height="20" rx="2.5" fill="{HAND_COLOR}" stroke="#D4A574" stroke-width="{style['stroke_width']}"/>
     
     <!-- Palm details -->
     <path d="M-15,10 Q0,15 15,10" stroke="#D4A574" stroke-width="1" fill="none" opacity="0.6"/>
@@ -466,36 +172,266 @@ def create_dictionary_sign_svg(word, data):
     
     return svg_content
 
-def create_dictionary_data_file(dictionary_data, output_dirs):
+def dictionary_placeholder(color, difficulty):
+    """Placeholder fields for a dictionary SVG in a category colour and difficulty"""
+    style = DIFFICULTY_STYLES.get(difficulty, DIFFICULTY_STYLES['easy'])
+    return dictionary_svg_placeholders(
+        [(color, float(style['opacity']))], SVG_SIZE, BACKGROUND_RADIUS, BACKGROUND_OPACITY,
+        BACKGROUND_STROKE_WIDTH, HAND_BOX, HAND_COLOR
+    )[0]
+
+def create_dictionary_data_file(dictionary_data, output_dirs, pretty=False, index_table=None,
+                                inline_threshold=None, inline_raw=False, svg_sources=None):
     """
     Create a JSON file with all dictionary data for the React component.
+
+    dictionary_data is any iterable of (word, data) records, or a mapping of
+    them; records are streamed into aslDictionaryData.json (compact unless
+    pretty) in every parent directory and into the category shards, one at
+    a time. The search and voice indexes are built from index_table (by
+    default dictionary_data itself when it is a mapping) once all records
+    are written, and go only into their lazy shards. With inline_threshold
+    set, each sign SVG up to that many bytes is embedded as inline_src (data
+    URI) or, with inline_raw, inline_svg (markup); svg_sources maps words to
+    markup already rendered for them (entries are popped as they are used).
+    Returns the number of signs written.
     """
-    import json
-    
-    # Prepare data for JSON export
-    export_data = {
-        'signs': dictionary_data,
-        'categories': list(set(data['category'] for data in dictionary_data.values())),
-        'difficulty_levels': ['easy', 'medium', 'hard'],
-        'total_signs': len(dictionary_data)
-    }
-    
-    json_content = json.dumps(export_data, indent=2)
+    if index_table is None and isinstance(dictionary_data, Mapping):
+        index_table = dictionary_data
+    records = dictionary_data.items() if isinstance(dictionary_data, Mapping) else dictionary_data
+
+    parent_dirs = [os.path.dirname(output_dir) for output_dir in output_dirs]
+    json_paths = [os.path.join(parent_dir, 'aslDictionaryData.json') for parent_dir in parent_dirs]
+    shards = DictionaryShardWriter(parent_dirs)
+
+    # Placeholder (and intrinsic size) so the page can paint before each SVG
+    # loads; it depends only on the category colour and difficulty
+    placeholders = {}
+    categories = {}
+
+    # The shards are finished before aslDictionaryData.json is published, so
+    # a failure while streaming the records or building the indexes leaves
+    # the previous data and shards in place
+    try:
+        with MetadataWriter(json_paths, pretty=pretty) as writer:
+            writer.begin('signs')
+            for word, data in records:
+                style = (CATEGORY_COLORS.get(data['category'], DEFAULT_CATEGORY_COLOR),
+                         data['difficulty'])
+                if style not in placeholders:
+                    placeholders[style] = dictionary_placeholder(*style)
+                record = {**data, **placeholders[style]}
+                if inline_threshold is not None:
+                    svg_content = (svg_sources or {}).pop(word, None)
+                    if svg_content is None:
+                        svg_content = create_dictionary_sign_svg(word, data)
+                    record.update(inline_svg(svg_content, inline_threshold, raw=inline_raw))
+
+                writer.entry(word, record)
+                shards.add(word, record)
+                categories[data['category']] = None
+            total = writer.end()
+
+            writer.field('categories', list(categories))
+            writer.field('difficulty_levels', DIFFICULTY_LEVELS)
+            writer.field('total_signs', total)
+
+            # The indexes are only served as lazy shards, not in aslDictionaryData.json
+            lazy_data = {}
+            if index_table is not None:
+                lazy_data = {
+                    # Precomputed token/prefix/category postings: search becomes a lookup
+                    'search_index': build_search_index(index_table),
+                    # Trigram/phonetic candidates for fuzzy voice transcripts
+                    'voice_index': build_voice_index(index_table)
+                }
+
+            # Sharded form: small index for first paint, categories loaded lazily
+            shard_sizes = shards.close(total, DIFFICULTY_LEVELS, lazy_data)
+    except BaseException:
+        shards.abort()
+        raise
+
+    for json_path in json_paths:
+        print(f"  📄 Dictionary data saved to: {json_path}")
+
+    full_size = os.path.getsize(json_paths[0])
+    print(f"  📉 First-load JSON: {shard_sizes[INDEX_NAME]:,} bytes "
+          f"(index) vs {full_size:,} bytes (aslDictionaryData.json)")
     
-    # Save to both directories
+    return total
+
+def _read_rows(path):
+    """Yield (line_number, row dict or None) from a CSV or JSON Lines file"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    row = None
+                yield line_number, row if isinstance(row, dict) else None
+        else:
+            for line_number, row in enumerate(csv.DictReader(f), 2):
+                yield line_number, row
+
+def read_sign_rows(path):
+    """
+    Stream (word, data) sign definitions from a CSV or JSON Lines file.
+
+    Each row needs a word (or name) and a category; description and usage
+    default to empty and difficulty to 'easy'. Words are normalized to
+    file-safe ids ('Thank You' -> 'thank_you'). Invalid and duplicate rows
+    are skipped with a warning; only the set of seen ids is kept in memory.
+    """
+    seen = set()
+    for line_number, row in _read_rows(path):
+        if row is None:
+            print(f"  ⚠️ Line {line_number}: not a JSON object, skipped")
+            continue
+
+        word = normalize_text(row.get('word') or row.get('name') or '').replace(' ', '_')
+        category = normalize_text(row.get('category') or '').replace(' ', '_')
+        difficulty = (row.get('difficulty') or 'easy').strip().lower()
+        if not word or not category or difficulty not in DIFFICULTY_LEVELS:
+            print(f"  ⚠️ Line {line_number}: missing word/category or bad difficulty, skipped")
+            continue
+        if word in seen:
+            print(f"  ⚠️ Line {line_number}: duplicate sign '{word}', skipped")
+            continue
+        seen.add(word)
+
+        yield word, {
+            'category': category,
+            'description': (row.get('description') or '').strip(),
+            'difficulty': difficulty,
+            'usage': (row.get('usage') or '').strip()
+        }
+
+def _batches(iterable, size):
+    """Split an iterable into lists of at most size items, lazily"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def _write_sign_svg(item, output_dirs, keep_markup=False):
+    """
+    Pool worker: render one sign's SVG and write it to every output dir.
+    Returns (size, markup if keep_markup else None).
+    """
+    word, data = item
+    svg_content = create_dictionary_sign_svg(word, data)
     for output_dir in output_dirs:
-        # Save to parent directory for easier access
-        parent_dir = os.path.dirname(output_dir)
-        json_path = os.path.join(parent_dir, 'aslDictionaryData.json')
-        with open(json_path, 'w', encoding='utf-8') as f:
-            f.write(json_content)
-        print(f"  📄 Dictionary data saved to: {json_path}")
+        with open(os.path.join(output_dir, f"{word}.svg"), 'w', encoding='utf-8') as f:
+            f.write(svg_content)
+    return len(svg_content), svg_content if keep_markup else None
+
+def import_dictionary(source_path, workers=None, chunk_size=64, with_index=False, pretty=False,
+                      inline_threshold=None, inline_raw=False):
+    """
+    Generate the dictionary from a CSV/JSON Lines lexicon of any size.
+
+    Rows are streamed in bounded batches: SVGs are rendered and written by a
+    process pool while aslDictionaryData.json and the category shards are
+    written entry by entry, so memory stays flat regardless of vocabulary
+    size. The search and voice indexes need the whole vocabulary and are
+    only built with with_index=True (from a compact SignTable).
+    Returns a throughput report dict.
+    """
+    output_dirs = get_output_dirs()
+    workers = workers or os.cpu_count() or 1
+    table = SignTable() if with_index else None
+    render = partial(_write_sign_svg, output_dirs=output_dirs,
+                     keep_markup=inline_threshold is not None)
+    # Markup of the sign being yielded, handed over for inlining
+    svg_sources = {}
+    report = {'svg_bytes': 0, 'categories': {}}
+
+    start = time.perf_counter()
+
+    def rendered(pool):
+        done = 0
+        for batch in _batches(read_sign_rows(source_path), workers * chunk_size * 4):
+            for (word, data), (size, markup) in zip(batch, pool.imap(render, batch, chunksize=chunk_size)):
+                report['svg_bytes'] += size
+                if markup is not None:
+                    svg_sources[word] = markup
+                categories = report['categories']
+                categories[data['category']] = categories.get(data['category'], 0) + 1
+                if table is not None:
+                    table.append(word, **data)
+                yield word, data
+            done += len(batch)
+            print(f"  ⏳ {done:,} signs ({done / (time.perf_counter() - start):,.0f} signs/sec)")
+
+    with Pool(workers) as pool:
+        total = create_dictionary_data_file(rendered(pool), output_dirs,
+                                            pretty=pretty, index_table=table,
+                                            inline_threshold=inline_threshold,
+                                            inline_raw=inline_raw, svg_sources=svg_sources)
+    seconds = time.perf_counter() - start
+
+    report.update({
+        'signs': total,
+        'workers': workers,
+        'seconds': seconds,
+        'signs_per_second': total / seconds if seconds else 0.0
+    })
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate ASL dictionary sign images and data")
+    parser.add_argument('--import', dest='import_path',
+                        help="Stream sign definitions from a CSV or JSON Lines lexicon instead of the catalog")
+    parser.add_argument('--workers', type=int, help="SVG rendering processes for --import (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=64, help="Signs per worker task for --import")
+    parser.add_argument('--index', action='store_true',
+                        help="Also build the search/voice indexes for --import (holds the vocabulary in memory)")
+    parser.add_argument('--pretty', action='store_true',
+                        help="Write indented aslDictionaryData.json (for debugging)")
+    parser.add_argument('--pack', action='store_true',
+                        help="Also bundle all generated sign assets into signs.pack")
+    parser.add_argument('--inline', action='store_true',
+                        help="Embed small sign SVGs directly in the dictionary data")
+    parser.add_argument('--inline-threshold', type=int, default=DEFAULT_INLINE_THRESHOLD,
+                        help="Largest SVG (bytes) embedded with --inline")
+    parser.add_argument('--inline-svg', action='store_true',
+                        help="Embed raw SVG markup instead of data URIs")
+    args = parser.parse_args(argv)
+    inline_threshold = args.inline_threshold if args.inline else None
 
-if __name__ == "__main__":
     print("🔍 ASL Dictionary Images Generator")
     print("=" * 60)
+
+    if args.import_path:
+        if not os.path.exists(args.import_path):
+            print(f"❌ Lexicon not found: {args.import_path}")
+            return 1
+
+        report = import_dictionary(args.import_path, workers=args.workers,
+                                   chunk_size=args.chunk_size, with_index=args.index,
+                                   pretty=args.pretty, inline_threshold=inline_threshold,
+                                   inline_raw=args.inline_svg)
+
+        print(f"\n📊 Results:")
+        print(f"✅ Imported {report['signs']:,} signs in {len(report['categories'])} categories")
+        print(f"🖼️ SVG output: {report['svg_bytes'] / 1e6:.1f} MB per directory")
+        print(f"⚡ Throughput: {report['signs_per_second']:,.0f} signs/sec "
+              f"({report['seconds']:.1f}s, {report['workers']} workers)")
+        if args.pack:
+            build_pack()
+        return 0
     
-    processed, total = create_asl_dictionary_images()
+    processed, total = create_asl_dictionary_images(
+        pretty=args.pretty, inline_threshold=inline_threshold, inline_raw=args.inline_svg
+    )
+    if args.pack:
+        build_pack()
     
     print(f"\n📊 Results:")
     print(f"✅ Created {processed} dictionary sign images")
@@ -508,4 +444,8 @@ if __name__ == "__main__":
     print(f"  - Dictionary data: aslDictionaryData.json")
     
     print(f"\n🎉 ASL Dictionary setup complete!")
-    print(f"Ready for searchable dictionary implementation!") 
\ No newline at end of file
+    print(f"Ready for searchable dictionary implementation!")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
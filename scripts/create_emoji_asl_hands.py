@@ -5,10 +5,19 @@ Creates ASL alphabet cards using actual hand sign emojis instead of SVG illustra
 """
 
 import os
+import argparse
+from metadata_writer import MetadataWriter
+from inline_assets import DEFAULT_INLINE_THRESHOLD, inline_svg
 
-def create_emoji_asl_hands(output_dir):
+def create_emoji_asl_hands(output_dir, inline_threshold=None, inline_raw=False):
     """
     Create ASL alphabet cards using hand sign emojis for each letter.
+
+    Also writes aslEmojiAlphabetData.json next to output_dir with each
+    letter's name, description, emoji and image path (relative to the JSON
+    file). With inline_threshold set, cards up to that many bytes are
+    embedded as inline_src (data URI) or, with inline_raw, inline_svg.
+    Returns the metadata path.
     """
     
     # Create output directory if it doesn't exist
@@ -150,10 +159,14 @@ def create_emoji_asl_hands(output_dir):
     
     print("Creating ASL alphabet with hand sign emojis...")
     
-    for letter_key, letter_data in asl_emoji_hands.items():
-        svg_path = os.path.join(output_dir, f"{letter_key}.svg")
+    metadata_path = os.path.join(os.path.dirname(output_dir), 'aslEmojiAlphabetData.json')
+    with MetadataWriter([metadata_path]) as writer:
+        writer.begin('signs')
+    
+        for letter_key, letter_data in asl_emoji_hands.items():
+            svg_path = os.path.join(output_dir, f"{letter_key}.svg")
         
-        svg_content = f'''<svg xmlns="http://www.w3.org/2000/svg" width="150" height="150" viewBox="0 0 150 150">
+            svg_content = f'''<svg xmlns="http://www.w3.org/2000/svg" width="150" height="150" viewBox="0 0 150 150">
     <rect width="150" height="150" fill="#f8fafc" stroke="#e2e8f0" stroke-width="2"/>
     
     <!-- ASL {letter_data['name']} - {letter_data['description']} -->
@@ -162,12 +175,37 @@ def create_emoji_asl_hands(output_dir):
     <text x="75" y="145" text-anchor="middle" font-family="Arial, sans-serif" font-size="14" font-weight="bold" fill="#374151">ASL {letter_data['name']}</text>
 </svg>'''
         
-        with open(svg_path, 'w') as f:
-            f.write(svg_content)
+            with open(svg_path, 'w') as f:
+                f.write(svg_content)
+        
+            print(f"Created emoji ASL hand: {letter_data['name']} ({letter_data['emoji']}) -> {svg_path}")
         
-        print(f"Created emoji ASL hand: {letter_data['name']} ({letter_data['emoji']}) -> {svg_path}")
+            entry = {
+                **letter_data,
+                'image': f"{os.path.basename(output_dir)}/{letter_key}.svg",
+                'width': 150,
+                'height': 150
+            }
+            if inline_threshold is not None:
+                entry.update(inline_svg(svg_content, inline_threshold, raw=inline_raw))
+            writer.entry(letter_key, entry)
+    
+        total = writer.end()
+        writer.field('total_signs', total)
+    print(f"📝 Emoji alphabet data saved to: {metadata_path}")
+    
+    return metadata_path
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create emoji ASL alphabet cards")
+    parser.add_argument('--inline', action='store_true',
+                        help="Embed the cards directly in aslEmojiAlphabetData.json")
+    parser.add_argument('--inline-threshold', type=int, default=DEFAULT_INLINE_THRESHOLD,
+                        help="Largest card (bytes) embedded with --inline")
+    parser.add_argument('--inline-svg', action='store_true',
+                        help="Embed raw SVG markup instead of data URIs")
+    args = parser.parse_args()
+    
     # Default paths
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     output_directory = os.path.join(project_root, "public/images/signs/alphabet")
@@ -175,6 +213,10 @@ if __name__ == "__main__":
     print("🤟 Emoji ASL Hand Generator")
     print("=" * 50)
     
-    create_emoji_asl_hands(output_directory)
+    create_emoji_asl_hands(
+        output_directory,
+        inline_threshold=args.inline_threshold if args.inline else None,
+        inline_raw=args.inline_svg
+    )
     
     print("\n🎉 All 26 emoji ASL hand signs complete!") 
\ No newline at end of file
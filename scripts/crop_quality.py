@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Crop Quality Scanner
+Flags crops that a bad grid mapping has ruined, without anyone having to
+look at cropped_signs_preview.jpg:
+
+- blank     almost no ink (the cell was empty or mostly gutter)
+- clipped   a lot of ink touching the crop edges (the cut went through a hand)
+- gridline  a near-solid straight line close to an edge (a grid or gutter
+            line left in the crop)
+
+Metrics are computed for a whole batch at once on a stacked (n, H, W) array.
+precise_crop_signs and process_common_signs record the flags of suspect
+signs as 'quality_flags' in their metadata; run this script on the outputs
+to fail the build when more than --max-suspect crops are suspect.
+"""
+
+import os
+import json
+import argparse
+import cv2
+import numpy as np
+from sign_catalog import PROJECT_ROOT
+
+# Crop outputs of precise_crop_signs and process_common_signs
+CROP_DIRS = ['processed_signs/manual', 'processed_signs']
+
+# Gray levels below this count as ink on the white background
+INK_THRESHOLD = 200
+BLANK_FOREGROUND = 0.02
+CLIPPED_EDGE_INK = 0.3
+GRIDLINE_FILL = 0.95
+# Grid lines are searched for in this fraction of the crop next to each edge
+GRIDLINE_BAND = 0.15
+
+def load_gray(path):
+    """Grayscale uint8 array of an image, transparency flattened onto white"""
+    image = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise ValueError(f"Cannot read {path}")
+    if image.ndim == 2:
+        return image
+    if image.shape[2] == 4:
+        alpha = image[..., 3:4].astype(np.float32) / 255
+        image = (image[..., :3] * alpha + 255 * (1 - alpha)).astype(np.uint8)
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+def crop_metrics(stack):
+    """
+    Quality metrics of a batch of same-sized grayscale crops ((n, H, W) uint8).
+
+    Returns {'foreground', 'edge_ink', 'gridline'}, each an (n,) array:
+    the ink fraction of the crop, the largest ink fraction along one edge
+    (ignoring edges that are themselves a grid line) and the fill of the most
+    solid row or column near an edge.
+    """
+    ink = stack < INK_THRESHOLD
+    n, height, width = ink.shape
+
+    foreground = ink.mean(axis=(1, 2))
+
+    rows = ink.mean(axis=2)
+    columns = ink.mean(axis=1)
+    band_h = max(1, int(height * GRIDLINE_BAND))
+    band_w = max(1, int(width * GRIDLINE_BAND))
+    gridline = np.max(np.concatenate([
+        rows[:, :band_h], rows[:, -band_h:], columns[:, :band_w], columns[:, -band_w:]
+    ], axis=1), axis=1)
+
+    edges = np.stack([rows[:, 0], rows[:, -1], columns[:, 0], columns[:, -1]], axis=1)
+    edge_ink = np.where(edges >= GRIDLINE_FILL, 0.0, edges).max(axis=1)
+
+    return {'foreground': foreground, 'edge_ink': edge_ink, 'gridline': gridline}
+
+def flags_for(foreground, edge_ink, gridline):
+    """Quality flags for one crop's metrics"""
+    flags = []
+    if foreground < BLANK_FOREGROUND:
+        flags.append('blank')
+    if edge_ink > CLIPPED_EDGE_INK:
+        flags.append('clipped')
+    if gridline >= GRIDLINE_FILL:
+        flags.append('gridline')
+    return flags
+
+def scan_crops(paths):
+    """
+    Scan crop images in batches of equal size.
+
+    Returns {path: {'foreground', 'edge_ink', 'gridline', 'flags'}}; unreadable
+    files are flagged 'unreadable'.
+    """
+    batches = {}
+    results = {}
+    for path in paths:
+        try:
+            gray = load_gray(path)
+        except ValueError:
+            results[path] = {'foreground': 0.0, 'edge_ink': 0.0, 'gridline': 0.0, 'flags': ['unreadable']}
+            continue
+        batches.setdefault(gray.shape, []).append((path, gray))
+
+    for batch in batches.values():
+        metrics = crop_metrics(np.stack([gray for _, gray in batch]))
+        for index, (path, _) in enumerate(batch):
+            values = {name: round(float(metric[index]), 4) for name, metric in metrics.items()}
+            results[path] = {**values, 'flags': flags_for(**values)}
+    return results
+
+def suspect_crops(image_paths):
+    """{sign name: flags} for the suspect crops among image_paths"""
+    return {
+        os.path.splitext(os.path.basename(path))[0]: result['flags']
+        for path, result in scan_crops(image_paths).items() if result['flags']
+    }
+
+def crop_paths(directories=CROP_DIRS):
+    """PNG crops in the given directories (relative to the project root)"""
+    paths = []
+    for directory in directories:
+        full_dir = os.path.join(PROJECT_ROOT, directory)
+        if not os.path.isdir(full_dir):
+            continue
+        with os.scandir(full_dir) as entries:
+            paths.extend(sorted(entry.path for entry in entries
+                                if entry.name.lower().endswith('.png') and entry.is_file()))
+    return paths
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Flag blank, clipped and gridline crops")
+    parser.add_argument('paths', nargs='*', help="Crops to scan (default: every crop output)")
+    parser.add_argument('--max-suspect', type=int, default=0,
+                        help="Fail when more crops than this are suspect")
+    parser.add_argument('--json', help="Write every crop's metrics and flags to this JSON file")
+    args = parser.parse_args(argv)
+
+    print("🔬 Crop Quality Scan")
+    print("=" * 50)
+
+    paths = args.paths or crop_paths()
+    if not paths:
+        print("❌ No crops found. Run the cropping scripts first.")
+        return 1
+
+    results = scan_crops(paths)
+    suspects = {path: result for path, result in results.items() if result['flags']}
+
+    for path, result in suspects.items():
+        print(f"   ⚠️ {os.path.relpath(path, PROJECT_ROOT):<45} {', '.join(result['flags']):<24} "
+              f"ink {result['foreground']:.1%}  edge {result['edge_ink']:.1%}  "
+              f"line {result['gridline']:.1%}")
+
+    counts = {}
+    for result in suspects.values():
+        for flag in result['flags']:
+            counts[flag] = counts.get(flag, 0) + 1
+    print(f"\n📊 Scanned {len(results)} crops: {len(suspects)} suspect"
+          + (f" ({', '.join(f'{count} {flag}' for flag, count in counts.items())})" if counts else ""))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Metrics saved to: {args.json}")
+
+    if len(suspects) > args.max_suspect:
+        print(f"❌ {len(suspects)} suspect crops (allowed: {args.max_suspect})")
+        return 1
+    print("✅ Crop quality within threshold")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Sharded Dictionary Data
+Splits the ASL dictionary export into a small top-level index (enough for
+first paint) plus one compact shard per category and separate search/voice
+index shards that the frontend loads lazily.
+"""
+
+import os
+import json
+import shutil
+import tempfile
+from precompress import write_with_variants, copy_with_variants
+from metadata_writer import MetadataWriter
+
+SHARD_DIR_NAME = 'aslDictionary'
+INDEX_NAME = 'index.json'
+
+# Lazily loaded whole-dictionary indexes: export key -> shard file
+LAZY_SHARDS = (('search_index', 'search.json'), ('voice_index', 'voice.json'))
+
+# Signs buffered across all categories before they are spooled to disk
+SPOOL_ENTRIES = 1024
+
+def compact_json(data):
+    """Serialize to compact UTF-8 JSON bytes (no indentation or spaces)"""
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def shard_filename(category):
+    """File name of a category shard"""
+    return f"{category}.json"
+
+class DictionaryShardWriter:
+    """
+    Stream signs into per-category shards as they are produced.
+
+    Signs are buffered and, every SPOOL_ENTRIES signs, appended to one
+    JSON Lines spool file per category, opening one file at a time, so
+    neither memory nor open file handles grow with the number of categories.
+    close() writes each category shard from its spool into the first shard
+    directory, streams it into its .gz/.br variants and the other
+    directories, then writes the lazy index shards and the top-level index
+    and removes shards of categories that no longer exist. Every file is
+    only moved into place once complete; abort() discards the spool after a
+    failure and leaves the previous shards untouched. The spool lives in the
+    system temporary directory, never under the public shard directories.
+    """
+
+    def __init__(self, parent_dirs):
+        self.shard_dirs = [os.path.join(parent_dir, SHARD_DIR_NAME) for parent_dir in parent_dirs]
+        for shard_dir in self.shard_dirs:
+            os.makedirs(shard_dir, exist_ok=True)
+        self._spool_dir = tempfile.mkdtemp(prefix='asl-dictionary-spool-')
+        self._pending = {}
+        self._pending_count = 0
+        self._signs = {}
+
+    def _paths(self, filename):
+        return [os.path.join(shard_dir, filename) for shard_dir in self.shard_dirs]
+
+    def _spool_path(self, category):
+        return os.path.join(self._spool_dir, f"{category}.jsonl")
+
+    def _flush(self):
+        """Append the buffered signs to their category spool files"""
+        for category, lines in self._pending.items():
+            with open(self._spool_path(category), 'a', encoding='utf-8') as f:
+                f.writelines(lines)
+        self._pending = {}
+        self._pending_count = 0
+
+    def add(self, word, data):
+        """Buffer one sign for its category shard"""
+        category = data['category']
+        self._pending.setdefault(category, []).append(
+            json.dumps([word, data], separators=(',', ':'), ensure_ascii=False) + '\n')
+        self._signs.setdefault(category, []).append(word)
+        self._pending_count += 1
+        if self._pending_count >= SPOOL_ENTRIES:
+            self._flush()
+
+    def _write_shard(self, category):
+        """Write one category shard from its spool; returns its path in the first directory"""
+        path = self._paths(shard_filename(category))[0]
+        with MetadataWriter([path]) as writer:
+            writer.field('category', category)
+            writer.begin('signs')
+            with open(self._spool_path(category), 'r', encoding='utf-8') as f:
+                for line in f:
+                    word, data = json.loads(line)
+                    writer.entry(word, data)
+        return path
+
+    def _remove_spool(self):
+        self._pending = {}
+        self._pending_count = 0
+        shutil.rmtree(self._spool_dir, ignore_errors=True)
+
+    def _remove_stale(self, current):
+        """Delete shard files (and their variants) not among the current filenames"""
+        for shard_dir in self.shard_dirs:
+            with os.scandir(shard_dir) as entries:
+                stale = [entry.path for entry in entries if entry.is_file()
+                         and entry.name.endswith(('.json', '.json.gz', '.json.br'))
+                         and entry.name.rsplit('.json', 1)[0] + '.json' not in current]
+            for path in stale:
+                os.remove(path)
+
+    def abort(self):
+        """Discard the spooled signs without touching the existing shards"""
+        self._remove_spool()
+
+    def close(self, total_signs, difficulty_levels, lazy_data=None):
+        """
+        Finish all shards and write the index.
+
+        lazy_data maps export keys (search_index, voice_index) to their data.
+        Returns {filename: raw_bytes} for reporting.
+        """
+        self._flush()
+        sizes = {}
+        categories = []
+        for category in sorted(self._signs):
+            filename = shard_filename(category)
+            sizes[filename] = copy_with_variants(self._write_shard(category), self._paths(filename))
+            categories.append({
+                'name': category,
+                'count': len(self._signs[category]),
+                'shard': filename,
+                'signs': self._signs[category]
+            })
+        self._remove_spool()
+
+        lazy = {}
+        for key, filename in LAZY_SHARDS:
+            if lazy_data and key in lazy_data:
+                payload = compact_json(lazy_data[key])
+                write_with_variants(self._paths(filename), payload)
+                sizes[filename] = len(payload)
+                lazy[key] = filename
+
+        payload = compact_json({
+            'total_signs': total_signs,
+            'difficulty_levels': difficulty_levels,
+            'categories': categories,
+            'lazy': lazy
+        })
+        write_with_variants(self._paths(INDEX_NAME), payload)
+        sizes[INDEX_NAME] = len(payload)
+        self._remove_stale(sizes)
+
+        for shard_dir in self.shard_dirs:
+            print(f"  🧩 {len(sizes)} dictionary shards saved to: {shard_dir}")
+        return sizes
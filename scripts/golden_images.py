@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Golden-Image Regression Check
+Compares the current crop outputs (processed_signs/manual/*.png from
+precise_crop_signs) with a stored baseline set, so a change to padding,
+resampling or grid mappings shows exactly which signs changed and by how much.
+
+Every pair is compared in a process pool with vectorised NumPy metrics:
+mean and max absolute difference, the fraction of changed pixels and a
+Gaussian-window SSIM on luminance. Signs are ranked by how much they
+changed, and the most-changed ones are drawn into a diff montage
+(baseline | current | amplified difference).
+
+Usage:
+    python scripts/golden_images.py update   # store the current outputs as the baseline
+    python scripts/golden_images.py check    # compare the current outputs with it
+"""
+
+import os
+import json
+import shutil
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import cv2
+import numpy as np
+from PIL import Image
+from sign_catalog import PROJECT_ROOT
+
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'processed_signs', 'manual')
+BASELINE_DIR = os.path.join(PROJECT_ROOT, 'processed_signs', 'golden')
+MONTAGE_PATH = os.path.join(PROJECT_ROOT, 'processed_signs', 'montages', 'golden_diff.png')
+
+# A channel difference above this counts the pixel as changed
+PIXEL_THRESHOLD = 8
+# A sign counts as changed below this SSIM or above this changed-pixel fraction
+SSIM_THRESHOLD = 0.98
+CHANGED_FRACTION_THRESHOLD = 0.005
+
+TILE_SIZE = 150
+LABEL_HEIGHT = 24
+# Differences are scaled up so small shifts are visible in the montage
+DIFF_GAIN = 4
+
+def load_rgb(path):
+    """Image at path as an RGB uint8 array, with any transparency flattened onto white"""
+    with Image.open(path) as image:
+        image = image.convert('RGBA')
+        background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+        return np.asarray(Image.alpha_composite(background, image).convert('RGB'))
+
+def ssim(a, b):
+    """Mean structural similarity of two float32 grayscale images (11x11 Gaussian window)"""
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+
+    def blur(x):
+        return cv2.GaussianBlur(x, (11, 11), 1.5)
+
+    mu_a, mu_b = blur(a), blur(b)
+    var_a = blur(a * a) - mu_a * mu_a
+    var_b = blur(b * b) - mu_b * mu_b
+    covariance = blur(a * b) - mu_a * mu_b
+    ssim_map = ((2 * mu_a * mu_b + c1) * (2 * covariance + c2)) / (
+        (mu_a * mu_a + mu_b * mu_b + c1) * (var_a + var_b + c2))
+    return float(ssim_map.mean())
+
+def image_difference(baseline, current):
+    """
+    Per-pixel and perceptual difference of two RGB arrays (current is
+    resized to the baseline's size when they differ).
+
+    Returns ({mean_diff, max_diff, changed_fraction, ssim}, absolute diff array).
+    """
+    if current.shape != baseline.shape:
+        current = cv2.resize(current, (baseline.shape[1], baseline.shape[0]),
+                             interpolation=cv2.INTER_AREA)
+    diff = np.abs(baseline.astype(np.int16) - current.astype(np.int16)).astype(np.uint8)
+    gray_baseline = cv2.cvtColor(baseline, cv2.COLOR_RGB2GRAY).astype(np.float32)
+    gray_current = cv2.cvtColor(current, cv2.COLOR_RGB2GRAY).astype(np.float32)
+    metrics = {
+        'mean_diff': float(diff.mean()),
+        'max_diff': int(diff.max()),
+        'changed_fraction': float((diff.max(axis=2) > PIXEL_THRESHOLD).mean()),
+        'ssim': ssim(gray_baseline, gray_current)
+    }
+    return metrics, diff
+
+def compare_sign(pair):
+    """Compare one (name, baseline_path, current_path) pair; returns the result dict"""
+    name, baseline_path, current_path = pair
+    result = {'name': name, 'error': None, 'size_changed': False}
+    try:
+        baseline, current = load_rgb(baseline_path), load_rgb(current_path)
+        result['size_changed'] = baseline.shape != current.shape
+        metrics, _ = image_difference(baseline, current)
+        result.update(metrics)
+        result['changed'] = (result['size_changed'] or metrics['ssim'] < SSIM_THRESHOLD
+                             or metrics['changed_fraction'] > CHANGED_FRACTION_THRESHOLD)
+    except (OSError, ValueError) as e:
+        result['error'] = str(e)
+        result['changed'] = True
+    return result
+
+def _pngs(directory):
+    if not os.path.isdir(directory):
+        return {}
+    with os.scandir(directory) as entries:
+        return {os.path.splitext(entry.name)[0]: entry.path for entry in entries
+                if entry.name.lower().endswith('.png') and entry.is_file()}
+
+def update_baseline(output_dir=OUTPUT_DIR, baseline_dir=BASELINE_DIR):
+    """Replace the baseline with the current outputs; returns the number stored"""
+    outputs = _pngs(output_dir)
+    if os.path.isdir(baseline_dir):
+        shutil.rmtree(baseline_dir)
+    os.makedirs(baseline_dir)
+    for path in outputs.values():
+        shutil.copy2(path, baseline_dir)
+    return len(outputs)
+
+def check_against_baseline(output_dir=OUTPUT_DIR, baseline_dir=BASELINE_DIR, workers=None):
+    """
+    Compare every output that has a baseline. Returns (results ranked from
+    most to least changed, missing names, new names).
+    """
+    baseline, current = _pngs(baseline_dir), _pngs(output_dir)
+    pairs = [(name, baseline[name], current[name]) for name in sorted(baseline.keys() & current.keys())]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(compare_sign, pairs, chunksize=16))
+
+    results.sort(key=lambda result: (result['error'] is None,
+                                     result.get('ssim', 0.0),
+                                     -result.get('mean_diff', 0.0)))
+    return results, sorted(baseline.keys() - current.keys()), sorted(current.keys() - baseline.keys())
+
+def _tile(image):
+    return cv2.resize(image, (TILE_SIZE, TILE_SIZE), interpolation=cv2.INTER_AREA)
+
+def create_diff_montage(results, output_dir=OUTPUT_DIR, baseline_dir=BASELINE_DIR,
+                        montage_path=MONTAGE_PATH):
+    """
+    Draw baseline | current | amplified diff rows for the given results into
+    one image (BGR canvas preallocated for all rows). Returns the path.
+    """
+    row_height = TILE_SIZE + LABEL_HEIGHT
+    canvas = np.full((row_height * len(results), TILE_SIZE * 3, 3), 255, dtype=np.uint8)
+    for row, result in enumerate(results):
+        baseline = load_rgb(os.path.join(baseline_dir, f"{result['name']}.png"))
+        current = load_rgb(os.path.join(output_dir, f"{result['name']}.png"))
+        _, diff = image_difference(baseline, current)
+        heat = cv2.applyColorMap(
+            cv2.convertScaleAbs(diff.max(axis=2), alpha=DIFF_GAIN), cv2.COLORMAP_INFERNO)
+
+        y = row * row_height
+        canvas[y:y + TILE_SIZE, 0:TILE_SIZE] = cv2.cvtColor(_tile(baseline), cv2.COLOR_RGB2BGR)
+        canvas[y:y + TILE_SIZE, TILE_SIZE:2 * TILE_SIZE] = cv2.cvtColor(_tile(current), cv2.COLOR_RGB2BGR)
+        canvas[y:y + TILE_SIZE, 2 * TILE_SIZE:] = _tile(heat)
+        label = f"{result['name']}  SSIM {result['ssim']:.3f}  changed {result['changed_fraction']:.1%}"
+        cv2.putText(canvas, label, (6, y + TILE_SIZE + 17), cv2.FONT_HERSHEY_SIMPLEX,
+                    0.45, (0, 0, 0), 1, cv2.LINE_AA)
+
+    os.makedirs(os.path.dirname(montage_path), exist_ok=True)
+    cv2.imwrite(montage_path, canvas)
+    return montage_path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Golden-image regression check for crop outputs")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('update', help="Store the current outputs as the baseline")
+    check_parser = subparsers.add_parser('check', help="Compare the current outputs with the baseline")
+    check_parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    check_parser.add_argument('--top', type=int, default=12, help="Most-changed signs to list and draw")
+    check_parser.add_argument('--montage', default=MONTAGE_PATH, help="Diff montage output path")
+    check_parser.add_argument('--json', help="Write every result to this JSON file")
+    args = parser.parse_args(argv)
+
+    print("🥇 Golden-Image Regression Check")
+    print("=" * 50)
+
+    if args.command == 'update':
+        count = update_baseline()
+        print(f"✅ Stored {count} outputs as the baseline in {BASELINE_DIR}")
+        return 0 if count else 1
+
+    if not os.path.isdir(BASELINE_DIR):
+        print(f"❌ No baseline in {BASELINE_DIR}. Run 'golden_images.py update' first.")
+        return 1
+
+    results, missing, new = check_against_baseline(workers=args.workers)
+    changed = [result for result in results if result['changed']]
+    print(f"📊 Compared {len(results)} signs: {len(changed)} changed, "
+          f"{len(results) - len(changed)} unchanged")
+    if missing:
+        print(f"❌ Missing from the outputs: {', '.join(missing)}")
+    if new:
+        print(f"🆕 Not in the baseline: {', '.join(new)}")
+
+    for result in results[:args.top]:
+        if result['error']:
+            print(f"   ❌ {result['name']}: {result['error']}")
+            continue
+        marker = '🔺' if result['changed'] else '  '
+        print(f"   {marker} {result['name']:<20} SSIM {result['ssim']:.4f}  "
+              f"mean diff {result['mean_diff']:5.2f}  max {result['max_diff']:3d}  "
+              f"changed {result['changed_fraction']:6.2%}"
+              f"{'  (size changed)' if result['size_changed'] else ''}")
+
+    drawable = [result for result in changed[:args.top] if not result['error']]
+    if drawable:
+        print(f"\n🖼️ Diff montage saved: {create_diff_montage(drawable, montage_path=args.montage)}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'results': results, 'missing': missing, 'new': new}, f, indent=2)
+
+    return 1 if changed or missing else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
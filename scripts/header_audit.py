@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Cache and Compression Header Audit
+Checks the caching and compression headers the server sends for every asset
+in the precache manifest:
+
+- Cache-Control is present; fingerprinted assets (a content hash in the
+  file name or a revisioned path) are cached for at least a day, and every
+  other URL, including sign images regenerated under the same name, is not
+  cached for longer than a few minutes without revalidation
+- ETag or Last-Modified is present and a conditional request returns 304
+- compressible assets (SVG, JSON) are served with a Content-Encoding and
+  Vary: Accept-Encoding
+- the served content matches the manifest revision (no stale deploy)
+
+--local serves the web root with a reference handler applying these rules
+(precompressed .br/.gz siblings, content ETags, Cache-Control per type), the
+header policy the static host is expected to match.
+"""
+
+import os
+import re
+import gzip
+import json
+import sys
+import hashlib
+import argparse
+import functools
+import mimetypes
+from io import BytesIO
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+import requests
+from precache_manifest import MANIFEST_NAME, build_manifest, file_revision
+from precompress import is_compressible
+from asset_checks import (DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT, LocalStaticServer, QuietHandler,
+                          local_web_root, make_session)
+
+try:
+    import brotli  # noqa: F401 - lets requests decode br responses
+    ACCEPT_ENCODING = 'br, gzip'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip'
+
+# A content hash in the file name (hello.3f9a2b1c.png, hello-3f9a2b1c.png),
+# a revisioned directory (/v3/, /rev-3f9a2b1c/) or a revision query (?v=3)
+_FINGERPRINT = re.compile(r'[.-][0-9a-f]{8,}\.\w+$|/(?:v|rev-?)[0-9a-f]+/', re.IGNORECASE)
+_REVISION_QUERY = re.compile(r'[?&](?:v|rev|revision)=', re.IGNORECASE)
+
+# Responses smaller than this gain nothing from compression
+MIN_COMPRESS_BYTES = 1024
+
+MIN_IMMUTABLE_MAX_AGE = 24 * 60 * 60
+MAX_MUTABLE_MAX_AGE = 5 * 60
+
+# Cache-Control the reference handler sends
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+MUTABLE_CACHE_CONTROL = 'public, max-age=0, must-revalidate'
+
+def is_immutable(url):
+    """
+    True only for fingerprinted URLs, whose content can never change under
+    the same URL. Plain names such as /images/signs/common/hello.png are
+    rewritten in place when regenerated, so they must be revalidated.
+    """
+    path, _, query = url.partition('?')
+    return bool(_FINGERPRINT.search(path) or _REVISION_QUERY.search('?' + query))
+
+def parse_cache_control(value):
+    """'public, max-age=60' -> {'public': None, 'max-age': '60'}"""
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+def _max_age(directives):
+    try:
+        return int(directives.get('s-maxage') or directives.get('max-age') or 0)
+    except ValueError:
+        return 0
+
+def cache_issues(url, cache_control):
+    """Problems with an asset's Cache-Control value"""
+    if not cache_control:
+        return ["no Cache-Control"]
+    directives = parse_cache_control(cache_control)
+    max_age = _max_age(directives)
+    if is_immutable(url):
+        if 'no-store' in directives or 'no-cache' in directives or max_age < MIN_IMMUTABLE_MAX_AGE:
+            return [f"short-lived caching on immutable file ({cache_control})"]
+    elif max_age > MAX_MUTABLE_MAX_AGE and 'no-cache' not in directives:
+        return [f"long-lived caching on an unfingerprinted URL ({cache_control})"]
+    return []
+
+def audit_asset(session, base_url, entry, timeout=DEFAULT_TIMEOUT):
+    """
+    Audit the headers of one manifest entry ({url, revision, size}).
+
+    Returns {url, status, cache_control, etag, last_modified,
+    content_encoding, vary, conditional_status, issues}.
+    """
+    url = entry['url']
+    result = {'url': url, 'status': None, 'cache_control': None, 'etag': None,
+              'last_modified': None, 'content_encoding': None, 'vary': None,
+              'conditional_status': None, 'issues': []}
+    issues = result['issues']
+    try:
+        response = session.get(base_url.rstrip('/') + url, timeout=timeout,
+                               headers={'Accept-Encoding': ACCEPT_ENCODING})
+        result['status'] = response.status_code
+        if response.status_code != 200:
+            issues.append(f"HTTP {response.status_code}")
+            return result
+
+        headers = response.headers
+        for key, header in (('cache_control', 'Cache-Control'), ('etag', 'ETag'),
+                            ('last_modified', 'Last-Modified'),
+                            ('content_encoding', 'Content-Encoding'), ('vary', 'Vary')):
+            result[key] = headers.get(header)
+
+        issues.extend(cache_issues(url, result['cache_control']))
+
+        if is_compressible(url):
+            if not result['content_encoding'] and entry['size'] >= MIN_COMPRESS_BYTES:
+                issues.append(f"uncompressed {os.path.splitext(url)[1]} ({entry['size']:,} bytes)")
+            vary = [value.strip().lower() for value in (result['vary'] or '').split(',')]
+            if 'accept-encoding' not in vary:
+                issues.append("Vary lacks Accept-Encoding")
+
+        if hashlib.sha256(response.content).hexdigest()[:16] != entry['revision']:
+            issues.append("content differs from the manifest revision (stale deploy?)")
+
+        if result['etag']:
+            conditional = {'If-None-Match': result['etag']}
+        elif result['last_modified']:
+            conditional = {'If-Modified-Since': result['last_modified']}
+        else:
+            issues.append("no ETag or Last-Modified validator")
+            return result
+        conditional['Accept-Encoding'] = ACCEPT_ENCODING
+        revalidation = session.get(base_url.rstrip('/') + url, timeout=timeout, headers=conditional)
+        result['conditional_status'] = revalidation.status_code
+        if revalidation.status_code != 304:
+            issues.append(f"conditional request returned {revalidation.status_code}, not 304")
+    except requests.exceptions.RequestException as e:
+        # By type rather than message (which includes the URL) so failures group
+        issues.append(f"request failed: {type(e).__name__}")
+    return result
+
+def probe_server(base_url, timeout=DEFAULT_TIMEOUT):
+    """None when base_url answers at all (any status), else the error"""
+    try:
+        requests.get(base_url, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+def audit_assets(base_url, entries, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT):
+    """Audit many manifest entries concurrently over one pooled session"""
+    with make_session(concurrency) as session, ThreadPoolExecutor(concurrency) as pool:
+        audit = functools.partial(audit_asset, session, base_url, timeout=timeout)
+        return list(pool.map(audit, entries))
+
+def load_manifest(web_root, manifest_path=None):
+    """
+    The precache manifest written for web_root, or (when there is none) one
+    built in memory covering every page asset.
+    """
+    manifest_path = manifest_path or os.path.join(web_root, MANIFEST_NAME)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return build_manifest(web_root, budget=sys.maxsize)
+
+@functools.lru_cache(maxsize=4096)
+def _cached_revision(path, mtime_ns, size):
+    return file_revision(path)
+
+class CachingHandler(QuietHandler):
+    """
+    Static handler sending the headers the audit expects: long-lived
+    Cache-Control only for fingerprinted URLs (revalidation otherwise), a
+    content ETag per encoding, Vary: Accept-Encoding, and precompressed
+    .br/.gz siblings (or on-the-fly gzip) for compressible types.
+    """
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            return super().send_head()
+
+        stat = os.stat(path)
+        compressible = is_compressible(path)
+        accepted = {value.split(';')[0].strip()
+                    for value in self.headers.get('Accept-Encoding', '').split(',')}
+
+        encoding, body = None, None
+        if compressible:
+            for name, suffix in (('br', '.br'), ('gzip', '.gz')):
+                if name in accepted and os.path.isfile(path + suffix):
+                    encoding, body = name, open(path + suffix, 'rb')
+                    break
+            else:
+                if 'gzip' in accepted and stat.st_size >= MIN_COMPRESS_BYTES:
+                    with open(path, 'rb') as f:
+                        encoding = 'gzip'
+                        body = BytesIO(gzip.compress(f.read(), mtime=0))
+
+        revision = _cached_revision(path, stat.st_mtime_ns, stat.st_size)
+        etag = f'"{revision}-{encoding}"' if encoding else f'"{revision}"'
+        headers = {
+            'Cache-Control': IMMUTABLE_CACHE_CONTROL if is_immutable(self.path) else MUTABLE_CACHE_CONTROL,
+            'ETag': etag,
+            'Last-Modified': formatdate(stat.st_mtime, usegmt=True)
+        }
+        if compressible:
+            headers['Vary'] = 'Accept-Encoding'
+
+        if etag in [value.strip() for value in self.headers.get('If-None-Match', '').split(',')]:
+            if body is not None:
+                body.close()
+            self.send_response(304)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return None
+
+        if body is None:
+            body = open(path, 'rb')
+        body.seek(0, os.SEEK_END)
+        length = body.tell()
+        body.seek(0)
+
+        self.send_response(200)
+        self.send_header('Content-Type', mimetypes.guess_type(path)[0] or 'application/octet-stream')
+        self.send_header('Content-Length', str(length))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        return body
+
+class CachingStaticServer(LocalStaticServer):
+    handler_class = CachingHandler
+
+def print_audit_report(results, verbose=False):
+    """Print the audit findings; returns the number of assets with issues"""
+    failing = [result for result in results if result['issues']]
+    for result in results if verbose else failing:
+        if result['issues']:
+            print(f"❌ {result['url']}")
+            for issue in result['issues']:
+                print(f"     - {issue}")
+        else:
+            print(f"✅ {result['url']}")
+
+    kinds = Counter(issue.split(' (')[0] for result in failing for issue in result['issues'])
+    print(f"\n📊 Results:")
+    print(f"✅ Clean: {len(results) - len(failing)}/{len(results)} assets")
+    print(f"❌ With issues: {len(failing)}")
+    for kind, count in kinds.most_common():
+        print(f"  {count:>5}  {kind}")
+    return len(failing)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit cache and compression headers of served sign assets")
+    parser.add_argument('--base-url', default="http://localhost:3000", help="Server to audit")
+    parser.add_argument('--local', action='store_true',
+                        help="Audit the web root served by the reference caching handler")
+    parser.add_argument('--manifest', help=f"Manifest to audit against (default: the web root's {MANIFEST_NAME})")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help="Concurrent requests")
+    parser.add_argument('--verbose', action='store_true', help="List clean assets too")
+    args = parser.parse_args(argv)
+
+    print("🧾 Cache and Compression Header Audit")
+    print("=" * 50)
+
+    web_root = local_web_root()
+    entries = load_manifest(web_root, args.manifest)['entries']
+    if not entries:
+        print(f"❌ No manifest entries for {web_root}. Generate the sign assets first.")
+        return 1
+
+    if args.local:
+        with CachingStaticServer(web_root) as server:
+            print(f"🌐 Auditing {len(entries)} assets at {server.base_url} (reference handler)\n")
+            results = audit_assets(server.base_url, entries, args.concurrency)
+    else:
+        error = probe_server(args.base_url)
+        if error:
+            print(f"❌ Cannot reach {args.base_url} ({error}). Is the server running?")
+            return 1
+        print(f"🌐 Auditing {len(entries)} assets at {args.base_url}\n")
+        results = audit_assets(args.base_url, entries, args.concurrency)
+
+    return 1 if print_audit_report(results, args.verbose) else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Inline Small Assets
+Embeds assets under a byte threshold directly in the generated metadata, so
+pages that show many small signs render them without one request per image.
+Larger assets are left as files.
+
+Inlined SVGs use a percent-encoded data URI (smaller than base64 for text)
+or, optionally, the raw SVG markup; raster images use a base64 data URI.
+"""
+
+import os
+import re
+import base64
+import mimetypes
+from urllib.parse import quote
+
+DEFAULT_INLINE_THRESHOLD = 4096
+
+# Characters left unescaped in SVG data URIs ('#' must always be escaped)
+_SVG_SAFE = " =:/;,.-_'()!*~@$+?"
+
+# Whitespace runs with a line break between two tags (markup indentation)
+_TAG_GAP = re.compile(r'>[ \t]*\r?\n\s*<')
+# name="value" attributes whose value contains no quotes of either kind
+_DOUBLE_QUOTED_ATTRIBUTE = re.compile(r'(\s[\w:.-]+=)"([^"\'<]*)"')
+
+def svg_data_uri(svg_content):
+    """
+    Percent-encoded data URI for SVG markup.
+
+    Indentation between tags is collapsed to one space (what SVG renders it
+    as anyway) unless the markup uses xml:space, and attribute values
+    delimited by double quotes switch to single quotes so they don't need
+    escaping. Text content is left as it is.
+    """
+    text = svg_content
+    if 'xml:space' not in text:
+        text = _TAG_GAP.sub('> <', text.strip())
+    text = _DOUBLE_QUOTED_ATTRIBUTE.sub(r"\1'\2'", text)
+    return 'data:image/svg+xml,' + quote(text, safe=_SVG_SAFE)
+
+def data_uri(data, mime_type):
+    """Base64 data URI for binary content"""
+    return f"data:{mime_type};base64," + base64.b64encode(data).decode('ascii')
+
+def inline_svg(svg_content, threshold=DEFAULT_INLINE_THRESHOLD, raw=False):
+    """
+    Metadata fields inlining an SVG under threshold bytes (UTF-8), else {}.
+
+    Returns {'inline_src': data URI} or, with raw=True, {'inline_svg': markup}.
+    """
+    if len(svg_content.encode('utf-8')) > threshold:
+        return {}
+    if raw:
+        return {'inline_svg': svg_content}
+    return {'inline_src': svg_data_uri(svg_content)}
+
+def inline_file(path, threshold=DEFAULT_INLINE_THRESHOLD, raw_svg=False):
+    """
+    Metadata fields inlining the file at path if it is under threshold bytes.
+
+    SVG files go through inline_svg; anything else becomes a base64
+    {'inline_src': data URI}. Missing or larger files return {}.
+    """
+    try:
+        if os.path.getsize(path) > threshold:
+            return {}
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return {}
+
+    if path.lower().endswith('.svg'):
+        return inline_svg(data.decode('utf-8'), threshold, raw=raw_svg)
+    mime_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    return {'inline_src': data_uri(data, mime_type)}
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Static Asset Load Test
+Replays the asset sets of the learning pages (Alphabet, CommonSigns,
+Dictionary, FlashCards) at N concurrent virtual users against the frontend or
+a local static server, and reports throughput, p50/p95/p99 latency and bytes
+transferred, overall and per page.
+
+Results can be saved as JSON and compared with a previous run, to judge
+packing, format and caching changes to the asset layout.
+"""
+
+import os
+import json
+import time
+import argparse
+import platform
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from page_assets import PAGES, page_assets
+from asset_checks import LocalStaticServer, check_asset, local_web_root, make_session, percentile
+
+DEFAULT_USERS = 8
+DEFAULT_ITERATIONS = 5
+DEFAULT_PAGES = ('alphabet', 'common_signs', 'dictionary')
+
+# Browsers open about six connections per host
+CONNECTIONS_PER_USER = 6
+
+# Metrics compared between runs, and whether higher is better
+COMPARED_METRICS = {
+    'requests_per_sec': True,
+    'megabytes_per_sec': True,
+    'p50_ms': False,
+    'p95_ms': False,
+    'p99_ms': False,
+    'errors': False
+}
+# A metric this many percent worse than the previous run is a regression
+REGRESSION_PERCENT = 5
+
+def summarize(results, elapsed):
+    """Throughput, latency percentiles and byte totals of a list of check results"""
+    latencies = [result['latency_ms'] for result in results if result['latency_ms'] is not None]
+    total_bytes = sum(result['bytes'] for result in results)
+    return {
+        'requests': len(results),
+        'errors': sum(not result['ok'] for result in results),
+        'bytes': total_bytes,
+        'requests_per_sec': len(results) / elapsed if elapsed else 0.0,
+        'megabytes_per_sec': total_bytes / elapsed / 1e6 if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50),
+        'p95_ms': percentile(latencies, 0.95),
+        'p99_ms': percentile(latencies, 0.99),
+        'max_ms': max(latencies) if latencies else None
+    }
+
+def virtual_user(base_url, page_urls, iterations, user_index):
+    """
+    One virtual user: visits every page in turn, iterations times, loading
+    each page's assets with up to CONNECTIONS_PER_USER parallel GETs over its
+    own keep-alive session. Pages are started at an offset per user so users
+    don't all hit the same page at once.
+
+    Returns [(page, result)].
+    """
+    pages = list(page_urls)
+    samples = []
+    with make_session(CONNECTIONS_PER_USER) as session, \
+            ThreadPoolExecutor(CONNECTIONS_PER_USER) as pool:
+        for iteration in range(iterations):
+            page = pages[(user_index + iteration) % len(pages)]
+            results = pool.map(
+                lambda url: check_asset(session, base_url, url, method='GET',
+                                        content_types=('image', 'svg', 'json')),
+                page_urls[page]
+            )
+            samples.extend((page, result) for result in results)
+    return samples
+
+def run_load_test(base_url, page_urls, users=DEFAULT_USERS, iterations=DEFAULT_ITERATIONS):
+    """
+    Run `users` virtual users concurrently, each making `iterations` page
+    visits. Returns the report dict (overall and per-page summaries).
+    """
+    start_barrier = threading.Barrier(users + 1)
+
+    def user(user_index):
+        start_barrier.wait()
+        return virtual_user(base_url, page_urls, iterations, user_index)
+
+    with ThreadPoolExecutor(users) as pool:
+        futures = [pool.submit(user, index) for index in range(users)]
+        start_barrier.wait()
+        start = time.perf_counter()
+        samples = [sample for future in futures for sample in future.result()]
+        elapsed = time.perf_counter() - start
+
+    by_page = {page: [] for page in page_urls}
+    for page, result in samples:
+        by_page[page].append(result)
+
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'host': platform.node(),
+        'base_url': base_url,
+        'users': users,
+        'iterations': iterations,
+        'elapsed_sec': elapsed,
+        'total': summarize([result for _, result in samples], elapsed),
+        'pages': {
+            page: {'assets': len(page_urls[page]), **summarize(results, elapsed)}
+            for page, results in by_page.items()
+        }
+    }
+
+def _format_ms(value):
+    return f"{value:7.1f} ms" if value is not None else "     -- ms"
+
+def print_report(report):
+    """Print the overall and per-page summaries of a load test report"""
+    total = report['total']
+    print(f"\n📊 {report['users']} users x {report['iterations']} page visits "
+          f"in {report['elapsed_sec']:.2f}s")
+    print(f"  🚀 {total['requests']:,} requests, {total['requests_per_sec']:,.0f} req/s, "
+          f"{total['bytes'] / 1e6:,.1f} MB ({total['megabytes_per_sec']:,.1f} MB/s)")
+    print(f"  ⏱️ p50 {_format_ms(total['p50_ms'])}  p95 {_format_ms(total['p95_ms'])}  "
+          f"p99 {_format_ms(total['p99_ms'])}  max {_format_ms(total['max_ms'])}")
+    if total['errors']:
+        print(f"  ❌ {total['errors']} failed requests")
+
+    print(f"\n  {'page':<14}{'assets':>7}{'requests':>10}{'MB':>9}{'p50':>12}{'p95':>12}{'p99':>12}")
+    for page, summary in report['pages'].items():
+        print(f"  {page:<14}{summary['assets']:>7}{summary['requests']:>10,}"
+              f"{summary['bytes'] / 1e6:>9.1f}{_format_ms(summary['p50_ms']):>12}"
+              f"{_format_ms(summary['p95_ms']):>12}{_format_ms(summary['p99_ms']):>12}")
+
+def compare_reports(previous, current):
+    """
+    Print the change of each compared metric from a previous report.
+
+    Returns the list of metrics that got worse by REGRESSION_PERCENT or
+    more; any worsening from a zero baseline (e.g. errors 0 -> 3) counts.
+    """
+    print(f"\n🔁 Compared with {previous.get('created', 'previous run')}:")
+    regressions = []
+    for metric, higher_is_better in COMPARED_METRICS.items():
+        before = previous['total'].get(metric)
+        after = current['total'].get(metric)
+        if before is None or after is None:
+            continue
+        worse = after < before if higher_is_better else after > before
+        if before:
+            change = (after - before) / before * 100
+            regressed = worse and abs(change) >= REGRESSION_PERCENT
+            change_text = f"{change:+.1f}%"
+        else:
+            regressed = worse
+            change_text = "from zero" if worse else "+0.0%"
+        marker = '⚠️' if regressed else '  '
+        print(f"  {marker} {metric:<18}{before:>12,.1f} -> {after:>12,.1f}  ({change_text})")
+        if marker != '  ':
+            regressions.append(metric)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the static sign assets")
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS, help="Concurrent virtual users")
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS,
+                        help="Page visits per user")
+    parser.add_argument('--pages', nargs='+', choices=sorted(PAGES), default=list(DEFAULT_PAGES),
+                        help="Pages whose asset sets are replayed")
+    parser.add_argument('--base-url',
+                        help="Server to test (default: a local static server on the web root)")
+    parser.add_argument('--save', help="Write the report as JSON to this path")
+    parser.add_argument('--compare', help="Previous JSON report to compare against")
+    args = parser.parse_args(argv)
+
+    print("🏋️ Static Asset Load Test")
+    print("=" * 50)
+
+    web_root = local_web_root()
+    page_urls = {page: [asset['url'] for asset in page_assets(page, web_root)] for page in args.pages}
+    page_urls = {page: urls for page, urls in page_urls.items() if urls}
+    if not page_urls:
+        print(f"❌ No page assets found under {web_root}. Generate the sign assets first.")
+        return 1
+    for page, urls in page_urls.items():
+        print(f"  📄 {page}: {len(urls)} assets")
+
+    if args.base_url:
+        report = run_load_test(args.base_url, page_urls, args.users, args.iterations)
+    else:
+        with LocalStaticServer(web_root) as server:
+            print(f"  🌐 Serving {web_root} at {server.base_url}")
+            report = run_load_test(server.base_url, page_urls, args.users, args.iterations)
+
+    print_report(report)
+
+    regressions = []
+    if args.compare:
+        if os.path.exists(args.compare):
+            with open(args.compare, 'r', encoding='utf-8') as f:
+                regressions = compare_reports(json.load(f), report)
+            if regressions:
+                print(f"\n❌ Regressed: {', '.join(regressions)}")
+        else:
+            print(f"\n⚠️ No previous report at {args.compare}")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report saved to: {args.save}")
+
+    return 1 if report['total']['errors'] or regressions else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Streaming Metadata Writer
+Shared writer for the pipelines' JSON metadata outputs. A top-level JSON
+object is written incrementally: scalar fields and whole values with field(),
+and large {key: value} members entry by entry with begin() / entry() / end().
+Nothing but the current entry is held in memory, and each piece is serialized
+once and fanned out to every output path.
+
+Output is compact by default; pretty=True writes the same indented layout as
+json.dump(..., indent=2) for debugging.
+
+Every output is written to a temporary file and renamed into place only when
+the writer is closed normally, so a pipeline that fails partway leaves the
+previous files untouched rather than a truncated object that still parses.
+"""
+
+import json
+from precompress import (TEMP_SUFFIX, open_with_variants, variant_paths,
+                         replace_temp_files, remove_temp_files)
+
+PRETTY_INDENT = 2
+
+class MetadataWriter:
+    """
+    Stream one JSON object to several files at once.
+
+    Usage:
+        with MetadataWriter(paths) as writer:
+            writer.begin('signs')
+            for name, data in records:
+                writer.entry(name, data)
+            writer.end()
+            writer.field('total_signs', count)
+
+    With variants=True each path also gets streamed .gz/.br siblings.
+    Leaving the with block through an exception calls abort() instead of
+    close().
+    """
+
+    def __init__(self, paths, pretty=False, variants=False):
+        self.paths = list(paths)
+        self.indent = PRETTY_INDENT if pretty else None
+        self._sinks = []
+        self._targets = []
+        for path in self.paths:
+            self._targets.extend(variant_paths(path) if variants else [path])
+            self._sinks.extend(open_with_variants(path, suffix=TEMP_SUFFIX) if variants
+                               else [open(path + TEMP_SUFFIX, 'wb')])
+        self._member = None
+        self._member_count = 0
+        self._field_count = 0
+        self._write('{')
+
+    def _write(self, text):
+        data = text.encode('utf-8')
+        for sink in self._sinks:
+            sink.write(data)
+
+    def _dumps(self, value, level=0):
+        """Serialize a value that starts at the given nesting level"""
+        if self.indent is None:
+            return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+        text = json.dumps(value, indent=self.indent, ensure_ascii=False)
+        return text.replace('\n', '\n' + ' ' * (self.indent * level))
+
+    def _item(self, count, key, level):
+        """Separator, line break and key for the count-th item at a level"""
+        separator = ',' if count else ''
+        if self.indent is None:
+            return f"{separator}{self._dumps(key)}:"
+        return f"{separator}\n{' ' * (self.indent * level)}{self._dumps(key)}: "
+
+    def field(self, key, value):
+        """Write a complete top-level field"""
+        if self._member is not None:
+            raise RuntimeError(f"Member '{self._member}' is still open")
+        self._write(self._item(self._field_count, key, 1) + self._dumps(value, 1))
+        self._field_count += 1
+
+    def begin(self, key):
+        """Open a top-level object member to be filled with entry()"""
+        if self._member is not None:
+            raise RuntimeError(f"Member '{self._member}' is still open")
+        self._write(self._item(self._field_count, key, 1) + '{')
+        self._field_count += 1
+        self._member = key
+        self._member_count = 0
+
+    def entry(self, key, value):
+        """Append one key/value pair to the open member"""
+        if self._member is None:
+            raise RuntimeError("No member is open")
+        self._write(self._item(self._member_count, key, 2) + self._dumps(value, 2))
+        self._member_count += 1
+
+    def end(self):
+        """Close the open member; returns the number of entries written"""
+        if self._member is None:
+            raise RuntimeError("No member is open")
+        pretty = self.indent is not None and self._member_count
+        self._write(f"\n{' ' * self.indent}}}" if pretty else '}')
+        self._member = None
+        return self._member_count
+
+    def close(self):
+        """Finish the object, close every file and move the outputs into place"""
+        if self._member is not None:
+            self.end()
+        pretty = self.indent is not None and self._field_count
+        self._write('\n}' if pretty else '}')
+        self._close_sinks()
+        replace_temp_files(self._targets)
+
+    def abort(self):
+        """Close every file and delete the unfinished outputs; existing files are kept"""
+        self._close_sinks()
+        remove_temp_files(self._targets)
+
+    def _close_sinks(self):
+        for sink in self._sinks:
+            sink.close()
+        self._sinks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self._sinks:
+            return
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
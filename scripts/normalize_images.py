@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Batched Image Normalization Engine
+Normalizes loose sign images (alphabet letters, contributor uploads) into
+uniform square PNGs. Images are letterboxed into one preallocated stack per
+batch and alpha-flattened with vectorized array math, and batches are spread
+across a process pool.
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+from alpha_output import make_transparent
+from image_decode import DEFAULT_TIER, open_reduced, thumbnail
+from png_encoder import encode_png
+
+DEFAULT_SIZE = 150
+DEFAULT_CHUNK_SIZE = 32
+
+def flatten_alpha(stack, background=255):
+    """
+    Composite a stacked (N, H, W, 4) RGBA batch over a solid background.
+
+    Integer math over the whole batch at once; returns (N, H, W, 3) uint8.
+    """
+    rgb = stack[..., :3].astype(np.uint32)
+    alpha = stack[..., 3:4].astype(np.uint32)
+    flat = (rgb * alpha + background * (255 - alpha) + 127) // 255
+    return flat.astype(np.uint8)
+
+def letterbox_batch(paths, size=DEFAULT_SIZE, tier=DEFAULT_TIER, transparent=False):
+    """
+    Decode and fit each image into a slot of one (N, size, size, 4) stack.
+
+    Every input is converted straight to RGBA, which covers the RGB, L, P
+    and LA cases in one step; empty letterbox space stays fully transparent.
+
+    Returns (stack, rects, errors) where rects[i] is the (x, y, w, h) the
+    image occupies in its slot, or None if it failed to load.
+    """
+    stack = np.zeros((len(paths), size, size, 4), dtype=np.uint8)
+    rects = []
+    errors = []
+
+    for index, path in enumerate(paths):
+        try:
+            with open_reduced(path, (size, size)) as img:
+                img = img.convert('RGBA')
+            if transparent:
+                img = make_transparent(img)
+            thumbnail(img, (size, size), tier)
+
+            x = (size - img.width) // 2
+            y = (size - img.height) // 2
+            stack[index, y:y + img.height, x:x + img.width] = np.asarray(img)
+            rects.append((x, y, img.width, img.height))
+            errors.append(None)
+        except Exception as e:
+            rects.append(None)
+            errors.append(str(e))
+
+    return stack, rects, errors
+
+def _normalize_chunk(paths, size, tier, transparent, max_error):
+    """Normalize one batch of paths; runs inside a pool worker"""
+    stack, rects, errors = letterbox_batch(paths, size, tier, transparent)
+    if not transparent:
+        flattened = flatten_alpha(stack)
+
+    results = []
+    for index, path in enumerate(paths):
+        result = {'path': path, 'error': errors[index]}
+        results.append(result)
+        if rects[index] is None:
+            continue
+
+        if transparent:
+            # Keep only the occupied part of the slot: no canvas padding
+            x, y, w, h = rects[index]
+            image = Image.fromarray(stack[index, y:y + h, x:x + w], 'RGBA')
+        else:
+            image = Image.fromarray(flattened[index], 'RGB')
+
+        if max_error is None:
+            result['image'] = image
+            continue
+        try:
+            result['png'], result['info'] = encode_png(image, max_error=max_error)
+        except Exception as e:
+            result['error'] = str(e)
+
+    return results
+
+def normalize_images(paths, size=DEFAULT_SIZE, tier=DEFAULT_TIER, transparent=False,
+                     max_error=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Normalize a list of image files into size x size sign images.
+
+    Args:
+        paths: Input image paths
+        size: Output square size in pixels
+        tier: Resampling tier from image_decode.RESAMPLING_TIERS
+        transparent: Keep a trimmed transparent background instead of
+            flattening onto white
+        max_error: If set, also PNG-encode each image in the worker with this
+            perceptual error bound and return 'png'/'info' instead of 'image'
+        workers: Process pool size; 1 runs in-process, None uses all CPUs
+        chunk_size: Images per batch handed to a worker
+
+    Returns:
+        One dict per input path, in order, with 'path', 'error' and either
+        'image' (PIL) or 'png' (bytes) plus 'info' (encoder stats).
+    """
+    paths = list(paths)
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    args = (size, tier, transparent, max_error)
+
+    if workers == 1 or len(chunks) <= 1:
+        batches = [_normalize_chunk(chunk, *args) for chunk in chunks]
+    else:
+        workers = workers or os.cpu_count()
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            batches = list(pool.map(_normalize_chunk, chunks, *[[arg] * len(chunks) for arg in args]))
+
+    return [result for batch in batches for result in batch]
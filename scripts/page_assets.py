@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Page Assets
+Which generated sign assets each learning page (Alphabet, CommonSigns,
+Dictionary, FlashCards) loads, in the order the page shows them, derived from
+the output directories the asset scripts already write. Shared by the
+precache manifest and the page checks, so no page keeps its own asset list.
+"""
+
+import os
+from sign_catalog import PROJECT_ROOT, ASSET_DIRS, load_catalog
+from dictionary_shards import SHARD_DIR_NAME, INDEX_NAME, LAZY_SHARDS
+
+# Web roots the scripts write to; URLs are relative to these
+PUBLIC_DIRS = ['public', 'frontend/public']
+
+def _url_dir(output_dir):
+    """'public/images/signs/common' -> 'images/signs/common'"""
+    return output_dir.split('/', 1)[1]
+
+DICTIONARY_DATA_DIR = f"images/signs/{SHARD_DIR_NAME}"
+LAZY_SHARD_FILES = tuple(filename for _, filename in LAZY_SHARDS)
+
+# Asset groups per page. Each group names a directory (relative to the web
+# root) and either explicit 'files' or the 'extensions' it serves (minus any
+# 'exclude'), an optional 'order' (catalog collection, or the dictionary's
+# category order for shards; otherwise by name), its precache tier and how
+# many of its first assets are critical for the page's first screen.
+PAGES = {
+    'alphabet': {
+        'component': 'Alphabet',
+        'groups': [
+            {'dir': _url_dir(ASSET_DIRS['alphabet'][0]), 'extensions': ('.png',),
+             'tier': 'core', 'critical': 6}
+        ]
+    },
+    'common_signs': {
+        'component': 'CommonSigns',
+        'groups': [
+            {'dir': _url_dir(ASSET_DIRS['common'][0]), 'extensions': ('.png',),
+             'order': 'common', 'tier': 'core', 'critical': 6}
+        ]
+    },
+    'dictionary': {
+        'component': 'Dictionary',
+        'groups': [
+            {'dir': DICTIONARY_DATA_DIR, 'files': (INDEX_NAME,), 'tier': 'core', 'critical': 1},
+            {'dir': DICTIONARY_DATA_DIR, 'extensions': ('.json',), 'order': 'dictionary_shards',
+             'exclude': (INDEX_NAME,) + LAZY_SHARD_FILES, 'tier': 'core', 'critical': 1},
+            {'dir': DICTIONARY_DATA_DIR, 'files': LAZY_SHARD_FILES, 'tier': 'extended', 'critical': 0},
+            {'dir': _url_dir(ASSET_DIRS['dictionary'][0]), 'extensions': ('.svg',),
+             'order': 'dictionary', 'tier': 'extended', 'critical': 6}
+        ]
+    },
+    'flashcards': {
+        'component': 'FlashCards',
+        'groups': [
+            {'dir': 'images/signs/flashcards', 'extensions': ('.jpg', '.jpeg', '.png', '.webp'),
+             'tier': 'core', 'critical': 1}
+        ]
+    }
+}
+
+def _order_key(group):
+    """Sort key putting a group's files in on-page order (by file stem)"""
+    order = group.get('order')
+    if order is None:
+        return lambda name: (0, name)
+
+    collections = load_catalog()['collections']
+    if order == 'dictionary_shards':
+        # Category shards in the order the dictionary lists its categories
+        stems = dict.fromkeys(record['category'] for record in collections['dictionary'].values())
+    else:
+        stems = collections[order]
+    ranks = {stem: rank for rank, stem in enumerate(stems)}
+    return lambda name: (ranks.get(os.path.splitext(name)[0], len(ranks)), name)
+
+def _group_files(group, public_dir):
+    """File names of one asset group present under public_dir, in page order"""
+    directory = os.path.join(public_dir, group['dir'])
+    if 'files' in group:
+        return [name for name in group['files'] if os.path.isfile(os.path.join(directory, name))]
+    if not os.path.isdir(directory):
+        return []
+
+    with os.scandir(directory) as entries:
+        names = [
+            entry.name for entry in entries
+            if entry.is_file()
+            and entry.name.lower().endswith(group['extensions'])
+            and entry.name not in group.get('exclude', ())
+        ]
+    return sorted(names, key=_order_key(group))
+
+def page_assets(page, public_dir=None):
+    """
+    Assets of one page found under the web root, in on-page order.
+
+    Returns [{'url', 'path', 'bytes', 'tier', 'critical'}]; url is the
+    site-absolute URL and path the file on disk.
+    """
+    public_dir = public_dir or os.path.join(PROJECT_ROOT, PUBLIC_DIRS[0])
+
+    assets = []
+    for group in PAGES[page]['groups']:
+        for position, name in enumerate(_group_files(group, public_dir)):
+            path = os.path.join(public_dir, group['dir'], name)
+            assets.append({
+                'url': f"/{group['dir']}/{name}",
+                'path': path,
+                'bytes': os.path.getsize(path),
+                'tier': group['tier'],
+                'critical': position < group['critical']
+            })
+    return assets
+
+def all_page_assets(public_dir=None):
+    """{page: page_assets(page)} for every learning page"""
+    return {page: page_assets(page, public_dir) for page in PAGES}
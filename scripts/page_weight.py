@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Page Weight Report
+Computes, per learning page, the number of requests and the raw and
+compressed bytes of the sign assets it loads, checks them against the
+per-asset and per-page budgets in scripts/data/page_budgets.json, and shows
+what changed since the last report that passed its budgets.
+
+The asset list comes from the output directories (page_assets) and is
+cross-checked against the metadata JSONs: signs the metadata lists without
+an asset on disk, and assets no metadata entry refers to, are reported.
+
+Exits non-zero when a budget is exceeded, so asset bloat fails the build.
+"""
+
+import os
+import json
+import argparse
+from datetime import datetime
+from sign_catalog import PROJECT_ROOT
+from page_assets import PAGES, PUBLIC_DIRS, page_assets
+from precompress import compressed_size
+
+BUDGETS_PATH = os.path.join(PROJECT_ROOT, 'scripts', 'data', 'page_budgets.json')
+REPORT_PATH = os.path.join(PROJECT_ROOT, 'processed_signs', 'cache', 'page_weight.json')
+
+# Metadata JSONs listing each page's signs, and the URL of a sign's image
+PAGE_METADATA = {
+    'common_signs': (('processed_signs/common_signs_metadata.json',
+                      'processed_signs/manual/precise_crop_metadata.json'),
+                     '/images/signs/common/{name}.png'),
+    'dictionary': (('public/images/signs/aslDictionaryData.json',),
+                   '/images/signs/dictionary/{name}.svg')
+}
+
+# Asset changes smaller than this are left out of the diff
+DIFF_THRESHOLD_BYTES = 1024
+
+def metadata_urls(page):
+    """Image URLs the page's metadata JSONs refer to (None without metadata)"""
+    if page not in PAGE_METADATA:
+        return None
+    metadata_paths, url_template = PAGE_METADATA[page]
+    urls = None
+    for metadata_path in metadata_paths:
+        metadata_path = os.path.join(PROJECT_ROOT, metadata_path)
+        if not os.path.exists(metadata_path):
+            continue
+        with open(metadata_path, 'r', encoding='utf-8') as f:
+            signs = json.load(f).get('signs', {})
+        urls = (urls or set()) | {url_template.format(name=name) for name in signs}
+    return urls
+
+def page_weight(page, public_dir):
+    """
+    Weight of one page's assets under public_dir:
+        {requests, raw_bytes, compressed_bytes, assets: {url: [raw, compressed]},
+         missing, unreferenced}
+    """
+    assets = {asset['url']: [asset['bytes'], compressed_size(asset['path'])]
+              for asset in page_assets(page, public_dir)}
+
+    missing, unreferenced = [], []
+    referenced = metadata_urls(page)
+    if referenced is not None:
+        image_dir, image_ext = os.path.split(PAGE_METADATA[page][1])
+        image_ext = os.path.splitext(image_ext)[1]
+        missing = sorted(referenced - assets.keys())
+        unreferenced = sorted(
+            url for url in assets
+            if url.startswith(image_dir + '/') and url.endswith(image_ext) and url not in referenced
+        )
+
+    return {
+        'requests': len(assets),
+        'raw_bytes': sum(raw for raw, _ in assets.values()),
+        'compressed_bytes': sum(compressed for _, compressed in assets.values()),
+        'assets': assets,
+        'missing': missing,
+        'unreferenced': unreferenced
+    }
+
+def build_report(public_dir):
+    """Page weights of every learning page under public_dir"""
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'pages': {page: page_weight(page, public_dir) for page in PAGES}
+    }
+
+def load_budgets(path=BUDGETS_PATH):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def check_budgets(report, budgets):
+    """
+    Budget violations of a report, as messages. Per-asset budgets (by file
+    extension) and page byte budgets apply to compressed (transfer) bytes.
+    """
+    violations = []
+    asset_budgets = budgets.get('asset_bytes', {})
+    for page, weight in report['pages'].items():
+        for url, (_, compressed) in weight['assets'].items():
+            limit = asset_budgets.get(os.path.splitext(url)[1].lower())
+            if limit is not None and compressed > limit:
+                violations.append(f"{url}: {compressed:,} bytes > {limit:,} asset budget")
+
+        page_budget = budgets.get('pages', {}).get(page, {})
+        if 'requests' in page_budget and weight['requests'] > page_budget['requests']:
+            violations.append(f"{page}: {weight['requests']} requests > {page_budget['requests']} budget")
+        if 'compressed_bytes' in page_budget and weight['compressed_bytes'] > page_budget['compressed_bytes']:
+            violations.append(f"{page}: {weight['compressed_bytes']:,} bytes > "
+                              f"{page_budget['compressed_bytes']:,} page budget")
+    # One URL can belong to several pages
+    return list(dict.fromkeys(violations))
+
+def _delta(after, before):
+    return f"{after - before:+,}" if after != before else "="
+
+def print_report(report, budgets):
+    print(f"\n  {'page':<14}{'requests':>9}{'raw bytes':>14}{'compressed':>14}{'budget':>14}")
+    for page, weight in report['pages'].items():
+        budget = budgets.get('pages', {}).get(page, {}).get('compressed_bytes')
+        budget = f"{weight['compressed_bytes'] / budget:.0%}" if budget else '-'
+        print(f"  {page:<14}{weight['requests']:>9}{weight['raw_bytes']:>14,}"
+              f"{weight['compressed_bytes']:>14,}{budget:>14}")
+
+    for page, weight in report['pages'].items():
+        if weight['missing']:
+            print(f"  ⚠️ {page}: {len(weight['missing'])} signs in metadata have no asset "
+                  f"(e.g. {weight['missing'][0]})")
+        if weight['unreferenced']:
+            print(f"  ⚠️ {page}: {len(weight['unreferenced'])} assets not in metadata "
+                  f"(e.g. {weight['unreferenced'][0]})")
+
+def print_diff(previous, current):
+    """Print page totals and notable asset changes since the previous report"""
+    print(f"\n🔁 Changes since {previous.get('created', 'the previous build')}:")
+    changed = False
+    for page, weight in current['pages'].items():
+        before = previous['pages'].get(page)
+        if before is None:
+            print(f"  {page}: new page")
+            changed = True
+            continue
+        if (weight['requests'], weight['compressed_bytes']) != (before['requests'], before['compressed_bytes']):
+            changed = True
+            print(f"  {page}: requests {before['requests']} -> {weight['requests']} "
+                  f"({_delta(weight['requests'], before['requests'])}), compressed bytes "
+                  f"{before['compressed_bytes']:,} -> {weight['compressed_bytes']:,} "
+                  f"({_delta(weight['compressed_bytes'], before['compressed_bytes'])})")
+
+        old_assets = before['assets']
+        for url, (_, compressed) in weight['assets'].items():
+            if url not in old_assets:
+                print(f"     + {url} ({compressed:,} bytes)")
+            elif abs(compressed - old_assets[url][1]) >= DIFF_THRESHOLD_BYTES:
+                print(f"     ~ {url} ({_delta(compressed, old_assets[url][1])} bytes)")
+        for url in sorted(old_assets.keys() - weight['assets'].keys()):
+            print(f"     - {url}")
+    if not changed:
+        print("  No page totals changed")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report page weights and enforce asset budgets")
+    parser.add_argument('--budgets', default=BUDGETS_PATH, help="Budget configuration JSON")
+    parser.add_argument('--previous', default=REPORT_PATH,
+                        help="Last passing report to diff against (replaced when the budgets pass)")
+    parser.add_argument('--no-save', action='store_true', help="Don't replace the previous report")
+    args = parser.parse_args(argv)
+
+    print("⚖️ Page Weight Report")
+    print("=" * 50)
+
+    public_dir = os.path.join(PROJECT_ROOT, PUBLIC_DIRS[0])
+    if not os.path.isdir(public_dir):
+        print(f"❌ Web root not found: {public_dir}")
+        return 1
+
+    budgets = load_budgets(args.budgets)
+    report = build_report(public_dir)
+    print_report(report, budgets)
+
+    if os.path.exists(args.previous):
+        with open(args.previous, 'r', encoding='utf-8') as f:
+            print_diff(json.load(f), report)
+
+    violations = check_budgets(report, budgets)
+    if violations:
+        print(f"\n❌ {len(violations)} budget violations:")
+        for violation in violations:
+            print(f"  - {violation}")
+        return 1
+
+    print("\n✅ All pages within budget")
+
+    # Only a passing report becomes the baseline, so a failing build is
+    # diffed against the last good one again on the next run
+    if not args.no_save:
+        os.makedirs(os.path.dirname(args.previous), exist_ok=True)
+        with open(args.previous, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report saved to: {os.path.relpath(args.previous, PROJECT_ROOT)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Low-Quality Image Placeholders
+Computes a tiny blurred preview for every sign image so the learning pages
+can paint something at the right size before the real asset arrives. The
+downsampling is vectorized over the whole batch of signs.
+"""
+
+import io
+import base64
+import numpy as np
+from PIL import Image
+
+# Placeholder grid (pixels per side) and the working size images are
+# reduced to before block averaging
+PLACEHOLDER_SIZE = 8
+WORKING_SIZE = 32
+
+def block_average(stack, grid=PLACEHOLDER_SIZE):
+    """
+    Average a stacked (N, H, W, C) batch down to (N, grid, grid, C).
+
+    Blocks may differ in size by one pixel when H or W isn't a multiple of
+    grid; np.add.reduceat handles the uneven edges in one pass per axis.
+    """
+    stack = np.asarray(stack, dtype=np.float32)
+    _, height, width, _ = stack.shape
+
+    row_edges = np.linspace(0, height, grid + 1).astype(int)
+    col_edges = np.linspace(0, width, grid + 1).astype(int)
+
+    sums = np.add.reduceat(stack, row_edges[:-1], axis=1)
+    sums = np.add.reduceat(sums, col_edges[:-1], axis=2)
+    counts = np.outer(np.diff(row_edges), np.diff(col_edges))[None, :, :, None]
+
+    return np.round(sums / counts).astype(np.uint8)
+
+def to_data_uri(pixels):
+    """Encode a small RGBA array as a PNG data URI"""
+    buffer = io.BytesIO()
+    image = Image.fromarray(pixels, 'RGBA')
+    # Drop alpha when it carries no information; keeps the URI shorter
+    if pixels[..., 3].min() == 255:
+        image = image.convert('RGB')
+    image.save(buffer, 'PNG', optimize=True)
+    return 'data:image/png;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+def compute_placeholders(paths):
+    """
+    Compute placeholders for a batch of raster sign images.
+
+    Returns a dict mapping each readable path to
+    {'placeholder': data URI, 'width': int, 'height': int}.
+    """
+    loaded = []
+    stack = []
+    for path in paths:
+        try:
+            with Image.open(path) as img:
+                size = img.size
+                stack.append(np.asarray(
+                    img.convert('RGBA').resize((WORKING_SIZE, WORKING_SIZE), Image.Resampling.BOX)
+                ))
+            loaded.append((path, size))
+        except Exception as e:
+            print(f"  ⚠️ No placeholder for {path}: {e}")
+
+    if not stack:
+        return {}
+
+    tiny = block_average(np.stack(stack))
+    return {
+        path: {'placeholder': to_data_uri(tiny[index]), 'width': width, 'height': height}
+        for index, (path, (width, height)) in enumerate(loaded)
+    }
+
+def iter_placeholders(paths, batch_size=256):
+    """
+    Yield (path, placeholder fields) for every path, in order.
+
+    Paths are processed in vectorized batches so streaming writers hold at
+    most batch_size working images; unreadable paths yield an empty dict.
+    """
+    batch = []
+    for path in paths:
+        batch.append(path)
+        if len(batch) == batch_size:
+            placeholders = compute_placeholders(batch)
+            yield from ((p, placeholders.get(p, {})) for p in batch)
+            batch = []
+    if batch:
+        placeholders = compute_placeholders(batch)
+        yield from ((p, placeholders.get(p, {})) for p in batch)
+
+# Samples per side when rasterizing vector layouts, fine enough for thin strokes
+VECTOR_SAMPLES = WORKING_SIZE * 4
+
+def _coverage(mask):
+    """Reduce a boolean (VECTOR_SAMPLES, VECTOR_SAMPLES) mask to placeholder coverage"""
+    return block_average(mask[None, :, :, None].astype(np.float32) * 255.0)[0, :, :, 0] / 255.0
+
+def _hex_rgb(color):
+    """'#RRGGBB' -> float32 [r, g, b]"""
+    return np.array([int(color[i:i + 2], 16) for i in (1, 3, 5)], dtype=np.float32)
+
+def dictionary_svg_placeholders(styles, size, radius, background_opacity, stroke_width,
+                                hand_box, hand_color):
+    """
+    Render placeholders for the generated dictionary SVGs.
+
+    The SVGs share one layout (tinted, outlined background circle with a
+    skin-toned hand in the middle) and differ only in category colour and
+    the hand's difficulty opacity, so the shapes are rasterized once and the
+    per-sign colours and opacities broadcast over the batch. The layout
+    arguments are the constants create_dictionary_sign_svg draws with.
+
+    Args:
+        styles: List of ('#RRGGBB' category colour, hand opacity), one per sign
+        size: Width/height of the SVG viewBox
+        radius: Background circle radius
+        background_opacity: Fill opacity of the background circle
+        stroke_width: Width of the background circle's outline
+        hand_box: (left, top, right, bottom) of the hand relative to the centre
+        hand_color: '#RRGGBB' hand fill
+
+    Returns:
+        List of {'placeholder', 'width', 'height'} dicts in the same order.
+    """
+    if not styles:
+        return []
+
+    # Sample the SVG geometry on a fine grid (pixel centres)
+    coords = (np.arange(VECTOR_SAMPLES) + 0.5) * size / VECTOR_SAMPLES
+    x, y = np.meshgrid(coords, coords)
+    centre = size / 2.0
+    distance = np.hypot(x - centre, y - centre)
+    left, top, right, bottom = hand_box
+    circle = _coverage(distance <= radius)
+    outline = _coverage(np.abs(distance - radius) <= stroke_width / 2.0)
+    hand = _coverage((x >= centre + left) & (x <= centre + right)
+                     & (y >= centre + top) & (y <= centre + bottom))
+
+    rgb = np.stack([_hex_rgb(color) for color, _ in styles])[:, None, None, :]
+    hand_opacity = np.array([opacity for _, opacity in styles], dtype=np.float32)[:, None, None, None]
+
+    # Composite back to front (premultiplied): circle fill, its outline,
+    # then the hand at its difficulty opacity
+    layers = [
+        (circle, rgb, background_opacity),
+        (outline, rgb, 1.0),
+        (hand, _hex_rgb(hand_color), hand_opacity)
+    ]
+    color = np.zeros((len(styles), PLACEHOLDER_SIZE, PLACEHOLDER_SIZE, 3), dtype=np.float32)
+    alpha = np.zeros((len(styles), PLACEHOLDER_SIZE, PLACEHOLDER_SIZE, 1), dtype=np.float32)
+    for coverage, layer_rgb, opacity in layers:
+        layer_alpha = coverage[None, :, :, None] * opacity
+        color = layer_rgb * layer_alpha + color * (1.0 - layer_alpha)
+        alpha = layer_alpha + alpha * (1.0 - layer_alpha)
+    color /= np.maximum(alpha, 1e-6)
+
+    pixels = np.empty((len(styles), PLACEHOLDER_SIZE, PLACEHOLDER_SIZE, 4), dtype=np.uint8)
+    pixels[..., :3] = np.clip(np.round(color), 0, 255)
+    pixels[..., 3] = np.clip(np.round(alpha[..., 0] * 255), 0, 255)
+
+    return [{'placeholder': to_data_uri(tile), 'width': size, 'height': size} for tile in pixels]
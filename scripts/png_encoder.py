@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Adaptive PNG Encoder
+Picks the smallest PNG colour mode (grayscale, palette or full colour) for
+each sign image that stays within a perceptual error bound, and reports the
+savings against the plain 24-bit RGB / 32-bit RGBA encoding.
+"""
+
+import io
+import numpy as np
+from PIL import Image
+
+# Mean per-pixel "redmean" colour distance (0-255 scale) a quantized image may
+# drift from the original before we fall back to a richer colour mode.
+DEFAULT_MAX_ERROR = 3.0
+
+# Quantized palette sizes tried, smallest first
+PALETTE_SIZES = (16, 32, 64, 128, 256)
+
+def count_colors(pixels):
+    """
+    Count the distinct colours in an (H, W, C) uint8 array.
+
+    Channels are packed into a single integer per pixel so the count is one
+    np.unique call instead of a Python loop over pixels.
+    """
+    pixels = np.asarray(pixels, dtype=np.uint8)
+    if pixels.ndim == 2:
+        return int(np.unique(pixels).size)
+
+    packed = np.zeros(pixels.shape[:2], dtype=np.uint32)
+    for channel in range(pixels.shape[2]):
+        packed = (packed << 8) | pixels[..., channel]
+    return int(np.unique(packed).size)
+
+def perceptual_error(reference, candidate):
+    """
+    Mean perceptual distance between two (H, W, 3) RGB arrays.
+
+    Uses the "redmean" weighted Euclidean distance, a cheap approximation of
+    how differently the eye sees two colours.
+    """
+    ref = np.asarray(reference, dtype=np.float32)
+    cand = np.asarray(candidate, dtype=np.float32)
+
+    r_mean = (ref[..., 0] + cand[..., 0]) / 2.0
+    delta = ref - cand
+    distance = np.sqrt(
+        (2.0 + r_mean / 256.0) * delta[..., 0] ** 2
+        + 4.0 * delta[..., 1] ** 2
+        + (2.0 + (255.0 - r_mean) / 256.0) * delta[..., 2] ** 2
+    )
+    # Normalise so a full-scale difference on every channel maps to ~255
+    return float(distance.mean() / 3.0)
+
+def _png_bytes(image):
+    """Encode an image as optimized PNG and return the bytes"""
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG', optimize=True)
+    return buffer.getvalue()
+
+def _exact_palette_image(pixels):
+    """Build a lossless palette image from an RGB array with <= 256 colours"""
+    flat = pixels.reshape(-1, 3)
+    palette, indices = np.unique(flat, axis=0, return_inverse=True)
+
+    image = Image.fromarray(indices.reshape(pixels.shape[:2]).astype(np.uint8), 'P')
+    image.putpalette(palette.astype(np.uint8).tobytes())
+    return image
+
+def _reference_rgb(pixels):
+    """
+    RGB array used for error measurement.
+
+    Alpha images are composited over mid-grey, so errors in colour and in
+    transparency both show up as visible differences.
+    """
+    if pixels.shape[2] == 3:
+        return pixels
+    alpha = pixels[..., 3:4].astype(np.float32) / 255.0
+    return pixels[..., :3].astype(np.float32) * alpha + 128.0 * (1.0 - alpha)
+
+def _candidate_images(image, pixels, colors, max_error):
+    """Yield (mode_label, image) pairs that stay within the error bound"""
+    has_alpha = image.mode == 'RGBA'
+    reference = _reference_rgb(pixels)
+
+    def within_bound(candidate):
+        decoded = np.asarray(candidate.convert(image.mode))
+        return perceptual_error(reference, _reference_rgb(decoded)) <= max_error
+
+    yield image.mode.lower(), image
+
+    # Grayscale: charts are often black line art on white
+    gray = image.convert('LA' if has_alpha else 'L')
+    if within_bound(gray):
+        yield 'grayscale', gray
+
+    # Palette: exact when the image already has few colours, plus the
+    # smallest quantized palette that is still within the bound
+    if colors <= 256 and not has_alpha:
+        yield f'palette{colors}', _exact_palette_image(pixels)
+
+    for size in PALETTE_SIZES:
+        if size >= colors and not has_alpha:
+            return
+        quantized = image.quantize(
+            colors=size,
+            # Median cut gives better palettes but only supports RGB input
+            method=Image.Quantize.FASTOCTREE if has_alpha else Image.Quantize.MEDIANCUT,
+            dither=Image.Dither.NONE
+        )
+        if within_bound(quantized):
+            yield f'palette{size}', quantized
+            return
+
+def encode_png(image, max_error=DEFAULT_MAX_ERROR):
+    """
+    Encode a sign image with the smallest admissible PNG colour mode.
+
+    Args:
+        image: PIL image; images with transparency are kept as RGBA/LA
+        max_error: Largest mean perceptual error allowed for lossy modes
+
+    Returns:
+        Tuple of (png_bytes, info) where info describes the chosen mode, the
+        effective colour count and the byte savings against full-colour
+        (24-bit RGB or 32-bit RGBA) encoding.
+    """
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+    pixels = np.asarray(image)
+    colors = count_colors(pixels)
+
+    encoded = {}
+    for label, candidate in _candidate_images(image, pixels, colors, max_error):
+        encoded[label] = _png_bytes(candidate)
+
+    baseline = image.mode.lower()
+    mode = min(encoded, key=lambda label: len(encoded[label]))
+    png_bytes = encoded[mode]
+    baseline_bytes = len(encoded[baseline])
+
+    return png_bytes, {
+        'mode': mode,
+        'colors': colors,
+        'bytes': len(png_bytes),
+        'baseline_bytes': baseline_bytes,
+        'saved_bytes': baseline_bytes - len(png_bytes)
+    }
+
+def save_png(image, paths, max_error=DEFAULT_MAX_ERROR):
+    """
+    Encode an image once and write the result to every path.
+
+    Returns the encoder info with a 'saved' list of the paths written.
+    """
+    png_bytes, info = encode_png(image, max_error=max_error)
+    return write_png(png_bytes, info, paths)
+
+def write_png(png_bytes, info, paths):
+    """
+    Write already-encoded PNG bytes to every path.
+
+    Returns the encoder info with a 'saved' list of the paths written.
+    """
+    info['saved'] = []
+    for path in paths:
+        try:
+            with open(path, 'wb') as f:
+                f.write(png_bytes)
+            print(f"    Saved: {path} ({info['mode']}, {info['bytes']} bytes)")
+            info['saved'].append(path)
+        except Exception as e:
+            print(f"    Error saving {path}: {e}")
+
+    return info
+
+def print_savings_report(results):
+    """Print a summary of the byte savings across a batch of encodes"""
+    if not results:
+        return
+
+    baseline = sum(info['baseline_bytes'] for info in results)
+    actual = sum(info['bytes'] for info in results)
+
+    mode_counts = {}
+    for info in results:
+        mode = 'palette' if info['mode'].startswith('palette') else info['mode']
+        mode_counts[mode] = mode_counts.get(mode, 0) + 1
+
+    print(f"\n🗜️ PNG encoding summary ({len(results)} images):")
+    for mode, count in sorted(mode_counts.items()):
+        print(f"  {mode}: {count} images")
+    print(f"  Full-colour size: {baseline:,} bytes")
+    print(f"  Encoded size:     {actual:,} bytes")
+    if actual:
+        print(f"  Savings: {baseline - actual:,} bytes ({baseline / actual:.1f}x smaller)")
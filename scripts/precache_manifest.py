@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Precache Manifest
+Writes precache-manifest.json for the service worker: every generated sign
+asset the learning pages use, with a content revision hash and byte size,
+grouped into priority tiers and capped by a byte budget, plus each page's
+critical assets for <link rel="preload">.
+
+Tiers are filled in order (critical, core, extended) until the budget is
+reached; anything left out is simply fetched on demand.
+"""
+
+import os
+import hashlib
+import argparse
+import mimetypes
+from sign_catalog import PROJECT_ROOT
+from page_assets import PUBLIC_DIRS, PAGES, all_page_assets
+from metadata_writer import MetadataWriter
+
+MANIFEST_NAME = 'precache-manifest.json'
+TIERS = ('critical', 'core', 'extended')
+DEFAULT_BUDGET = 5 * 1024 * 1024
+
+def file_revision(path):
+    """Short content hash used as the cache revision of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+def preload_as(url):
+    """Value of the preload link's 'as' attribute for a URL"""
+    return 'image' if (mimetypes.guess_type(url)[0] or '').startswith('image/') else 'fetch'
+
+def build_manifest(public_dir, budget=DEFAULT_BUDGET):
+    """
+    Build the manifest for the assets under public_dir.
+
+    Each URL gets the highest tier any page assigns it (critical when it is
+    on a page's first screen). Entries are admitted tier by tier, in page
+    order, while they fit the budget. Returns the manifest dict.
+    """
+    pages = all_page_assets(public_dir)
+
+    assets = {}
+    for page_list in pages.values():
+        for asset in page_list:
+            tier = 'critical' if asset['critical'] else asset['tier']
+            known = assets.get(asset['url'])
+            if known is None or TIERS.index(tier) < TIERS.index(known['tier']):
+                assets[asset['url']] = {**asset, 'tier': tier}
+
+    entries = []
+    excluded = {tier: 0 for tier in TIERS}
+    total = 0
+    for tier in TIERS:
+        for asset in assets.values():
+            if asset['tier'] != tier:
+                continue
+            if total + asset['bytes'] > budget:
+                excluded[tier] += 1
+                continue
+            total += asset['bytes']
+            entries.append({
+                'url': asset['url'],
+                'revision': file_revision(asset['path']),
+                'size': asset['bytes'],
+                'tier': tier
+            })
+
+    preload = {
+        page: [{'href': asset['url'], 'as': preload_as(asset['url'])}
+               for asset in page_list if asset['critical']]
+        for page, page_list in pages.items()
+    }
+
+    version = hashlib.sha256(
+        ''.join(f"{entry['url']}@{entry['revision']}" for entry in entries).encode('utf-8')
+    ).hexdigest()[:16]
+
+    return {
+        'version': version,
+        'budget_bytes': budget,
+        'total_bytes': total,
+        'tiers': {tier: sum(1 for entry in entries if entry['tier'] == tier) for tier in TIERS},
+        'excluded': excluded,
+        'entries': entries,
+        'preload': preload,
+        'pages': {page: PAGES[page]['component'] for page in PAGES}
+    }
+
+def write_manifest(budget=DEFAULT_BUDGET, pretty=False):
+    """
+    Build the manifest from the first web root and write it to every web root
+    that exists. Returns the manifest.
+    """
+    public_dirs = [os.path.join(PROJECT_ROOT, public_dir) for public_dir in PUBLIC_DIRS]
+    public_dirs = [public_dir for public_dir in public_dirs if os.path.isdir(public_dir)]
+    if not public_dirs:
+        return None
+
+    manifest = build_manifest(public_dirs[0], budget)
+    paths = [os.path.join(public_dir, MANIFEST_NAME) for public_dir in public_dirs]
+    with MetadataWriter(paths, pretty=pretty) as writer:
+        for key, value in manifest.items():
+            writer.field(key, value)
+
+    for path in paths:
+        print(f"  🗂️ Precache manifest saved to: {path}")
+    return manifest
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the service worker precache manifest")
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET,
+                        help="Maximum total bytes to precache")
+    parser.add_argument('--pretty', action='store_true', help="Write indented JSON (for debugging)")
+    args = parser.parse_args(argv)
+
+    print("🗂️ Precache Manifest")
+    print("=" * 50)
+
+    manifest = write_manifest(budget=args.budget, pretty=args.pretty)
+    if manifest is None:
+        print("❌ No web root found. Run from a checkout with public/ or frontend/public/.")
+        return 1
+
+    print(f"\n📊 {len(manifest['entries'])} assets, {manifest['total_bytes']:,} of "
+          f"{manifest['budget_bytes']:,} budget bytes (version {manifest['version']})")
+    for tier in TIERS:
+        print(f"  {tier}: {manifest['tiers'][tier]} precached, {manifest['excluded'][tier]} over budget")
+    for page, links in manifest['preload'].items():
+        print(f"  🔗 {page}: {len(links)} preload links")
+
+    if manifest['excluded']['critical']:
+        print("⚠️ Some critical assets don't fit the budget")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,7 +8,19 @@ import cv2
 import numpy as np
 from PIL import Image
 import os
-import json
+import argparse
+from png_encoder import DEFAULT_MAX_ERROR, save_png, print_savings_report
+from alpha_output import make_transparent
+from image_decode import RESAMPLING_TIERS, DEFAULT_TIER, read_chart_bgr, resize
+from placeholders import iter_placeholders
+from voice_index import build_voice_index
+from sign_catalog import CATALOG_FIELDS, collection_signs
+from sign_records import CroppedSign, SignTable
+from metadata_writer import MetadataWriter
+from asset_pack import build_pack
+from inline_assets import DEFAULT_INLINE_THRESHOLD, inline_file
+from crop_quality import suspect_crops
+from sign_similarity import confusable_signs
 
 def create_directories():
     """Create necessary directories for processed images"""
@@ -125,15 +137,25 @@ def crop_sign_from_grid(image, col, row, grid_layout, padding=5):
     
     return cropped
 
-def process_image_with_mapping(image_path, mapping):
-    """Process a single image with its specific mapping"""
+def process_image_with_mapping(image_path, mapping, output_size=200):
+    """
+    Process a single image with its specific mapping.
+
+    JPEG charts are decoded at a reduced scale when every cell still covers
+    output_size, and the crop padding is scaled to match.
+    """
     print(f"\nProcessing: {image_path}")
     
-    # Load image
-    img = cv2.imread(image_path)
+    # Load image, reduced if the output size allows it
+    padding = 8
+    img, scale = read_chart_bgr(
+        image_path, (output_size, output_size), mapping['grid_layout'], padding=padding
+    )
     if img is None:
         print(f"Error: Could not read {image_path}")
         return []
+    if scale > 1:
+        print(f"  Decoded at 1/{scale} scale")
     
     extracted_signs = []
     
@@ -142,16 +164,11 @@ def process_image_with_mapping(image_path, mapping):
         try:
             # Crop the specific sign
             cropped = crop_sign_from_grid(
-                img, col, row, mapping['grid_layout'], padding=8
+                img, col, row, mapping['grid_layout'], padding=padding // scale
             )
             
             if cropped.size > 0:
-                extracted_signs.append({
-                    'name': sign_name,
-                    'image': cropped,
-                    'source': image_path,
-                    'position': (col, row)
-                })
+                extracted_signs.append(CroppedSign(sign_name, cropped, image_path, (col, row)))
                 print(f"  Extracted: {sign_name} at ({col}, {row})")
             else:
                 print(f"  Warning: Empty crop for {sign_name} at ({col}, {row})")
@@ -161,27 +178,40 @@ def process_image_with_mapping(image_path, mapping):
     
     return extracted_signs
 
-def save_extracted_sign(sign_data):
-    """Save a single extracted sign with proper formatting"""
-    name = sign_data['name']
-    image = sign_data['image']
+def save_extracted_sign(sign_data, max_error=DEFAULT_MAX_ERROR, transparent=False,
+                        size=200, tier=DEFAULT_TIER):
+    """
+    Save a single extracted sign with proper formatting.
+
+    The PNG colour mode is picked per sign by the adaptive encoder; returns
+    the encoder info (including byte savings), or None if nothing was saved.
+    With transparent=True the white background becomes alpha and the sign is
+    trimmed instead of being pasted onto a white canvas. tier names one of the
+    image_decode resampling tiers.
+    """
+    name = sign_data.name
+    image = sign_data.image
     
     # Convert BGR to RGB for PIL
     image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
     pil_image = Image.fromarray(image_rgb)
     
-    # Resize to standard size with high quality
-    pil_image = pil_image.resize((200, 200), Image.Resampling.LANCZOS)
-    
-    # Create clean white background
-    background = Image.new('RGB', (200, 200), 'white')
+    # Resize to standard size
+    pil_image = resize(pil_image, (size, size), tier)
     
-    # Center the image on the background
-    bg_w, bg_h = background.size
-    img_w, img_h = pil_image.size
-    offset = ((bg_w - img_w) // 2, (bg_h - img_h) // 2)
-    
-    background.paste(pil_image, offset)
+    if transparent:
+        output_image = make_transparent(pil_image)
+    else:
+        # Create clean white background
+        background = Image.new('RGB', (size, size), 'white')
+        
+        # Center the image on the background
+        bg_w, bg_h = background.size
+        img_w, img_h = pil_image.size
+        offset = ((bg_w - img_w) // 2, (bg_h - img_h) // 2)
+        
+        background.paste(pil_image, offset)
+        output_image = background
     
     # Save to all required locations
     filename = f"{name}.png"
@@ -191,88 +221,38 @@ def save_extracted_sign(sign_data):
         f"processed_signs/manual/{filename}"
     ]
     
-    saved_count = 0
-    for path in paths:
-        try:
-            background.save(path, 'PNG', quality=95, optimize=True)
-            print(f"    Saved: {path}")
-            saved_count += 1
-        except Exception as e:
-            print(f"    Error saving {path}: {e}")
+    info = save_png(output_image, paths, max_error=max_error)
     
-    return saved_count > 0
+    return info if info['saved'] else None
 
 def get_sign_data():
     """Get comprehensive sign data with categories and descriptions"""
-    return {
-        # Greetings
-        'hello': {'category': 'greetings', 'description': 'Flat hand at forehead, move forward', 'difficulty': 'easy', 'usage': 'Standard greeting'},
-        'goodbye': {'category': 'greetings', 'description': 'Wave hand or finger wiggle', 'difficulty': 'easy', 'usage': 'Farewell greeting'},
-        'please': {'category': 'greetings', 'description': 'Flat hand circles on chest', 'difficulty': 'easy', 'usage': 'Polite request'},
-        'thank_you': {'category': 'greetings', 'description': 'Flat hand touches chin, moves forward', 'difficulty': 'easy', 'usage': 'Express gratitude'},
-        'sorry': {'category': 'greetings', 'description': 'Fist on chest, circular motion', 'difficulty': 'easy', 'usage': 'Apologize'},
-        
-        # Responses
-        'yes': {'category': 'responses', 'description': 'Fist nods up and down', 'difficulty': 'easy', 'usage': 'Affirmative response'},
-        'no': {'category': 'responses', 'description': 'Index and middle finger close on thumb', 'difficulty': 'easy', 'usage': 'Negative response'},
-        
-        # Family
-        'mother': {'category': 'family', 'description': 'Thumb touches chin', 'difficulty': 'easy', 'usage': 'Female parent'},
-        'father': {'category': 'family', 'description': 'Thumb touches forehead', 'difficulty': 'easy', 'usage': 'Male parent'},
-        'sister': {'category': 'family', 'description': 'L-hand at chin, moves down', 'difficulty': 'medium', 'usage': 'Female sibling'},
-        'brother': {'category': 'family', 'description': 'L-hand at forehead, moves down', 'difficulty': 'medium', 'usage': 'Male sibling'},
-        'family': {'category': 'family', 'description': 'F-hands form circle', 'difficulty': 'medium', 'usage': 'Related people'},
-        'friend': {'category': 'family', 'description': 'Index fingers hook together', 'difficulty': 'medium', 'usage': 'Close companion'},
-        'love': {'category': 'emotions', 'description': 'Cross arms over chest', 'difficulty': 'easy', 'usage': 'Deep affection'},
-        'baby': {'category': 'family', 'description': 'Cradling motion with arms', 'difficulty': 'easy', 'usage': 'Infant, young child'},
-        
-        # Actions
-        'eat': {'category': 'actions', 'description': 'Fingertips to mouth repeatedly', 'difficulty': 'easy', 'usage': 'Consume food'},
-        'drink': {'category': 'actions', 'description': 'C-hand to mouth, tilt up', 'difficulty': 'easy', 'usage': 'Consume liquid'},
-        'help': {'category': 'actions', 'description': 'Fist on flat palm, lift together', 'difficulty': 'medium', 'usage': 'Assist someone'},
-        'sleep': {'category': 'actions', 'description': 'Hand to side of head, eyes closed', 'difficulty': 'easy', 'usage': 'Rest, sleep'},
-        'work': {'category': 'actions', 'description': 'S-hands tap wrists together', 'difficulty': 'medium', 'usage': 'Employment, labor'},
-        'play': {'category': 'actions', 'description': 'Y-hands shake alternately', 'difficulty': 'medium', 'usage': 'Recreation, games'},
-        'study': {'category': 'actions', 'description': 'Bent hand moves toward open palm', 'difficulty': 'medium', 'usage': 'Learn, study'},
-        'read': {'category': 'actions', 'description': 'V-hand moves down open palm', 'difficulty': 'easy', 'usage': 'Read text'},
-        'write': {'category': 'actions', 'description': 'Pinch fingers write on palm', 'difficulty': 'easy', 'usage': 'Write text'},
-        'finished': {'category': 'actions', 'description': 'Five-hands flip down', 'difficulty': 'medium', 'usage': 'Completed, done'},
-        
-        # Descriptive/Emotions
-        'good': {'category': 'descriptive', 'description': 'Flat hand from chin moves down', 'difficulty': 'easy', 'usage': 'Positive quality'},
-        'bad': {'category': 'descriptive', 'description': 'Flat hand flips down from chin', 'difficulty': 'easy', 'usage': 'Negative quality'},
-        'happy': {'category': 'emotions', 'description': 'Flat hands brush up chest', 'difficulty': 'easy', 'usage': 'Joyful feeling'},
-        'sad': {'category': 'emotions', 'description': 'Five-hands slide down face', 'difficulty': 'easy', 'usage': 'Sorrowful feeling'},
-        'hot': {'category': 'descriptive', 'description': 'Claw hand turns away from mouth', 'difficulty': 'medium', 'usage': 'High temperature'},
-        'cold': {'category': 'descriptive', 'description': 'S-hands shake (shivering)', 'difficulty': 'easy', 'usage': 'Low temperature'},
-        'big': {'category': 'descriptive', 'description': 'L-hands spread apart', 'difficulty': 'easy', 'usage': 'Large size'},
-        'small': {'category': 'descriptive', 'description': 'Flat hands close together', 'difficulty': 'easy', 'usage': 'Little size'},
-        'beautiful': {'category': 'descriptive', 'description': 'Five-hand circles face, closes to O', 'difficulty': 'medium', 'usage': 'Aesthetically pleasing'},
-        'more': {'category': 'descriptive', 'description': 'Fingertips tap together', 'difficulty': 'easy', 'usage': 'Additional amount'},
-        
-        # Colors
-        'red': {'category': 'colors', 'description': 'Index finger brushes lips downward', 'difficulty': 'easy', 'usage': 'Color of blood, fire'},
-        'blue': {'category': 'colors', 'description': 'B-hand shakes slightly', 'difficulty': 'easy', 'usage': 'Color of sky, ocean'},
-        'green': {'category': 'colors', 'description': 'G-hand shakes slightly', 'difficulty': 'easy', 'usage': 'Color of grass, plants'},
-        'yellow': {'category': 'colors', 'description': 'Y-hand shakes slightly', 'difficulty': 'easy', 'usage': 'Color of sun, banana'},
-        'black': {'category': 'colors', 'description': 'Index finger across forehead', 'difficulty': 'easy', 'usage': 'Absence of color'},
-        'white': {'category': 'colors', 'description': 'Five-hand on chest, pull out', 'difficulty': 'medium', 'usage': 'Color of snow, milk'},
-        
-        # Numbers
-        'one': {'category': 'numbers', 'description': 'Index finger extended up', 'difficulty': 'easy', 'usage': 'Number 1'},
-        'two': {'category': 'numbers', 'description': 'Index and middle finger extended', 'difficulty': 'easy', 'usage': 'Number 2'},
-        'three': {'category': 'numbers', 'description': 'Thumb, index, middle finger extended', 'difficulty': 'easy', 'usage': 'Number 3'},
-        'five': {'category': 'numbers', 'description': 'All five fingers extended', 'difficulty': 'easy', 'usage': 'Number 5'},
-        'ten': {'category': 'numbers', 'description': 'Thumb up, shake slightly', 'difficulty': 'easy', 'usage': 'Number 10'},
-        
-        # Food
-        'water': {'category': 'food', 'description': 'W-hand taps chin', 'difficulty': 'easy', 'usage': 'Clear liquid'},
-        'milk': {'category': 'food', 'description': 'Squeeze fist alternately', 'difficulty': 'easy', 'usage': 'Dairy beverage'},
-        'bread': {'category': 'food', 'description': 'Knife hand slices other hand', 'difficulty': 'medium', 'usage': 'Baked food'}
-    }
+    return SignTable.from_records(collection_signs('precise_crop'))
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Precise manual cropping of sign language charts")
+    parser.add_argument('--max-error', type=float, default=DEFAULT_MAX_ERROR,
+                        help="Perceptual error bound for grayscale/palette PNG output")
+    parser.add_argument('--transparent', action='store_true',
+                        help="Write trimmed RGBA/LA signs with a transparent background")
+    parser.add_argument('--resample', choices=sorted(RESAMPLING_TIERS), default=DEFAULT_TIER,
+                        help="Resampling tier (fast/balanced for preview and CI builds)")
+    parser.add_argument('--size', type=int, default=200,
+                        help="Output size in pixels; small sizes allow reduced JPEG decoding")
+    parser.add_argument('--pretty', action='store_true',
+                        help="Write indented metadata JSON (for debugging)")
+    parser.add_argument('--pack', action='store_true',
+                        help="Also bundle all generated sign assets into signs.pack")
+    parser.add_argument('--inline', action='store_true',
+                        help="Embed small sign PNGs in the metadata as data URIs")
+    parser.add_argument('--inline-threshold', type=int, default=DEFAULT_INLINE_THRESHOLD,
+                        help="Largest PNG (bytes) embedded with --inline")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main function to process all images with precise manual cropping"""
+    args = parse_args(argv)
     print("Starting precise manual cropping of sign language images...")
     
     # Create directories
@@ -282,83 +262,83 @@ def main():
     mappings = get_sign_mappings()
     sign_data = get_sign_data()
     
-    all_processed_signs = []
+    # Unique processed signs (first occurrence wins), one column per field
+    processed = SignTable(CATALOG_FIELDS + ('source_image', 'grid_position'))
     successful_extractions = 0
+    encode_results = []
     
     # Process each image with its specific mapping
     for image_path, mapping in mappings.items():
         if os.path.exists(image_path):
-            extracted_signs = process_image_with_mapping(image_path, mapping)
+            extracted_signs = process_image_with_mapping(image_path, mapping, output_size=args.size)
             
             # Save each extracted sign
             for sign in extracted_signs:
-                if save_extracted_sign(sign):
+                info = save_extracted_sign(
+                    sign, max_error=args.max_error, transparent=args.transparent,
+                    size=args.size, tier=args.resample
+                )
+                if info:
                     successful_extractions += 1
+                    encode_results.append(info)
                     
-                    # Add to processed list with metadata
-                    sign_name = sign['name']
-                    if sign_name in sign_data:
-                        all_processed_signs.append({
-                            'name': sign_name,
-                            'category': sign_data[sign_name]['category'],
-                            'description': sign_data[sign_name]['description'],
-                            'difficulty': sign_data[sign_name]['difficulty'],
-                            'usage': sign_data[sign_name]['usage'],
-                            'source_image': image_path,
-                            'grid_position': sign['position']
-                        })
+                    # Add to processed table with metadata
+                    if sign.name in sign_data and sign.name not in processed:
+                        processed.append(
+                            sign.name, **sign_data[sign.name],
+                            source_image=image_path, grid_position=sign.position
+                        )
+                # The cropped pixels are no longer needed once saved
+                sign.image = None
             
             print(f"Processed {len(extracted_signs)} signs from {image_path}")
         else:
             print(f"Image not found: {image_path}")
     
-    # Remove duplicates (keep first occurrence)
-    unique_signs = {}
-    for sign in all_processed_signs:
-        if sign['name'] not in unique_signs:
-            unique_signs[sign['name']] = sign
-    
-    final_signs = list(unique_signs.values())
-    
-    # Create comprehensive metadata
-    metadata = {
-        'processing_method': 'manual_precise_cropping',
-        'total_unique_signs': len(final_signs),
-        'successful_extractions': successful_extractions,
-        'categories': list(set([sign['category'] for sign in final_signs])),
-        'difficulty_levels': list(set([sign['difficulty'] for sign in final_signs])),
-        'signs': {sign['name']: {
-            'category': sign['category'],
-            'description': sign['description'],
-            'difficulty': sign['difficulty'],
-            'usage': sign['usage'],
-            'source_image': sign['source_image'],
-            'grid_position': sign['grid_position']
-        } for sign in final_signs}
-    }
+    # Flag blank, clipped and gridline crops from the images as written to disk
+    suspects = suspect_crops([f"processed_signs/manual/{name}.png" for name in processed])
+    # Visually similar signs, for confusable-sign drills; computed over the
+    # whole common directory, as in signSimilarity.json
+    confusable = confusable_signs('common')
     
-    # Save metadata
+    # Stream metadata, with placeholders from the images as written to disk
     metadata_path = 'processed_signs/manual/precise_crop_metadata.json'
-    with open(metadata_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    image_paths = (f"processed_signs/manual/{name}.png" for name in processed)
+    with MetadataWriter([metadata_path], pretty=args.pretty) as writer:
+        writer.field('processing_method', 'manual_precise_cropping')
+        writer.field('total_unique_signs', len(processed))
+        writer.field('successful_extractions', successful_extractions)
+        writer.field('categories', processed.distinct('category'))
+        writer.field('difficulty_levels', processed.distinct('difficulty'))
+        writer.begin('signs')
+        for name, (path, placeholder) in zip(processed, iter_placeholders(image_paths)):
+            inline = inline_file(path, args.inline_threshold) if args.inline else {}
+            quality = {'quality_flags': suspects[name]} if name in suspects else {}
+            writer.entry(name, {**processed[name], **placeholder, **inline, **quality,
+                                'confusable_with': confusable.get(name, [])})
+        writer.end()
+        writer.field('voice_index', build_voice_index(processed))
     
     print(f"\n✅ Precise cropping complete!")
-    print(f"📊 Total unique signs: {len(final_signs)}")
+    print(f"📊 Total unique signs: {len(processed)}")
     print(f"📁 Successful extractions: {successful_extractions}")
-    print(f"📋 Categories: {len(metadata['categories'])}")
+    print(f"📋 Categories: {len(processed.distinct('category'))}")
     print(f"📝 Metadata saved to: {metadata_path}")
+    if suspects:
+        print(f"⚠️ {len(suspects)} suspect crops flagged in the metadata "
+              f"(see scripts/crop_quality.py): {', '.join(suspects)}")
     
     # Print summary by category
-    category_counts = {}
-    for sign in final_signs:
-        cat = sign['category']
-        category_counts[cat] = category_counts.get(cat, 0) + 1
-    
     print("\n📊 Signs by category:")
-    for category, count in sorted(category_counts.items()):
+    for category, count in sorted(processed.counts('category').items()):
         print(f"  {category}: {count} signs")
     
-    return final_signs
+    print_savings_report(encode_results)
+    
+    if args.pack:
+        build_pack()
+    
+    return processed
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
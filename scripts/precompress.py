@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Precompressed Asset Variants
+Writes .gz (and .br when the brotli package is installed) siblings next to
+text assets so static hosts can serve them without compressing per request.
+"""
+
+import os
+import gzip
+
+try:
+    import brotli
+except ImportError:  # Optional: only gzip variants are written without it
+    brotli = None
+
+# Outputs are written under this suffix and renamed into place when complete
+TEMP_SUFFIX = '.tmp'
+
+# Text asset types worth serving compressed; raster images already are
+COMPRESSIBLE_EXTENSIONS = ('.svg', '.json')
+
+def compress_variants(payload):
+    """
+    Return {extension: compressed_bytes} for every available encoding.
+
+    gzip output uses a fixed mtime so rebuilding unchanged content produces
+    byte-identical files (and stable cache revisions).
+    """
+    variants = {'.gz': gzip.compress(payload, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(payload, quality=11)
+    return variants
+
+def is_compressible(path):
+    """True for text asset types (SVG, JSON) worth serving compressed"""
+    return path.lower().endswith(COMPRESSIBLE_EXTENSIONS)
+
+def compressed_size(path):
+    """
+    Bytes a client downloads for path with compression: the smallest
+    precompressed sibling (or an in-memory compression when there is none)
+    for compressible types, the file size otherwise.
+    """
+    if not is_compressible(path):
+        return os.path.getsize(path)
+    sizes = [os.path.getsize(path + suffix) for suffix in ('.gz', '.br')
+             if os.path.exists(path + suffix)]
+    if not sizes:
+        with open(path, 'rb') as f:
+            sizes = [len(data) for data in compress_variants(f.read()).values()]
+    return min(sizes + [os.path.getsize(path)])
+
+def variant_paths(path, plain=True):
+    """path (unless plain=False) and the precompressed variants written for it"""
+    paths = [path] if plain else []
+    paths.append(path + '.gz')
+    if brotli is not None:
+        paths.append(path + '.br')
+    return paths
+
+def replace_temp_files(paths):
+    """Move every finished path + TEMP_SUFFIX into place"""
+    for path in paths:
+        os.replace(path + TEMP_SUFFIX, path)
+
+def remove_temp_files(paths):
+    """Delete the temporary files of an aborted write"""
+    for path in paths:
+        try:
+            os.remove(path + TEMP_SUFFIX)
+        except FileNotFoundError:
+            pass
+
+def write_with_variants(paths, payload):
+    """
+    Write payload and its precompressed variants to every path.
+
+    The payload is compressed once regardless of how many paths it fans out
+    to. Every file is written under a temporary name and only moved into
+    place once all of them are complete. Returns {path: size_in_bytes} for
+    every file written.
+    """
+    variants = [('', payload), *compress_variants(payload).items()]
+
+    written = {}
+    try:
+        for path in paths:
+            for suffix, data in variants:
+                with open(path + suffix + TEMP_SUFFIX, 'wb') as f:
+                    f.write(data)
+                written[path + suffix] = len(data)
+    except BaseException:
+        remove_temp_files(written)
+        raise
+    replace_temp_files(written)
+    return written
+
+class _GzipStream:
+    """Minimal binary file wrapper compressing writes with gzip"""
+
+    def __init__(self, path):
+        self._file = open(path, 'wb')
+        self._gzip = gzip.GzipFile(filename='', mode='wb', compresslevel=9,
+                                   fileobj=self._file, mtime=0)
+
+    def write(self, data):
+        self._gzip.write(data)
+
+    def close(self):
+        self._gzip.close()
+        self._file.close()
+
+class _BrotliStream:
+    """Minimal binary file wrapper compressing writes with brotli"""
+
+    def __init__(self, path):
+        self._file = open(path, 'wb')
+        self._compressor = brotli.Compressor(quality=11)
+
+    def write(self, data):
+        self._file.write(self._compressor.process(data))
+
+    def close(self):
+        self._file.write(self._compressor.finish())
+        self._file.close()
+
+def open_with_variants(path, plain=True, suffix=''):
+    """
+    Open path and its precompressed variants for streaming binary writes.
+
+    Returns a list of file-like sinks in variant_paths() order (plain, .gz
+    and, with brotli, .br), each opened at its path + suffix; write the same
+    bytes to each and close them all when done. With plain=False only the
+    compressed variants are opened. Like compress_variants, the gzip stream
+    has a fixed mtime so output is reproducible.
+    """
+    sinks = [open(path + suffix, 'wb')] if plain else []
+    sinks.append(_GzipStream(path + '.gz' + suffix))
+    if brotli is not None:
+        sinks.append(_BrotliStream(path + '.br' + suffix))
+    return sinks
+
+def copy_with_variants(source, paths, chunk_size=1 << 20):
+    """
+    Stream an already written file into its own .gz/.br variants and into
+    full copies (with variants) at every other path, in fixed-size chunks.
+    Outputs replace their targets only once the whole copy has succeeded.
+    Returns the size of the source in bytes.
+    """
+    targets = variant_paths(source, plain=False)
+    for path in paths:
+        if path != source:
+            targets.extend(variant_paths(path))
+
+    sinks = []
+    size = 0
+    try:
+        sinks.extend(open_with_variants(source, plain=False, suffix=TEMP_SUFFIX))
+        for path in paths:
+            if path != source:
+                sinks.extend(open_with_variants(path, suffix=TEMP_SUFFIX))
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                size += len(chunk)
+                for sink in sinks:
+                    sink.write(chunk)
+    except BaseException:
+        for sink in sinks:
+            sink.close()
+        remove_temp_files(targets)
+        raise
+    for sink in sinks:
+        sink.close()
+    replace_temp_files(targets)
+    return size
@@ -8,8 +8,16 @@ import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import os
-import json
+import argparse
 import matplotlib.pyplot as plt
+from image_decode import RESAMPLING_TIERS, DEFAULT_TIER, resize
+from placeholders import iter_placeholders
+from voice_index import build_voice_index
+from sign_catalog import collection_signs
+from sign_records import CroppedSign, SignTable
+from metadata_writer import MetadataWriter
+from crop_quality import suspect_crops
+from sign_similarity import confusable_signs
 
 def create_directories():
     """Create necessary directories for processed images"""
@@ -126,12 +134,11 @@ def process_common_signs_grid(img, signs_data):
             sign_region = img[y1:y2, x1:x2]
             
             if sign_region.size > 0:
-                extracted_signs.append({
-                    'name': sign_name,
-                    'image': sign_region,
-                    'category': signs_data.get(sign_name, {}).get('category', 'common'),
-                    'description': signs_data.get(sign_name, {}).get('description', f'Sign for {sign_name}')
-                })
+                extracted_signs.append(CroppedSign(
+                    sign_name, sign_region, position=(col, row),
+                    category=signs_data.get(sign_name, {}).get('category', 'common'),
+                    description=signs_data.get(sign_name, {}).get('description', f'Sign for {sign_name}')
+                ))
     
     return extracted_signs
 
@@ -168,12 +175,11 @@ def process_illustrated_signs(img, signs_data):
         sign_region = img[y1:y2, x1:x2]
         
         if sign_region.size > 0:
-            extracted_signs.append({
-                'name': sign_name,
-                'image': sign_region,
-                'category': signs_data.get(sign_name, {}).get('category', 'greetings'),
-                'description': signs_data.get(sign_name, {}).get('description', f'Illustrated sign for {sign_name}')
-            })
+            extracted_signs.append(CroppedSign(
+                sign_name, sign_region, position=(col, row),
+                category=signs_data.get(sign_name, {}).get('category', 'greetings'),
+                description=signs_data.get(sign_name, {}).get('description', f'Illustrated sign for {sign_name}')
+            ))
     
     return extracted_signs
 
@@ -213,30 +219,29 @@ def process_dictionary_chart(img, signs_data):
         sign_region = img[y1:y2, x1:x2]
         
         if sign_region.size > 0:
-            extracted_signs.append({
-                'name': sign_name,
-                'image': sign_region,
-                'category': signs_data.get(sign_name, {}).get('category', 'dictionary'),
-                'description': signs_data.get(sign_name, {}).get('description', f'Dictionary sign for {sign_name}')
-            })
+            extracted_signs.append(CroppedSign(
+                sign_name, sign_region, position=(col, row),
+                category=signs_data.get(sign_name, {}).get('category', 'dictionary'),
+                description=signs_data.get(sign_name, {}).get('description', f'Dictionary sign for {sign_name}')
+            ))
     
     return extracted_signs
 
-def save_extracted_signs(extracted_signs, source_image):
+def save_extracted_signs(extracted_signs, source_image, tier=DEFAULT_TIER):
     """Save extracted signs as individual image files"""
     saved_files = []
     
     for sign_data in extracted_signs:
-        name = sign_data['name']
-        image = sign_data['image']
-        category = sign_data['category']
+        name = sign_data.name
+        image = sign_data.image
+        category = sign_data.category
         
         # Convert BGR to RGB for PIL
         image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         pil_image = Image.fromarray(image_rgb)
         
         # Resize to standard size
-        pil_image = pil_image.resize((200, 200), Image.Resampling.LANCZOS)
+        pil_image = resize(pil_image, (200, 200), tier)
         
         # Create a clean background
         background = Image.new('RGB', (200, 200), 'white')
@@ -264,178 +269,25 @@ def save_extracted_signs(extracted_signs, source_image):
                 saved_files.append(path)
             except Exception as e:
                 print(f"Error saving {path}: {e}")
+        
+        # The cropped pixels are no longer needed once saved
+        sign_data.image = None
     
     return saved_files
 
 def create_common_signs_data():
     """Create comprehensive data structure for common signs"""
-    return {
-        'hello': {
-            'category': 'greetings',
-            'description': 'Flat hand at forehead, move forward slightly',
-            'difficulty': 'easy',
-            'usage': 'Standard greeting'
-        },
-        'thank_you': {
-            'category': 'greetings',
-            'description': 'Flat hand touches chin, moves forward',
-            'difficulty': 'easy',
-            'usage': 'Express gratitude'
-        },
-        'please': {
-            'category': 'greetings',
-            'description': 'Flat hand circles on chest',
-            'difficulty': 'easy',
-            'usage': 'Polite request'
-        },
-        'sorry': {
-            'category': 'greetings',
-            'description': 'Fist on chest, circular motion',
-            'difficulty': 'easy',
-            'usage': 'Apologize'
-        },
-        'goodbye': {
-            'category': 'greetings',
-            'description': 'Wave hand or finger wiggle',
-            'difficulty': 'easy',
-            'usage': 'Farewell'
-        },
-        'yes': {
-            'category': 'responses',
-            'description': 'Fist nods up and down',
-            'difficulty': 'easy',
-            'usage': 'Affirmative response'
-        },
-        'no': {
-            'category': 'responses',
-            'description': 'Index and middle finger close on thumb',
-            'difficulty': 'easy',
-            'usage': 'Negative response'
-        },
-        'mother': {
-            'category': 'family',
-            'description': 'Thumb touches chin',
-            'difficulty': 'easy',
-            'usage': 'Female parent'
-        },
-        'father': {
-            'category': 'family',
-            'description': 'Thumb touches forehead',
-            'difficulty': 'easy',
-            'usage': 'Male parent'
-        },
-        'family': {
-            'category': 'family',
-            'description': 'F-hands form circle',
-            'difficulty': 'medium',
-            'usage': 'Related people'
-        },
-        'friend': {
-            'category': 'family',
-            'description': 'Index fingers hook together',
-            'difficulty': 'medium',
-            'usage': 'Close companion'
-        },
-        'help': {
-            'category': 'actions',
-            'description': 'Fist on flat palm, lift together',
-            'difficulty': 'medium',
-            'usage': 'Assist someone'
-        },
-        'love': {
-            'category': 'emotions',
-            'description': 'Cross arms over chest',
-            'difficulty': 'easy',
-            'usage': 'Deep affection'
-        },
-        'eat': {
-            'category': 'actions',
-            'description': 'Fingertips to mouth repeatedly',
-            'difficulty': 'easy',
-            'usage': 'Consume food'
-        },
-        'drink': {
-            'category': 'actions',
-            'description': 'C-hand to mouth, tilt up',
-            'difficulty': 'easy',
-            'usage': 'Consume liquid'
-        },
-        'water': {
-            'category': 'food',
-            'description': 'W-hand taps chin',
-            'difficulty': 'easy',
-            'usage': 'Clear liquid'
-        },
-        'more': {
-            'category': 'quantity',
-            'description': 'Fingertips tap together',
-            'difficulty': 'easy',
-            'usage': 'Additional amount'
-        },
-        'finished': {
-            'category': 'actions',
-            'description': 'Five-hands flip down',
-            'difficulty': 'medium',
-            'usage': 'Completed, done'
-        },
-        'good': {
-            'category': 'descriptive',
-            'description': 'Flat hand from chin moves down',
-            'difficulty': 'easy',
-            'usage': 'Positive quality'
-        },
-        'bad': {
-            'category': 'descriptive',
-            'description': 'Flat hand flips down from chin',
-            'difficulty': 'easy',
-            'usage': 'Negative quality'
-        },
-        'happy': {
-            'category': 'emotions',
-            'description': 'Flat hands brush up chest',
-            'difficulty': 'easy',
-            'usage': 'Joyful feeling'
-        },
-        'sad': {
-            'category': 'emotions',
-            'description': 'Five-hands slide down face',
-            'difficulty': 'easy',
-            'usage': 'Sorrowful feeling'
-        },
-        'hot': {
-            'category': 'descriptive',
-            'description': 'Claw hand turns away from mouth',
-            'difficulty': 'medium',
-            'usage': 'High temperature'
-        },
-        'cold': {
-            'category': 'descriptive',
-            'description': 'S-hands shake (shivering)',
-            'difficulty': 'easy',
-            'usage': 'Low temperature'
-        },
-        'big': {
-            'category': 'descriptive',
-            'description': 'L-hands spread apart',
-            'difficulty': 'easy',
-            'usage': 'Large size'
-        },
-        'small': {
-            'category': 'descriptive',
-            'description': 'Flat hands close together',
-            'difficulty': 'easy',
-            'usage': 'Little size'
-        },
-        'beautiful': {
-            'category': 'descriptive',
-            'description': 'Five-hand circles face, closes to O',
-            'difficulty': 'medium',
-            'usage': 'Aesthetically pleasing'
-        }
-    }
+    return SignTable.from_records(collection_signs('common'))
 
-def main():
+def main(argv=None):
     """Main function to process all uploaded sign language images"""
+    parser = argparse.ArgumentParser(description="Crop common signs from uploaded charts")
+    parser.add_argument('--resample', choices=sorted(RESAMPLING_TIERS), default=DEFAULT_TIER,
+                        help="Resampling tier (fast/balanced for preview and CI builds)")
+    parser.add_argument('--pretty', action='store_true',
+                        help="Write indented metadata JSON (for debugging)")
+    args = parser.parse_args(argv)
+    
     print("Processing uploaded sign language images for Common Signs tab...")
     
     # Create directories
@@ -462,29 +314,46 @@ def main():
             all_extracted_signs.extend(extracted_signs)
             
             # Save extracted signs
-            saved_files = save_extracted_signs(extracted_signs, image_path)
+            saved_files = save_extracted_signs(extracted_signs, image_path, tier=args.resample)
             print(f"Extracted {len(extracted_signs)} signs from {image_path}")
         else:
             print(f"Image not found: {image_path}")
     
-    # Create metadata file
-    metadata = {
-        'total_signs': len(all_extracted_signs),
-        'categories': list(set([sign['category'] for sign in all_extracted_signs])),
-        'signs': {sign['name']: {
-            'category': sign['category'],
-            'description': sign['description']
-        } for sign in all_extracted_signs}
-    }
-    
-    # Save metadata
-    with open('processed_signs/common_signs_metadata.json', 'w') as f:
-        json.dump(metadata, f, indent=2)
+    # Later crops of the same sign overwrite its image, so their fields win
+    unique_signs = {}
+    for sign in all_extracted_signs:
+        unique_signs[sign.name] = sign
+    
+    # Flag blank, clipped and gridline crops from the images as written to disk
+    suspects = suspect_crops([f"processed_signs/{name}.png" for name in unique_signs])
+    # Visually similar signs, for confusable-sign drills; computed over the
+    # whole common directory, as in signSimilarity.json
+    confusable = confusable_signs('common')
+    
+    # Stream metadata, with placeholders from the images as written to disk
+    image_paths = (f"processed_signs/{name}.png" for name in unique_signs)
+    with MetadataWriter(['processed_signs/common_signs_metadata.json'], pretty=args.pretty) as writer:
+        writer.field('total_signs', len(all_extracted_signs))
+        writer.field('categories', list(dict.fromkeys(sign.category for sign in all_extracted_signs)))
+        writer.begin('signs')
+        for sign, (_, placeholder) in zip(unique_signs.values(), iter_placeholders(image_paths)):
+            writer.entry(sign.name, {
+                'category': sign.category,
+                'description': sign.description,
+                **placeholder,
+                **({'quality_flags': suspects[sign.name]} if sign.name in suspects else {}),
+                'confusable_with': confusable.get(sign.name, [])
+            })
+        writer.end()
+        writer.field('voice_index', build_voice_index(unique_signs))
     
     print(f"\n✅ Processing complete!")
     print(f"📊 Total signs extracted: {len(all_extracted_signs)}")
     print(f"📁 Images saved to: public/images/signs/common/")
     print(f"📝 Metadata saved to: processed_signs/common_signs_metadata.json")
+    if suspects:
+        print(f"⚠️ {len(suspects)} suspect crops flagged in the metadata "
+              f"(see scripts/crop_quality.py): {', '.join(suspects)}")
     
     return all_extracted_signs
 
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Dictionary Search Index
+Builds a precomputed inverted index over the sign dictionary so the frontend
+search becomes a handful of dictionary lookups instead of a scan over every
+sign's word, description and usage on each keystroke.
+"""
+
+import re
+import unicodedata
+
+# Longest prefix indexed per token; longer queries fall back to 'terms'
+MAX_PREFIX_LENGTH = 8
+
+# Text fields (besides the sign name) that are searchable
+SEARCH_FIELDS = ('description', 'usage')
+
+def normalize_text(text):
+    """Lowercase, strip accents and turn punctuation/underscores into spaces"""
+    text = unicodedata.normalize('NFKD', str(text))
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return re.sub(r'[^a-z0-9]+', ' ', text.lower()).strip()
+
+def tokenize(text):
+    """Split text into normalized search tokens"""
+    return normalize_text(text).split()
+
+def _postings(mapping):
+    """Freeze a token -> set(ids) mapping into sorted, JSON-friendly lists"""
+    return {token: sorted(ids) for token, ids in sorted(mapping.items())}
+
+def _sign_tokens(sign_id, data, fields=SEARCH_FIELDS):
+    """Every search token of one sign (name and text fields)"""
+    tokens = set(tokenize(sign_id))
+    for field in fields:
+        tokens.update(tokenize(data.get(field, '')))
+    return tokens
+
+def build_search_index(signs, fields=SEARCH_FIELDS):
+    """
+    Build the inverted index for a {sign_id: data} dictionary.
+
+    Sign ids are replaced by their position in the 'ids' list so postings stay
+    compact. The index contains:
+        ids:          sign ids in posting order
+        names:        token -> signs whose name contains the token
+        terms:        token -> signs whose name or text fields contain it
+        prefixes:     token prefix (1..MAX_PREFIX_LENGTH chars) -> signs
+        categories:   category -> signs
+        difficulties: difficulty -> signs
+    """
+    ids = list(signs)
+    names, terms, prefixes = {}, {}, {}
+    categories, difficulties = {}, {}
+
+    for ordinal, sign_id in enumerate(ids):
+        data = signs[sign_id]
+
+        name_tokens = tokenize(sign_id)
+        tokens = _sign_tokens(sign_id, data, fields)
+
+        for token in name_tokens:
+            names.setdefault(token, set()).add(ordinal)
+        for token in tokens:
+            terms.setdefault(token, set()).add(ordinal)
+            for length in range(1, min(len(token), MAX_PREFIX_LENGTH) + 1):
+                prefixes.setdefault(token[:length], set()).add(ordinal)
+
+        if data.get('category'):
+            categories.setdefault(data['category'], set()).add(ordinal)
+        if data.get('difficulty'):
+            difficulties.setdefault(data['difficulty'], set()).add(ordinal)
+
+    return {
+        'ids': ids,
+        'max_prefix_length': MAX_PREFIX_LENGTH,
+        'names': _postings(names),
+        'terms': _postings(terms),
+        'prefixes': _postings(prefixes),
+        'categories': _postings(categories),
+        'difficulties': _postings(difficulties)
+    }
+
+def search(index, query, category=None, difficulty=None):
+    """
+    Look up a query in a built index, the same way the frontend does.
+
+    Every query token must match (the last one as a prefix, so partial typing
+    works); results are sign ids with name matches first. A last token longer
+    than max_prefix_length has no prefix entry, so it matches the postings of
+    every full term it starts.
+    """
+    tokens = tokenize(query)
+    matches = set(range(len(index['ids'])))
+    max_prefix_length = index['max_prefix_length']
+
+    for position, token in enumerate(tokens):
+        is_last = position == len(tokens) - 1
+        if is_last:
+            if len(token) > max_prefix_length:
+                postings = [ordinal for term, ordinals in index['terms'].items()
+                            if term.startswith(token) for ordinal in ordinals]
+            else:
+                postings = index['prefixes'].get(token, [])
+        else:
+            postings = index['terms'].get(token, [])
+        matches &= set(postings)
+
+    if category:
+        matches &= set(index['categories'].get(category, []))
+    if difficulty:
+        matches &= set(index['difficulties'].get(difficulty, []))
+
+    name_hits = {ordinal for token in tokens for ordinal in index['names'].get(token, [])}
+    ranked = sorted(matches, key=lambda ordinal: (ordinal not in name_hits, ordinal))
+    return [index['ids'][ordinal] for ordinal in ranked]
@@ -6,11 +6,23 @@ Processes the ASL hand sign PNG files and sets them up for the website.
 
 import os
 import shutil
-from PIL import Image
+import argparse
+from png_encoder import DEFAULT_MAX_ERROR, write_png, print_savings_report
+from image_decode import RESAMPLING_TIERS, DEFAULT_TIER
+from normalize_images import normalize_images
+from asset_pack import build_pack
 
-def process_asl_images():
+def process_asl_images(max_error=DEFAULT_MAX_ERROR, transparent=False, tier=DEFAULT_TIER,
+                       workers=None):
     """
     Process all ASL hand sign images and set them up for the website.
+    
+    Args:
+        max_error (float): Perceptual error bound for grayscale/palette PNG output
+        transparent (bool): Keep a trimmed transparent background instead of
+            flattening onto a white 150x150 canvas
+        tier (str): Resampling tier from image_decode.RESAMPLING_TIERS
+        workers (int): Process pool size for normalization (None = all CPUs)
     """
     
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -27,55 +39,48 @@ def process_asl_images():
         os.makedirs(output_dir, exist_ok=True)
         print(f"Created directory: {output_dir}")
     
-    # Process each letter A-Z
+    # Collect each letter A-Z that is present
     letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-    processed_count = 0
+    found_letters = []
     
     for letter in letters:
         input_file = os.path.join(input_dir, f"{letter}.png")
-        
         if os.path.exists(input_file):
-            print(f"Processing {letter}.png...")
-            
-            try:
-                # Open and process the image
-                with Image.open(input_file) as img:
-                    # Convert to RGB if needed (remove transparency)
-                    if img.mode in ('RGBA', 'LA', 'P'):
-                        # Create white background
-                        background = Image.new('RGB', img.size, (255, 255, 255))
-                        if img.mode == 'P':
-                            img = img.convert('RGBA')
-                        if img.mode in ('RGBA', 'LA'):
-                            background.paste(img, mask=img.split()[-1])
-                        else:
-                            background.paste(img)
-                        img = background
-                    
-                    # Resize to standard size while maintaining aspect ratio
-                    img.thumbnail((150, 150), Image.Resampling.LANCZOS)
-                    
-                    # Create a white background and center the image
-                    final_img = Image.new('RGB', (150, 150), (255, 255, 255))
-                    x = (150 - img.width) // 2
-                    y = (150 - img.height) // 2
-                    final_img.paste(img, (x, y))
-                    
-                    # Save to all output directories with lowercase filename
-                    lowercase_filename = f"{letter.lower()}.png"
-                    
-                    for output_dir in output_dirs:
-                        output_path = os.path.join(output_dir, lowercase_filename)
-                        final_img.save(output_path, "PNG", quality=95, optimize=True)
-                        print(f"  ✅ Saved to: {output_path}")
-                    
-                    processed_count += 1
-                    
-            except Exception as e:
-                print(f"  ❌ Error processing {letter}.png: {e}")
+            found_letters.append(letter)
         else:
             print(f"  ⚠️ File not found: {input_file}")
     
+    # Normalize (and encode) the whole set in batches across the pool
+    input_files = [os.path.join(input_dir, f"{letter}.png") for letter in found_letters]
+    results = normalize_images(
+        input_files, size=150, tier=tier, transparent=transparent,
+        max_error=max_error, workers=workers
+    )
+    
+    processed_count = 0
+    encode_results = []
+    
+    for letter, result in zip(found_letters, results):
+        print(f"Processing {letter}.png...")
+        
+        if result['error']:
+            print(f"  ❌ Error processing {letter}.png: {result['error']}")
+            continue
+        
+        # Save to all output directories with lowercase filename
+        lowercase_filename = f"{letter.lower()}.png"
+        output_paths = [
+            os.path.join(output_dir, lowercase_filename)
+            for output_dir in output_dirs
+        ]
+        
+        info = write_png(result['png'], result['info'], output_paths)
+        encode_results.append(info)
+        
+        processed_count += 1
+    
+    print_savings_report(encode_results)
+    
     return processed_count
 
 def verify_installation():
@@ -141,20 +146,42 @@ def cleanup_original_files():
     return moved_count
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Set up ASL alphabet images for the website")
+    parser.add_argument('--max-error', type=float, default=DEFAULT_MAX_ERROR,
+                        help="Perceptual error bound for grayscale/palette PNG output")
+    parser.add_argument('--transparent', action='store_true',
+                        help="Write trimmed RGBA/LA images with a transparent background")
+    parser.add_argument('--resample', choices=sorted(RESAMPLING_TIERS), default=DEFAULT_TIER,
+                        help="Resampling tier (fast/balanced for preview and CI builds)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes for normalization (default: all CPUs)")
+    parser.add_argument('--pack', action='store_true',
+                        help="Also bundle all generated sign assets into signs.pack")
+    args = parser.parse_args()
+    
     print("🖼️ ASL Hand Sign Image Setup")
     print("=" * 50)
     
     # Process all images
-    processed = process_asl_images()
+    processed = process_asl_images(
+        max_error=args.max_error, transparent=args.transparent, tier=args.resample,
+        workers=args.workers
+    )
     print(f"\n📊 Processed {processed} ASL hand sign images")
     
+    if args.pack:
+        build_pack()
+    
     # Verify installation
     success = verify_installation()
     
     if success:
         print("\n🌐 Website Integration:")
         print("✅ Images are now ready for the React application")
-        print("✅ All images converted to 150x150 PNG format")
+        if args.transparent:
+            print("✅ All images converted to trimmed transparent PNGs (max 150x150)")
+        else:
+            print("✅ All images converted to 150x150 PNG format")
         print("✅ Accessible via /images/signs/alphabet/[letter].png")
         print("\n🎯 Next Steps:")
         print("1. Visit http://localhost:3000/deaf/alphabet")
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Sign Catalog
+Single source of truth for sign metadata (category, description, difficulty,
+usage) shared by the crop, common-signs and dictionary pipelines.
+
+The canonical source is scripts/data/sign_catalog.json. It is compiled once
+into an indexed form (per-collection records and category postings) and
+cached as a pickle, so scripts load it in milliseconds instead of rebuilding
+their own dicts. The assets each sign has produced are not cached: they are
+rescanned on demand (one os.scandir per output directory), so their sizes
+always match the files on disk.
+"""
+
+import os
+import json
+import pickle
+import argparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CATALOG_SOURCE = os.path.join(PROJECT_ROOT, 'scripts', 'data', 'sign_catalog.json')
+CATALOG_CACHE = os.path.join(PROJECT_ROOT, 'processed_signs', 'cache', 'sign_catalog.pickle')
+
+CATALOG_FIELDS = ('category', 'description', 'difficulty', 'usage')
+
+# Output directories scanned for each sign's produced assets (kind -> dirs)
+ASSET_DIRS = {
+    'common': ['public/images/signs/common', 'frontend/public/images/signs/common'],
+    'dictionary': ['public/images/signs/dictionary', 'frontend/public/images/signs/dictionary'],
+    'alphabet': ['public/images/signs/alphabet', 'frontend/public/images/signs/alphabet'],
+    'processed': ['processed_signs/manual', 'processed_signs']
+}
+
+ASSET_EXTENSIONS = ('.png', '.svg', '.jpg', '.jpeg', '.webp')
+
+_compiled = None
+
+def _cache_key():
+    """Stat signature of the catalog source"""
+    stat = os.stat(CATALOG_SOURCE)
+    return (CATALOG_SOURCE, stat.st_mtime_ns, stat.st_size)
+
+def scan_assets():
+    """
+    Map sign names to the asset files produced for them.
+
+    One os.scandir pass per output directory; a file belongs to the sign
+    whose name matches its stem (e.g. thank_you.png -> thank_you).
+    """
+    assets = {}
+    for kind, directories in ASSET_DIRS.items():
+        for directory in directories:
+            full_dir = os.path.join(PROJECT_ROOT, directory)
+            if not os.path.isdir(full_dir):
+                continue
+            with os.scandir(full_dir) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext.lower() not in ASSET_EXTENSIONS or not entry.is_file():
+                        continue
+                    assets.setdefault(stem.lower(), []).append({
+                        'kind': kind,
+                        'path': f"{directory}/{entry.name}",
+                        'bytes': entry.stat().st_size
+                    })
+    return assets
+
+def compile_catalog(source):
+    """
+    Compile the raw catalog source into its indexed form.
+
+    Each collection gets fully resolved records (base fields plus that
+    collection's overrides) in the collection's own order, and a
+    category -> names index.
+    """
+    signs = source['signs']
+
+    collections = {}
+    by_category = {}
+    for collection_name, names in source['collections'].items():
+        records = {}
+        categories = {}
+        for name in names:
+            base = signs[name]
+            record = {field: base[field] for field in CATALOG_FIELDS}
+            record.update(base.get('overrides', {}).get(collection_name, {}))
+            records[name] = record
+            categories.setdefault(record['category'], []).append(name)
+        collections[collection_name] = records
+        by_category[collection_name] = categories
+
+    membership = {name: [] for name in signs}
+    for collection_name, names in source['collections'].items():
+        for name in names:
+            membership[name].append(collection_name)
+
+    return {
+        'signs': {name: {field: data[field] for field in CATALOG_FIELDS} for name, data in signs.items()},
+        'collections': collections,
+        'by_category': by_category,
+        'membership': membership
+    }
+
+def load_catalog(refresh=False):
+    """
+    Load the compiled catalog, recompiling only when the source changed (or
+    refresh is True).
+    """
+    global _compiled
+
+    key = _cache_key()
+    if not refresh and _compiled is not None and _compiled['key'] == key:
+        return _compiled
+
+    if not refresh and os.path.exists(CATALOG_CACHE):
+        try:
+            with open(CATALOG_CACHE, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('key') == key:
+                _compiled = cached
+                return _compiled
+        except Exception:
+            pass  # Corrupt or incompatible cache: rebuild below
+
+    with open(CATALOG_SOURCE, 'r', encoding='utf-8') as f:
+        compiled = compile_catalog(json.load(f))
+    compiled['key'] = key
+
+    try:
+        os.makedirs(os.path.dirname(CATALOG_CACHE), exist_ok=True)
+        with open(CATALOG_CACHE, 'wb') as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"⚠️ Could not write catalog cache: {e}")
+
+    _compiled = compiled
+    return _compiled
+
+def collection_signs(collection_name):
+    """
+    Resolved {name: {category, description, difficulty, usage}} records for
+    one collection ('precise_crop', 'common' or 'dictionary'), in order.
+
+    Returns copies, so callers may modify them freely.
+    """
+    records = load_catalog()['collections'][collection_name]
+    return {name: dict(record) for name, record in records.items()}
+
+def get_sign(name, collection_name=None):
+    """Look up one sign, resolved for a collection if given; None if unknown"""
+    catalog = load_catalog()
+    if collection_name is not None:
+        record = catalog['collections'][collection_name].get(name)
+    else:
+        record = catalog['signs'].get(name)
+    return dict(record) if record is not None else None
+
+def signs_in_category(category, collection_name):
+    """Names of the signs in a category within a collection"""
+    return list(load_catalog()['by_category'][collection_name].get(category, []))
+
+def assets_for(name):
+    """Asset files (kind, path, bytes) produced for a sign, as currently on disk"""
+    return scan_assets().get(name, [])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile and summarize the sign catalog")
+    parser.add_argument('--refresh', action='store_true', help="Ignore the cache and recompile")
+    parser.add_argument('--sign', help="Show one sign with its collections and assets")
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog(refresh=args.refresh)
+
+    if args.sign:
+        if args.sign not in catalog['signs']:
+            print(f"❌ Unknown sign: {args.sign}")
+            return 1
+        print(json.dumps({
+            'sign': catalog['signs'][args.sign],
+            'collections': {name: catalog['collections'][name][args.sign]
+                            for name in catalog['membership'][args.sign]},
+            'assets': assets_for(args.sign)
+        }, indent=2))
+        return 0
+
+    print("📚 Sign Catalog")
+    print("=" * 50)
+    print(f"Signs: {len(catalog['signs'])}")
+    for collection_name, records in catalog['collections'].items():
+        categories = catalog['by_category'][collection_name]
+        print(f"  {collection_name}: {len(records)} signs in {len(categories)} categories")
+    assets = scan_assets()
+    with_assets = sum(1 for name in catalog['signs'] if name in assets)
+    print(f"Signs with produced assets: {with_assets}/{len(catalog['signs'])}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
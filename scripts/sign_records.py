@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Compact Sign Records
+Memory-lean representations for signs moving through the crop, metadata and
+export pipelines:
+
+    CroppedSign  a __slots__ record for one freshly cropped sign (the image
+                 is only held until it is saved)
+    SignTable    struct-of-arrays sign metadata: one column per field, with
+                 category, difficulty and source stored as small integer codes
+
+SignTable is a read-only mapping of sign name -> row dict, so it can be passed
+anywhere the pipelines used a {name: {...}} dict (search and voice indexes,
+JSON export) while holding one list/array per column instead of one dict per
+sign.
+"""
+
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Mapping
+from sign_catalog import CATALOG_FIELDS
+
+# Columns whose values repeat across signs and are stored as integer codes
+CODED_COLUMNS = ('category', 'difficulty', 'source_image')
+
+class CroppedSign:
+    """One sign cropped from a chart, before it is saved"""
+
+    __slots__ = ('name', 'image', 'source', 'position', 'category', 'description')
+
+    def __init__(self, name, image, source=None, position=None, category=None, description=None):
+        self.name = sys.intern(name)
+        self.image = image
+        self.source = source
+        self.position = position
+        self.category = category
+        self.description = description
+
+    def __repr__(self):
+        return f"CroppedSign({self.name!r}, source={self.source!r}, position={self.position!r})"
+
+class CodeBook:
+    """Interns repeated string values as small integer codes"""
+
+    __slots__ = ('values', '_codes')
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def encode(self, value):
+        """Code for value, assigning the next one on first sight"""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(sys.intern(value) if isinstance(value, str) else value)
+            self._codes[value] = code
+        return code
+
+    def decode(self, code):
+        return self.values[code]
+
+class SignTable(Mapping):
+    """
+    Struct-of-arrays sign records.
+
+    Coded columns live in array('H') code columns backed by a CodeBook, the
+    grid position in an array('h') of (col, row) pairs and free text in plain
+    lists. Rows are only materialized as dicts when looked up, in column order,
+    so exported JSON is unchanged from the dict-based pipelines.
+    """
+
+    def __init__(self, columns=CATALOG_FIELDS):
+        self.columns = tuple(columns)
+        self.names = []
+        self._rows = {}
+        self._codebooks = {}
+        self._data = {}
+        for column in self.columns:
+            if column in CODED_COLUMNS:
+                self._codebooks[column] = CodeBook()
+                self._data[column] = array('H')
+            elif column == 'grid_position':
+                self._data[column] = array('h')
+            else:
+                self._data[column] = []
+
+    @classmethod
+    def from_records(cls, records, columns=CATALOG_FIELDS):
+        """Build a table from a {name: {field: value}} dict"""
+        table = cls(columns)
+        for name, record in records.items():
+            table.append(name, **record)
+        return table
+
+    def append(self, name, **values):
+        """
+        Add a sign; missing columns are stored as None (coded/text columns)
+        or (-1, -1) (grid_position). Returns the row number.
+        """
+        if name in self._rows:
+            raise ValueError(f"Duplicate sign: {name}")
+
+        row = len(self.names)
+        self.names.append(sys.intern(name))
+        self._rows[self.names[row]] = row
+
+        for column in self.columns:
+            value = values.get(column)
+            if column in self._codebooks:
+                self._data[column].append(self._codebooks[column].encode(value))
+            elif column == 'grid_position':
+                self._data[column].extend(value if value is not None else (-1, -1))
+            else:
+                self._data[column].append(value)
+        return row
+
+    def value(self, row, column):
+        """Decoded value of one cell"""
+        if column in self._codebooks:
+            return self._codebooks[column].decode(self._data[column][row])
+        if column == 'grid_position':
+            col, grid_row = self._data[column][2 * row:2 * row + 2]
+            return None if col < 0 else [col, grid_row]
+        return self._data[column][row]
+
+    def row(self, name):
+        """Row number of a sign"""
+        return self._rows[name]
+
+    def column(self, column):
+        """All decoded values of a column, in row order"""
+        return [self.value(row, column) for row in range(len(self.names))]
+
+    def distinct(self, column):
+        """Distinct values of a coded column, in order of first appearance"""
+        return list(self._codebooks[column].values)
+
+    def counts(self, column):
+        """{value: number of signs} for a coded column"""
+        codebook = self._codebooks[column]
+        return {codebook.decode(code): count
+                for code, count in Counter(self._data[column]).items()}
+
+    def __getitem__(self, name):
+        row = self._rows[name]
+        return {column: self.value(row, column) for column in self.columns}
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._rows
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Sign Similarity Index
+Precomputes which signs look alike (e.g. the A/S/E or M/N handshapes) so the
+practice and flashcard modes can serve confusable-sign drills without any
+image analysis in the browser.
+
+Each produced sign image gets a compact HOG-style descriptor: the ink is
+cropped and letterboxed onto a square, gradients are binned by orientation
+per cell, and the vector is L2-normalised. Descriptors of a collection are
+stacked into one matrix, so all pairwise cosine similarities are a single
+matrix product and each sign's top-k neighbours come from argpartition.
+
+This script writes signSimilarity.json next to the sign image directories
+for the common and alphabet sets. The crop pipelines record
+'confusable_with' in their metadata entries from the same index over the
+whole common directory (not just the signs of their own run), so the two
+outputs agree.
+"""
+
+import os
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import cv2
+import numpy as np
+from sign_catalog import PROJECT_ROOT, ASSET_DIRS
+from crop_quality import INK_THRESHOLD, load_gray
+
+SIMILARITY_NAME = 'signSimilarity.json'
+SIMILARITY_KINDS = ('common', 'alphabet')
+
+DESCRIPTOR_SIZE = 64
+CELL_SIZE = 8
+ORIENTATION_BINS = 9
+
+DEFAULT_TOP_K = 3
+# Neighbours less similar than this are not worth drilling against
+DEFAULT_MIN_SIMILARITY = 0.5
+
+def _normalized_ink(gray, size=DESCRIPTOR_SIZE):
+    """Crop to the ink bounding box and letterbox it onto a white size x size square"""
+    ys, xs = np.nonzero(gray < INK_THRESHOLD)
+    if len(ys):
+        gray = gray[ys.min():ys.max() + 1, xs.min():xs.max() + 1]
+    height, width = gray.shape
+    scale = size / max(height, width)
+    resized = cv2.resize(gray, (max(1, round(width * scale)), max(1, round(height * scale))),
+                         interpolation=cv2.INTER_AREA)
+    square = np.full((size, size), 255, dtype=np.uint8)
+    top, left = (size - resized.shape[0]) // 2, (size - resized.shape[1]) // 2
+    square[top:top + resized.shape[0], left:left + resized.shape[1]] = resized
+    return square
+
+def describe(gray):
+    """
+    HOG-style descriptor of a grayscale sign image: unsigned gradient
+    orientations in ORIENTATION_BINS bins per CELL_SIZE cell, weighted by
+    magnitude, each cell and then the whole vector L2-normalised.
+    """
+    image = _normalized_ink(gray).astype(np.float32) / 255
+    gx = cv2.Sobel(image, cv2.CV_32F, 1, 0, ksize=3)
+    gy = cv2.Sobel(image, cv2.CV_32F, 0, 1, ksize=3)
+    magnitude, angle = cv2.cartToPolar(gx, gy)
+
+    bins = (np.mod(angle, np.pi) / np.pi * ORIENTATION_BINS).astype(np.int32) % ORIENTATION_BINS
+    votes = np.zeros((DESCRIPTOR_SIZE, DESCRIPTOR_SIZE, ORIENTATION_BINS), dtype=np.float32)
+    np.put_along_axis(votes, bins[..., None], magnitude[..., None], axis=2)
+
+    cells = DESCRIPTOR_SIZE // CELL_SIZE
+    histogram = votes.reshape(cells, CELL_SIZE, cells, CELL_SIZE, ORIENTATION_BINS).sum(axis=(1, 3))
+    histogram /= np.linalg.norm(histogram, axis=2, keepdims=True) + 1e-6
+    vector = histogram.ravel()
+    return vector / (np.linalg.norm(vector) + 1e-6)
+
+def describe_file(path):
+    """(path, descriptor), or (path, None) for an unreadable image"""
+    try:
+        return path, describe(load_gray(path))
+    except ValueError:
+        return path, None
+
+def describe_files(paths, workers=None):
+    """{sign name: descriptor} for the readable images among paths, computed in a process pool"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(describe_file, paths, chunksize=16))
+    return {
+        os.path.splitext(os.path.basename(path))[0]: descriptor
+        for path, descriptor in results if descriptor is not None
+    }
+
+def nearest_neighbours(descriptors, k=DEFAULT_TOP_K, min_similarity=DEFAULT_MIN_SIMILARITY):
+    """
+    Top-k most similar signs for every sign in {name: descriptor}.
+
+    Returns {name: [(other name, cosine similarity)]}, most similar first,
+    leaving out neighbours below min_similarity.
+    """
+    names = list(descriptors)
+    if len(names) < 2:
+        return {name: [] for name in names}
+    k = min(k, len(names) - 1)
+
+    matrix = np.stack([descriptors[name] for name in names])
+    similarity = matrix @ matrix.T
+    np.fill_diagonal(similarity, -np.inf)
+
+    top = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+    scores = np.take_along_axis(similarity, top, axis=1)
+    order = np.argsort(-scores, axis=1)
+    top, scores = np.take_along_axis(top, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+    return {
+        name: [(names[j], round(float(score), 4)) for j, score in zip(top[i], scores[i])
+               if score >= min_similarity]
+        for i, name in enumerate(names)
+    }
+
+def kind_images(kind):
+    """PNG images of an output kind (its first, canonical directory)"""
+    directory = os.path.join(PROJECT_ROOT, ASSET_DIRS[kind][0])
+    if not os.path.isdir(directory):
+        return []
+    with os.scandir(directory) as entries:
+        return sorted(entry.path for entry in entries
+                      if entry.name.lower().endswith('.png') and entry.is_file())
+
+def build_similarity_index(kinds=SIMILARITY_KINDS, k=DEFAULT_TOP_K,
+                           min_similarity=DEFAULT_MIN_SIMILARITY, workers=None):
+    """{kind: {sign name: [{'sign', 'similarity'}]}} for every kind with images"""
+    index = {}
+    for kind in kinds:
+        paths = kind_images(kind)
+        if not paths:
+            continue
+        neighbours = nearest_neighbours(describe_files(paths, workers), k, min_similarity)
+        index[kind] = {
+            name: [{'sign': other, 'similarity': score} for other, score in others]
+            for name, others in neighbours.items()
+        }
+    return index
+
+def confusable_signs(kind, k=DEFAULT_TOP_K, min_similarity=DEFAULT_MIN_SIMILARITY, workers=None):
+    """{sign name: [confusable sign names]} over every image of an output kind"""
+    neighbours = build_similarity_index([kind], k, min_similarity, workers).get(kind, {})
+    return {name: [other['sign'] for other in others] for name, others in neighbours.items()}
+
+def similarity_paths():
+    """signSimilarity.json in the parent of each image directory (public and frontend/public)"""
+    parents = {os.path.dirname(directory) for directory in ASSET_DIRS['common']}
+    return [os.path.join(PROJECT_ROOT, parent, SIMILARITY_NAME) for parent in sorted(parents)]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the visual-similarity index for confusable-sign drills")
+    parser.add_argument('--kinds', nargs='+', choices=SIMILARITY_KINDS, default=list(SIMILARITY_KINDS))
+    parser.add_argument('--top-k', type=int, default=DEFAULT_TOP_K, help="Confusable signs kept per sign")
+    parser.add_argument('--min-similarity', type=float, default=DEFAULT_MIN_SIMILARITY,
+                        help="Cosine similarity below which a neighbour is dropped")
+    parser.add_argument('--workers', type=int, default=None, help="Descriptor processes (default: CPU count)")
+    parser.add_argument('--show', type=int, default=10, help="Most similar pairs to list per kind")
+    args = parser.parse_args(argv)
+
+    print("🧩 Sign Similarity Index")
+    print("=" * 50)
+
+    index = build_similarity_index(args.kinds, args.top_k, args.min_similarity, args.workers)
+    if not index:
+        print("❌ No sign images found. Run the image pipelines first.")
+        return 1
+
+    for kind, neighbours in index.items():
+        pairs = {}
+        for name, others in neighbours.items():
+            for other in others:
+                pairs[tuple(sorted((name, other['sign'])))] = other['similarity']
+        print(f"\n📊 {kind}: {len(neighbours)} signs, {len(pairs)} confusable pairs")
+        for (a, b), score in sorted(pairs.items(), key=lambda item: -item[1])[:args.show]:
+            print(f"   {a} ↔ {b}: {score:.3f}")
+
+    print()
+    for path in similarity_paths():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'top_k': args.top_k, 'min_similarity': args.min_similarity, 'signs': index},
+                      f, separators=(',', ':'))
+        print(f"💾 Similarity index saved to: {os.path.relpath(path, PROJECT_ROOT)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,13 +6,18 @@ Tests that the real ASL hand sign images are properly integrated into the websit
 
 import requests
 import os
-import time
+import argparse
+from asset_checks import (DEFAULT_CONCURRENCY, LocalStaticServer, check_assets,
+                          local_web_root, print_check_report)
 
-def test_frontend_serving():
+FRONTEND_URL = "http://localhost:3000"
+
+def test_frontend_serving(base_url=FRONTEND_URL, concurrency=DEFAULT_CONCURRENCY):
     """
     Test that the frontend is serving the ASL images correctly.
+
+    All letters are checked concurrently over one pooled connection set.
     """
-    base_url = "http://localhost:3000"
     letters = "abcdefghijklmnopqrstuvwxyz"
     
     print("🌐 Testing Frontend Image Serving")
@@ -22,46 +27,21 @@ def test_frontend_serving():
     try:
         response = requests.get(base_url, timeout=5)
         if response.status_code == 200:
-            print("✅ Frontend server is running")
+            print(f"✅ Frontend server is running at {base_url}")
         else:
             print(f"⚠️ Frontend returned status code: {response.status_code}")
     except requests.exceptions.ConnectionError:
-        print("❌ Frontend server not running on localhost:3000")
+        print(f"❌ Frontend server not running on {base_url}")
         return False
     except requests.exceptions.Timeout:
         print("❌ Frontend server timeout")
         return False
     
     # Test each ASL image
-    print(f"\n📸 Testing {len(letters)} ASL alphabet images...")
-    success_count = 0
-    errors = []
-    
-    for letter in letters:
-        image_url = f"{base_url}/images/signs/alphabet/{letter}.png"
-        try:
-            response = requests.head(image_url, timeout=3)
-            if response.status_code == 200:
-                content_type = response.headers.get('content-type', '')
-                if 'image' in content_type:
-                    print(f"✅ {letter.upper()}: {image_url}")
-                    success_count += 1
-                else:
-                    print(f"⚠️ {letter.upper()}: Wrong content type - {content_type}")
-                    errors.append(f"{letter}: Wrong content type")
-            else:
-                print(f"❌ {letter.upper()}: HTTP {response.status_code}")
-                errors.append(f"{letter}: HTTP {response.status_code}")
-        except requests.exceptions.RequestException as e:
-            print(f"❌ {letter.upper()}: {str(e)}")
-            errors.append(f"{letter}: {str(e)}")
-        
-        # Small delay to avoid overwhelming the server
-        time.sleep(0.1)
-    
-    print(f"\n📊 Results:")
-    print(f"✅ Successfully served: {success_count}/26 images")
-    print(f"❌ Errors: {len(errors)}")
+    print(f"\n📸 Testing {len(letters)} ASL alphabet images ({concurrency} concurrent)...")
+    urls = [f"/images/signs/alphabet/{letter}.png" for letter in letters]
+    results = check_assets(base_url, urls, concurrency=concurrency, content_types=('image',))
+    errors = print_check_report(results, label='images')
     
     if errors:
         print(f"\n🔍 Error Details:")
@@ -84,33 +64,33 @@ def verify_file_system():
     
     letters = "abcdefghijklmnopqrstuvwxyz"
     
+    def list_files(directory):
+        # One directory listing instead of an exists() call per letter
+        if not os.path.isdir(directory):
+            return set()
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    
     # Check frontend directory
+    present = list_files(frontend_dir)
     frontend_files = 0
     for letter in letters:
-        file_path = os.path.join(frontend_dir, f"{letter}.png")
-        if os.path.exists(file_path):
+        if f"{letter}.png" in present:
             frontend_files += 1
         else:
-            print(f"❌ Missing: {file_path}")
+            print(f"❌ Missing: {os.path.join(frontend_dir, f'{letter}.png')}")
     
     print(f"Frontend directory: {frontend_files}/26 PNG files")
     
     # Check main directory
-    main_files = 0
-    for letter in letters:
-        file_path = os.path.join(main_dir, f"{letter}.png")
-        if os.path.exists(file_path):
-            main_files += 1
+    present = list_files(main_dir)
+    main_files = sum(1 for letter in letters if f"{letter}.png" in present)
     
     print(f"Main directory: {main_files}/26 PNG files")
     
     # Check backup directory
-    backup_files = 0
-    letters_upper = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-    for letter in letters_upper:
-        file_path = os.path.join(backup_dir, f"{letter}.png")
-        if os.path.exists(file_path):
-            backup_files += 1
+    present = list_files(backup_dir)
+    backup_files = sum(1 for letter in letters.upper() if f"{letter}.png" in present)
     
     print(f"Backup directory: {backup_files}/26 original PNG files")
     
@@ -123,7 +103,7 @@ def verify_file_system():
     
     return all_good
 
-def test_react_component():
+def test_react_component(base_url=FRONTEND_URL):
     """
     Test that the React component can access the images.
     """
@@ -132,7 +112,7 @@ def test_react_component():
     
     try:
         # Try to access the deaf learning page
-        response = requests.get("http://localhost:3000/deaf", timeout=5)
+        response = requests.get(f"{base_url}/deaf", timeout=5)
         if response.status_code == 200:
             print("✅ Deaf learning page is accessible")
             
@@ -152,6 +132,14 @@ def test_react_component():
         return False
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify the ASL alphabet image integration")
+    parser.add_argument('--local', action='store_true',
+                        help="Serve the web root with a local static server instead of the dev server")
+    parser.add_argument('--base-url', default=FRONTEND_URL, help="Frontend URL to check")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help="Concurrent asset requests")
+    args = parser.parse_args()
+    
     print("🔍 ASL Integration Verification")
     print("=" * 60)
     print("Testing that real ASL hand sign photographs are properly")
@@ -160,17 +148,26 @@ if __name__ == "__main__":
     
     # Run all tests
     file_system_ok = verify_file_system()
-    frontend_ok = test_frontend_serving()
-    react_ok = test_react_component()
+    if args.local:
+        with LocalStaticServer(local_web_root()) as server:
+            frontend_ok = test_frontend_serving(server.base_url, args.concurrency)
+        # The static stand-in has no React app to check
+        react_ok = None
+    else:
+        frontend_ok = test_frontend_serving(args.base_url, args.concurrency)
+        react_ok = test_react_component(args.base_url)
     
     print("\n🎯 Final Results")
     print("=" * 50)
     
-    if file_system_ok and frontend_ok and react_ok:
+    if file_system_ok and frontend_ok and react_ok is not False:
         print("🎉 SUCCESS! ASL Integration Complete!")
         print("✅ All 26 real ASL hand sign photographs are working")
         print("✅ Images are properly served by the frontend")
-        print("✅ React application can access the images")
+        if react_ok is None:
+            print("⏭️ React check skipped (--local has no React app)")
+        else:
+            print("✅ React application can access the images")
         print("\n🌟 Next Steps:")
         print("1. Visit http://localhost:3000/deaf/alphabet")
         print("2. See your real ASL hand sign photographs in action!")
@@ -182,7 +179,7 @@ if __name__ == "__main__":
             print("  - File system structure needs attention")
         if not frontend_ok:
             print("  - Frontend image serving has issues")
-        if not react_ok:
+        if react_ok is False:
             print("  - React component integration needs checking")
         
         print("\n🔧 Troubleshooting:")
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Asset Integrity Verification
+Checks every generated sign asset in seconds, so it can run on every build:
+
+- each output directory is listed in a single os.scandir pass
+- PNG, JPEG, WebP and SVG files are validated from their headers and
+  trailers only (signature, dimensions, end marker / RIFF size), read in a
+  thread pool, without decoding any pixels
+- the files are compared with the expected sign list (alphabet letters and
+  the catalog's common and dictionary collections), the public/ and
+  frontend/public/ mirrors are compared, and the precache manifest's sizes
+  and revisions are checked
+- --decode additionally decodes every image fully in a process pool
+"""
+
+import os
+import re
+import json
+import time
+import struct
+import argparse
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from PIL import Image
+from sign_catalog import PROJECT_ROOT, ASSET_DIRS, ASSET_EXTENSIONS, load_catalog
+from precache_manifest import MANIFEST_NAME, file_revision
+from page_assets import PUBLIC_DIRS
+
+# Bytes read from the start of a file; JPEG frame headers past this are
+# found by reading on
+HEAD_BYTES = 64 * 1024
+TAIL_BYTES = 64
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_IEND = b'\x00\x00\x00\x00IEND\xaeB`\x82'
+
+# JPEG start-of-frame markers (all SOFn except DHT, JPG and DAC)
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# Markers without a length field
+JPEG_STANDALONE_MARKERS = {0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8}
+
+_SVG_LENGTH = re.compile(r'\b(width|height)\s*=\s*["\']\s*([\d.]+)')
+_SVG_VIEWBOX = re.compile(r'\bviewBox\s*=\s*["\']\s*[-\d.]+[\s,]+[-\d.]+[\s,]+([\d.]+)[\s,]+([\d.]+)')
+
+# Output directories holding each page's assets, and the sign names expected there
+EXPECTED_KINDS = ('alphabet', 'common', 'dictionary')
+EXPECTED_EXTENSIONS = {'alphabet': '.png', 'common': '.png', 'dictionary': '.svg'}
+
+def _png_header(head, tail, size):
+    if head[12:16] != b'IHDR' or len(head) < 26:
+        raise ValueError("PNG without IHDR chunk")
+    width, height, bit_depth, color_type = struct.unpack('>IIBB', head[16:26])
+    if not tail.endswith(PNG_IEND):
+        raise ValueError("PNG without IEND chunk (truncated?)")
+    return {'format': 'png', 'width': width, 'height': height,
+            'bit_depth': bit_depth, 'color_type': color_type}
+
+def _read_until(f, data, length):
+    """data extended from f until it holds length bytes (or f ends)"""
+    while len(data) < length:
+        chunk = f.read(max(HEAD_BYTES, length - len(data)))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+def _jpeg_header(f, head, tail, size):
+    data = head
+    offset = 2
+    while True:
+        data = _read_until(f, data, offset + 4)
+        if offset + 4 > len(data):
+            raise ValueError("JPEG without frame header")
+        if data[offset] != 0xFF:
+            raise ValueError(f"Corrupt JPEG marker at byte {offset}")
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        if marker in JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+        if marker == 0xD9 or marker == 0xDA:
+            raise ValueError("JPEG without frame header")
+        length = struct.unpack('>H', data[offset + 2:offset + 4])[0]
+        if marker in JPEG_SOF_MARKERS:
+            data = _read_until(f, data, offset + 9)
+            height, width = struct.unpack('>HH', data[offset + 5:offset + 9])
+            break
+        offset += 2 + length
+
+    if not tail.rstrip(b'\x00').endswith(b'\xff\xd9'):
+        raise ValueError("JPEG without end-of-image marker (truncated?)")
+    return {'format': 'jpeg', 'width': width, 'height': height}
+
+def _webp_header(head, tail, size):
+    riff_size = struct.unpack('<I', head[4:8])[0]
+    if riff_size + 8 != size:
+        raise ValueError(f"WebP RIFF size {riff_size + 8} != file size {size} (truncated?)")
+    chunk = head[12:16]
+    if chunk == b'VP8 ':
+        width, height = struct.unpack('<HH', head[26:30])
+        width, height = width & 0x3FFF, height & 0x3FFF
+    elif chunk == b'VP8L':
+        bits = struct.unpack('<I', head[21:25])[0]
+        width, height = (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    elif chunk == b'VP8X':
+        width = int.from_bytes(head[24:27], 'little') + 1
+        height = int.from_bytes(head[27:30], 'little') + 1
+    else:
+        raise ValueError(f"Unknown WebP chunk {chunk!r}")
+    return {'format': 'webp', 'width': width, 'height': height}
+
+def _svg_header(head, tail, size):
+    text = head.decode('utf-8', errors='replace')
+    start = text.find('<svg')
+    if start < 0:
+        raise ValueError("No <svg> element")
+    if b'</svg>' not in tail and not tail.rstrip().endswith(b'/>'):
+        raise ValueError("SVG not closed (truncated?)")
+    tag = text[start:text.find('>', start) + 1]
+    lengths = dict(_SVG_LENGTH.findall(tag))
+    width, height = lengths.get('width'), lengths.get('height')
+    if width is None or height is None:
+        viewbox = _SVG_VIEWBOX.search(tag)
+        if viewbox is None:
+            raise ValueError("SVG without width/height or viewBox")
+        width, height = viewbox.groups()
+    return {'format': 'svg', 'width': round(float(width)), 'height': round(float(height))}
+
+def read_image_header(path):
+    """
+    Format and dimensions of an image from its header, checking the file's
+    trailer for truncation, without decoding pixels. Raises ValueError for
+    a malformed or truncated file.
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        head = f.read(HEAD_BYTES)
+        if size > HEAD_BYTES:
+            f.seek(max(size - TAIL_BYTES, len(head)))
+            tail = head[-TAIL_BYTES:] + f.read()
+            tail = tail[-TAIL_BYTES:]
+            f.seek(len(head))
+        else:
+            tail = head[-TAIL_BYTES:]
+
+        if not head:
+            raise ValueError("Empty file")
+        if head.startswith(PNG_SIGNATURE):
+            header = _png_header(head, tail, size)
+        elif head.startswith(b'\xff\xd8'):
+            header = _jpeg_header(f, head, tail, size)
+        elif head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+            header = _webp_header(head, tail, size)
+        elif path.lower().endswith('.svg'):
+            header = _svg_header(head, tail, size)
+        else:
+            raise ValueError("Unrecognised image format")
+
+    if header['width'] <= 0 or header['height'] <= 0:
+        raise ValueError(f"Invalid dimensions {header['width']}x{header['height']}")
+    header['bytes'] = size
+    return header
+
+def check_header(path):
+    """(path, header or None, error or None) for one file"""
+    try:
+        return path, read_image_header(path), None
+    except (OSError, ValueError, struct.error) as e:
+        return path, None, str(e)
+
+def decode_image(path):
+    """Fully decode one image; returns (path, error or None)"""
+    try:
+        if path.lower().endswith('.svg'):
+            root = ET.parse(path).getroot()
+            if not root.tag.endswith('svg'):
+                return path, f"Root element is {root.tag}, not svg"
+        else:
+            with Image.open(path) as image:
+                image.load()
+        return path, None
+    except Exception as e:
+        return path, str(e)
+
+def scan_output_dirs(kinds=None):
+    """
+    List the asset files of each output directory with one os.scandir pass.
+
+    Returns {directory: {name: size}} (directories relative to the project
+    root; missing directories map to None).
+    """
+    listing = {}
+    for kind, directories in ASSET_DIRS.items():
+        if kinds is not None and kind not in kinds:
+            continue
+        for directory in directories:
+            full_dir = os.path.join(PROJECT_ROOT, directory)
+            if not os.path.isdir(full_dir):
+                listing[directory] = None
+                continue
+            with os.scandir(full_dir) as entries:
+                listing[directory] = {
+                    entry.name: entry.stat().st_size for entry in entries
+                    if entry.name.lower().endswith(ASSET_EXTENSIONS) and entry.is_file()
+                }
+    return listing
+
+def expected_signs():
+    """{kind: set of file names} every output directory of that kind should hold"""
+    collections = load_catalog()['collections']
+    names = {
+        'alphabet': set('abcdefghijklmnopqrstuvwxyz'),
+        'common': set(collections['common']) | set(collections['precise_crop']),
+        'dictionary': set(collections['dictionary'])
+    }
+    return {kind: {name + EXPECTED_EXTENSIONS[kind] for name in names[kind]} for kind in EXPECTED_KINDS}
+
+def compare_expected(listing):
+    """
+    (missing, unexpected) as {directory: sorted names}. A missing primary
+    directory of an expected kind counts as missing every file; missing
+    mirror directories are skipped.
+    """
+    missing, unexpected = {}, {}
+    for kind, names in expected_signs().items():
+        for position, directory in enumerate(ASSET_DIRS[kind]):
+            files = listing.get(directory)
+            if files is None:
+                if position == 0:
+                    missing[directory] = sorted(names)
+                continue
+            present = {name for name in files if name.endswith(EXPECTED_EXTENSIONS[kind])}
+            if names - present:
+                missing[directory] = sorted(names - present)
+            if present - names:
+                unexpected[directory] = sorted(present - names)
+    return missing, unexpected
+
+def compare_mirrors(listing):
+    """Page assets whose public/ and frontend/public/ copies differ, as messages"""
+    problems = []
+    for kind in EXPECTED_KINDS:
+        primary, *mirrors = ASSET_DIRS[kind]
+        for mirror in mirrors:
+            if listing.get(primary) is None or listing.get(mirror) is None:
+                continue
+            names = listing[primary].keys() | listing[mirror].keys()
+            for name in sorted(name for name in names if name.endswith(EXPECTED_EXTENSIONS[kind])):
+                sizes = listing[primary].get(name), listing[mirror].get(name)
+                if sizes[0] != sizes[1]:
+                    problems.append(f"{name}: {primary} has {sizes[0]}, {mirror} has {sizes[1]} bytes")
+    return problems
+
+def check_manifest():
+    """Manifest entries whose file is missing or differs, as messages (None without a manifest)"""
+    public_dir = os.path.join(PROJECT_ROOT, PUBLIC_DIRS[0])
+    manifest_path = os.path.join(public_dir, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)['entries']
+
+    problems = []
+    for entry in entries:
+        path = os.path.join(public_dir, entry['url'].lstrip('/'))
+        if not os.path.exists(path):
+            problems.append(f"{entry['url']}: missing")
+        elif os.path.getsize(path) != entry['size']:
+            problems.append(f"{entry['url']}: {os.path.getsize(path)} bytes, manifest says {entry['size']}")
+        elif file_revision(path) != entry['revision']:
+            problems.append(f"{entry['url']}: content differs from manifest revision")
+    return problems
+
+def verify_assets(decode=False, workers=None, verbose=False):
+    """Run every check and print the results; returns True when all pass"""
+    start = time.perf_counter()
+    listing = scan_output_dirs()
+    paths = [
+        os.path.join(PROJECT_ROOT, directory, name)
+        for directory, files in listing.items() if files for name in sorted(files)
+    ]
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        headers = list(pool.map(check_header, paths))
+    failures = [(path, error) for path, _, error in headers if error]
+
+    primaries = {ASSET_DIRS[kind][0] for kind in EXPECTED_KINDS}
+    print(f"📁 Output directories:")
+    for directory, files in listing.items():
+        if files is None:
+            print(f"   {'❌' if directory in primaries else '⚠️'} {directory}: not found")
+        else:
+            print(f"   {directory}: {len(files)} files, {sum(files.values()):,} bytes")
+    if verbose:
+        for path, header, _ in headers:
+            if header:
+                print(f"   ✅ {os.path.relpath(path, PROJECT_ROOT)}: {header['format']} "
+                      f"{header['width']}x{header['height']}")
+
+    print(f"\n🔎 Header check: {len(paths) - len(failures)}/{len(paths)} valid")
+    for path, error in failures:
+        print(f"   ❌ {os.path.relpath(path, PROJECT_ROOT)}: {error}")
+
+    if decode:
+        valid = [path for path, header, _ in headers if header]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            decoded = list(pool.map(decode_image, valid, chunksize=32))
+        decode_failures = [(path, error) for path, error in decoded if error]
+        print(f"🧩 Full decode: {len(valid) - len(decode_failures)}/{len(valid)} decoded")
+        for path, error in decode_failures:
+            print(f"   ❌ {os.path.relpath(path, PROJECT_ROOT)}: {error}")
+        failures += decode_failures
+
+    missing, unexpected = compare_expected(listing)
+    print(f"\n📋 Expected signs: {'all present' if not missing else 'some missing'}")
+    for directory, names in missing.items():
+        print(f"   ❌ {directory}: {len(names)} missing ({', '.join(names[:8])}"
+              f"{', ...' if len(names) > 8 else ''})")
+    for directory, names in unexpected.items():
+        print(f"   ⚠️ {directory}: {len(names)} not in the catalog ({', '.join(names[:8])}"
+              f"{', ...' if len(names) > 8 else ''})")
+
+    mirror_problems = compare_mirrors(listing)
+    print(f"🪞 Mirrors: {len(mirror_problems)} differences")
+    for problem in mirror_problems:
+        print(f"   ❌ {problem}")
+
+    manifest_problems = check_manifest()
+    if manifest_problems is None:
+        print(f"🗂️ Manifest: no {MANIFEST_NAME}, skipped")
+        manifest_problems = []
+    else:
+        print(f"🗂️ Manifest: {len(manifest_problems)} mismatches")
+        for problem in manifest_problems:
+            print(f"   ❌ {problem}")
+
+    print(f"\n⏱️ Checked {len(paths)} files in {time.perf_counter() - start:.2f}s")
+    return not (failures or missing or mirror_problems or manifest_problems)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify the integrity of every generated sign asset")
+    parser.add_argument('--decode', action='store_true',
+                        help="Also fully decode every image in a process pool")
+    parser.add_argument('--workers', type=int, default=None, help="Decode processes (default: CPU count)")
+    parser.add_argument('--verbose', action='store_true', help="List every valid file")
+    args = parser.parse_args(argv)
+
+    print("🛡️ Asset Integrity Verification")
+    print("=" * 50)
+    ok = verify_assets(decode=args.decode, workers=args.workers, verbose=args.verbose)
+    print("\n✅ All asset checks passed" if ok else "\n❌ Asset integrity problems found")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
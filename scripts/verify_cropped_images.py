@@ -5,10 +5,11 @@ and create a sample preview for inspection.
 """
 
 import cv2
-import numpy as np
 from PIL import Image
 import os
 import json
+from verify_assets import read_image_header
+from catalog_montage import assemble_grid, load_thumbnail
 
 def verify_images():
     """Verify and display sample cropped images"""
@@ -45,12 +46,12 @@ def verify_images():
     for sign in sample_signs:
         image_path = f'public/images/signs/common/{sign}.png'
         if os.path.exists(image_path):
-            img = cv2.imread(image_path)
-            if img is not None:
-                height, width = img.shape[:2]
-                print(f"   ✅ {sign}.png: {width}x{height} pixels")
-            else:
-                print(f"   ❌ {sign}.png: Cannot read")
+            # Header-only read: dimensions without decoding the pixels
+            try:
+                header = read_image_header(image_path)
+                print(f"   ✅ {sign}.png: {header['width']}x{header['height']} pixels")
+            except ValueError as e:
+                print(f"   ❌ {sign}.png: Cannot read ({e})")
         else:
             print(f"   ❌ {sign}.png: Not found")
     
@@ -61,51 +62,28 @@ def create_preview_montage(sample_signs):
     """Create a preview montage showing sample cropped signs"""
     print(f"\n🖼️ Creating preview montage...")
     
-    # Load sample images
-    images = []
+    # Cached thumbnails, so repeated runs don't re-decode the images
+    thumbs = []
     labels = []
     
     for sign in sample_signs:
         image_path = f'public/images/signs/common/{sign}.png'
         if os.path.exists(image_path):
-            img = cv2.imread(image_path)
-            if img is not None:
-                # Resize to consistent size for montage
-                img_resized = cv2.resize(img, (150, 150))
-                images.append(img_resized)
-                labels.append(sign)
-    
-    if not images:
+            thumbs.append(load_thumbnail(image_path))
+            labels.append(sign)
+    
+    if not thumbs:
         print("❌ No valid images found for preview")
         return
     
-    # Create montage grid
-    rows = 2
-    cols = 5
-    
-    # Create canvas
-    canvas_width = cols * 150 + (cols + 1) * 20
-    canvas_height = rows * 150 + (rows + 1) * 20 + 40  # Extra space for labels
-    canvas = np.ones((canvas_height, canvas_width, 3), dtype=np.uint8) * 255
-    
-    # Place images
-    for i, (img, label) in enumerate(zip(images[:rows*cols], labels[:rows*cols])):
-        row = i // cols
-        col = i % cols
-        
-        x = 20 + col * (150 + 20)
-        y = 20 + row * (150 + 40)  # Extra space for label
-        
-        # Place image
-        canvas[y:y+150, x:x+150] = img
-        
-        # Add label
-        cv2.putText(canvas, label, (x + 10, y + 170), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 2)
+    # Create montage grid (2 rows of 5)
+    canvas = assemble_grid(thumbs[:10], labels[:10], columns=5)
     
     # Save preview
     preview_path = 'cropped_signs_preview.jpg'
     cv2.imwrite(preview_path, canvas)
     print(f"✅ Preview montage saved: {preview_path}")
+    print(f"   For every sign, by category: python scripts/catalog_montage.py")
     
     return preview_path
 
@@ -7,7 +7,15 @@ Tests that the searchable ASL dictionary is properly set up and functional.
 import requests
 import os
 import json
-import time
+import argparse
+from search_index import search
+from dictionary_shards import SHARD_DIR_NAME, LAZY_SHARDS
+from sign_catalog import load_catalog
+from page_assets import page_assets
+from asset_checks import (DEFAULT_CONCURRENCY, LocalStaticServer, check_assets,
+                          local_web_root, print_check_report)
+
+FRONTEND_URL = "http://localhost:3000"
 
 def test_dictionary_files():
     """
@@ -60,58 +68,41 @@ def test_dictionary_files():
     
     return all_good
 
-def test_frontend_serving():
+def test_frontend_serving(base_url=FRONTEND_URL, concurrency=DEFAULT_CONCURRENCY, all_assets=False):
     """
     Test that the frontend is serving dictionary images correctly.
+
+    Checks a sample of words, or with all_assets every dictionary asset
+    (images, index and shards), concurrently over one pooled connection set.
     """
     print("\n🌐 Testing Frontend Dictionary Image Serving")
     print("=" * 50)
     
-    base_url = "http://localhost:3000"
-    
     # Test if frontend is running
     try:
         response = requests.get(base_url, timeout=5)
         if response.status_code == 200:
-            print("✅ Frontend server is running")
+            print(f"✅ Frontend server is running at {base_url}")
         else:
             print(f"⚠️ Frontend returned status code: {response.status_code}")
             return False
     except requests.exceptions.RequestException:
-        print("❌ Frontend server not running on localhost:3000")
+        print(f"❌ Frontend server not running on {base_url}")
         return False
     
     # Test dictionary images
-    test_words = ['hello', 'thank_you', 'family', 'red', 'one', 'today', 'go', 'what', 'i']
-    success_count = 0
-    errors = []
-    
-    print(f"\n📸 Testing {len(test_words)} sample dictionary images...")
-    
-    for word in test_words:
-        image_url = f"{base_url}/images/signs/dictionary/{word}.svg"
-        try:
-            response = requests.head(image_url, timeout=3)
-            if response.status_code == 200:
-                content_type = response.headers.get('content-type', '')
-                if 'image' in content_type or 'svg' in content_type:
-                    print(f"✅ {word}: {image_url}")
-                    success_count += 1
-                else:
-                    print(f"⚠️ {word}: Wrong content type - {content_type}")
-                    errors.append(f"{word}: Wrong content type")
-            else:
-                print(f"❌ {word}: HTTP {response.status_code}")
-                errors.append(f"{word}: HTTP {response.status_code}")
-        except requests.exceptions.RequestException as e:
-            print(f"❌ {word}: {str(e)}")
-            errors.append(f"{word}: {str(e)}")
-        
-        time.sleep(0.1)
+    if all_assets:
+        urls = [asset['url'] for asset in page_assets('dictionary', local_web_root())]
+        label = 'assets'
+    else:
+        test_words = ['hello', 'thank_you', 'family', 'red', 'one', 'today', 'go', 'what', 'i']
+        urls = [f"/images/signs/dictionary/{word}.svg" for word in test_words]
+        label = 'images'
     
-    print(f"\n📊 Results:")
-    print(f"✅ Successfully served: {success_count}/{len(test_words)} images")
-    print(f"❌ Errors: {len(errors)}")
+    print(f"\n📸 Testing {len(urls)} dictionary {label} ({concurrency} concurrent)...")
+    results = check_assets(base_url, urls, concurrency=concurrency,
+                           content_types=('image', 'svg', 'json'))
+    errors = print_check_report(results, label=label, verbose=not all_assets)
     
     if errors:
         print(f"\n🔍 Error Details:")
@@ -127,17 +118,10 @@ def test_dictionary_data_structure():
     print("\n📊 Testing Dictionary Data Structure")
     print("=" * 50)
     
-    # Expected categories and their word counts
+    # Expected categories and their word counts, from the sign catalog
     expected_categories = {
-        'greetings': 6,
-        'family': 6,
-        'food': 6,
-        'colors': 6,
-        'numbers': 5,
-        'time': 6,
-        'verbs': 6,
-        'questions': 6,
-        'pronouns': 6
+        category: len(names)
+        for category, names in load_catalog()['by_category']['dictionary'].items()
     }
     
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -197,13 +181,30 @@ def test_dictionary_data_structure():
         else:
             print(f"✅ All {len(signs)} signs have complete data")
         
+        # Test the precomputed search index
+        print(f"\n🔎 Search Index Check:")
+        search_path = os.path.join(os.path.dirname(json_path), SHARD_DIR_NAME,
+                                   dict(LAZY_SHARDS)['search_index'])
+        if not os.path.exists(search_path):
+            print(f"❌ No search index shard at {search_path} (rebuild with create_asl_dictionary_images.py)")
+            return False
+        with open(search_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        
+        unsearchable = [word for word in signs if word not in search(index, word.replace('_', ' '))]
+        if unsearchable:
+            print(f"❌ {len(unsearchable)} signs not found by name: {', '.join(unsearchable[:5])}")
+            return False
+        print(f"✅ All {len(signs)} signs found by name ({len(index['terms'])} terms, "
+              f"{len(index['prefixes'])} prefixes indexed)")
+        
         return all_categories_good and len(incomplete_signs) == 0
         
     except Exception as e:
         print(f"❌ Error reading dictionary data: {e}")
         return False
 
-def test_react_component_integration():
+def test_react_component_integration(base_url=FRONTEND_URL):
     """
     Test that the React component can access the dictionary.
     """
@@ -212,7 +213,7 @@ def test_react_component_integration():
     
     try:
         # Try to access the deaf learning page
-        response = requests.get("http://localhost:3000/deaf", timeout=5)
+        response = requests.get(f"{base_url}/deaf", timeout=5)
         if response.status_code == 200:
             print("✅ Deaf learning page is accessible")
             
@@ -232,6 +233,16 @@ def test_react_component_integration():
         return False
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify the ASL dictionary setup")
+    parser.add_argument('--local', action='store_true',
+                        help="Serve the web root with a local static server instead of the dev server")
+    parser.add_argument('--base-url', default=FRONTEND_URL, help="Frontend URL to check")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help="Concurrent asset requests")
+    parser.add_argument('--all-assets', action='store_true',
+                        help="Check every dictionary asset instead of a sample of words")
+    args = parser.parse_args()
+    
     print("🔍 ASL Dictionary Setup Verification")
     print("=" * 70)
     print("Testing that the searchable ASL dictionary is properly set up")
@@ -240,19 +251,28 @@ if __name__ == "__main__":
     
     # Run all tests
     files_ok = test_dictionary_files()
-    serving_ok = test_frontend_serving()
+    if args.local:
+        with LocalStaticServer(local_web_root()) as server:
+            serving_ok = test_frontend_serving(server.base_url, args.concurrency, args.all_assets)
+        # The static stand-in has no React app to check
+        react_ok = None
+    else:
+        serving_ok = test_frontend_serving(args.base_url, args.concurrency, args.all_assets)
+        react_ok = test_react_component_integration(args.base_url)
     data_ok = test_dictionary_data_structure()
-    react_ok = test_react_component_integration()
     
     print("\n🎯 Final Results")
     print("=" * 50)
     
-    if files_ok and serving_ok and data_ok and react_ok:
+    if files_ok and serving_ok and data_ok and react_ok is not False:
         print("🎉 SUCCESS! ASL Dictionary Setup Complete!")
         print("✅ All 53 dictionary sign images are properly created")
         print("✅ Images are correctly served by the frontend")
         print("✅ Dictionary data structure is complete and valid")
-        print("✅ React component integration is working")
+        if react_ok is None:
+            print("⏭️ React check skipped (--local has no React app)")
+        else:
+            print("✅ React component integration is working")
         print("\n🌟 Dictionary Features Available:")
         print("  📱 Searchable interface with 53+ ASL signs")
         print("  🔍 Smart search by word, description, or usage")
@@ -276,7 +296,7 @@ if __name__ == "__main__":
             print("  - Frontend image serving has issues")
         if not data_ok:
             print("  - Dictionary data structure problems")
-        if not react_ok:
+        if react_ok is False:
             print("  - React component integration needs checking")
         
         print("\n🔧 Troubleshooting:")
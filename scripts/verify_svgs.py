@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+SVG Verification and Complexity Budgets
+Parses every generated SVG (alphabet hands and dictionary signs) with a
+streaming parser across a process pool, reports malformed markup, records
+each file's complexity (bytes, elements, paths, path commands, nesting
+depth, filters, gradients) and enforces the budgets under "svg" in
+scripts/data/page_budgets.json.
+
+Heavy hand SVGs (e.g. from create_all_realistic_asl_hands) cost render time
+on low-end phones, so budget violations fail the check.
+"""
+
+import os
+import re
+import json
+import argparse
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from sign_catalog import PROJECT_ROOT, ASSET_DIRS
+from page_weight import BUDGETS_PATH, load_budgets
+
+SVG_KINDS = ('alphabet', 'dictionary')
+METRICS = ('bytes', 'elements', 'paths', 'path_commands', 'depth', 'filters', 'gradients')
+
+# Used when the budget file has no "svg" section
+DEFAULT_SVG_BUDGETS = {
+    'bytes': 16384,
+    'elements': 200,
+    'paths': 50,
+    'path_commands': 500,
+    'depth': 10,
+    'filters': 2
+}
+
+_PATH_COMMAND = re.compile(r'[MmZzLlHhVvCcSsQqTtAa]')
+
+def _local_name(tag):
+    """'{http://www.w3.org/2000/svg}path' -> 'path'"""
+    return tag.rsplit('}', 1)[-1]
+
+def svg_metrics(path):
+    """
+    Stream-parse one SVG and return its metrics, or an 'error' entry for
+    malformed markup. Elements are cleared as they close, so memory stays
+    flat however large the file is.
+    """
+    metrics = dict.fromkeys(METRICS, 0)
+    metrics['path'] = path
+    metrics['error'] = None
+    depth = 0
+    try:
+        metrics['bytes'] = os.path.getsize(path)
+        for event, element in ET.iterparse(path, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                metrics['depth'] = max(metrics['depth'], depth)
+                if depth == 1 and _local_name(element.tag) != 'svg':
+                    raise ValueError(f"root element is <{_local_name(element.tag)}>, not <svg>")
+                continue
+
+            depth -= 1
+            metrics['elements'] += 1
+            name = _local_name(element.tag)
+            if name == 'path':
+                metrics['paths'] += 1
+                metrics['path_commands'] += len(_PATH_COMMAND.findall(element.get('d', '')))
+            elif name == 'filter':
+                metrics['filters'] += 1
+            elif name in ('linearGradient', 'radialGradient'):
+                metrics['gradients'] += 1
+            element.clear()
+    except ET.ParseError as e:
+        metrics['error'] = f"malformed markup at line {e.position[0]}, column {e.position[1]}"
+    except (OSError, ValueError) as e:
+        metrics['error'] = str(e)
+    return metrics
+
+def find_svgs(kinds=SVG_KINDS):
+    """SVG files in the output directories of the given kinds, one scandir per directory"""
+    paths = []
+    for kind in kinds:
+        for directory in ASSET_DIRS[kind]:
+            full_dir = os.path.join(PROJECT_ROOT, directory)
+            if not os.path.isdir(full_dir):
+                continue
+            with os.scandir(full_dir) as entries:
+                paths.extend(sorted(entry.path for entry in entries
+                                    if entry.name.lower().endswith('.svg') and entry.is_file()))
+    return paths
+
+def check_budgets(results, budgets):
+    """[(path, metric, value, limit)] for every metric over its budget"""
+    return [
+        (result['path'], metric, result[metric], limit)
+        for result in results if not result['error']
+        for metric, limit in budgets.items()
+        if metric in METRICS and result[metric] > limit
+    ]
+
+def verify_svgs(paths, budgets, workers=None, top=5):
+    """Parse, measure and budget-check the given SVGs; returns (results, violations)"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(svg_metrics, paths, chunksize=32))
+
+    malformed = [result for result in results if result['error']]
+    valid = [result for result in results if not result['error']]
+    print(f"🧾 Parsed {len(results)} SVGs: {len(valid)} valid, {len(malformed)} malformed")
+    for result in malformed:
+        print(f"   ❌ {os.path.relpath(result['path'], PROJECT_ROOT)}: {result['error']}")
+
+    if valid:
+        print(f"\n  {'metric':<15}{'mean':>10}{'max':>10}{'budget':>10}")
+        for metric in METRICS:
+            values = [result[metric] for result in valid]
+            limit = budgets.get(metric, '-')
+            print(f"  {metric:<15}{sum(values) / len(values):>10.1f}{max(values):>10}{limit:>10}")
+
+        print(f"\n🏋️ Heaviest by elements:")
+        for result in sorted(valid, key=lambda result: result['elements'], reverse=True)[:top]:
+            print(f"   {os.path.relpath(result['path'], PROJECT_ROOT)}: {result['elements']} elements, "
+                  f"{result['paths']} paths, {result['path_commands']} path commands, "
+                  f"{result['bytes']:,} bytes")
+
+    violations = check_budgets(results, budgets)
+    if violations:
+        print(f"\n❌ {len(violations)} budget violations:")
+        for path, metric, value, limit in violations:
+            print(f"   {os.path.relpath(path, PROJECT_ROOT)}: {metric} {value:,} > {limit:,}")
+    return results, violations
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate generated SVGs and enforce complexity budgets")
+    parser.add_argument('paths', nargs='*', help="SVG files to check (default: every generated SVG)")
+    parser.add_argument('--budgets', default=BUDGETS_PATH, help="Budget configuration JSON ('svg' section)")
+    parser.add_argument('--workers', type=int, default=None, help="Parser processes (default: CPU count)")
+    parser.add_argument('--top', type=int, default=5, help="Heaviest files to list")
+    parser.add_argument('--json', help="Write per-file metrics to this JSON file")
+    args = parser.parse_args(argv)
+
+    print("🧾 SVG Verification")
+    print("=" * 50)
+
+    paths = args.paths or find_svgs()
+    if not paths:
+        print("❌ No SVG files found. Run the SVG generators first.")
+        return 1
+
+    budgets = load_budgets(args.budgets).get('svg', DEFAULT_SVG_BUDGETS)
+    results, violations = verify_svgs(paths, budgets, args.workers, args.top)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'budgets': budgets, 'files': results}, f, indent=2)
+        print(f"\n💾 Metrics saved to: {args.json}")
+
+    ok = not violations and not any(result['error'] for result in results)
+    print("\n✅ All SVGs valid and within budget" if ok else "\n❌ SVG problems found")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Voice Lookup Index
+Builds a transcript-tolerant index of sign names so spoken input such as
+"thank you", "thankyou" or "tank you" resolves to the `thank_you` sign with
+a few dictionary lookups instead of edit distance against every sign.
+"""
+
+from search_index import normalize_text
+
+# Minimum Dice similarity for a trigram-only match to be accepted
+DEFAULT_MIN_SIMILARITY = 0.5
+
+# Soundex digit classes; vowels and h/w/y carry no code
+_SOUNDEX_CODES = {
+    **dict.fromkeys('bfpv', '1'),
+    **dict.fromkeys('cgjkqsxz', '2'),
+    **dict.fromkeys('dt', '3'),
+    'l': '4',
+    **dict.fromkeys('mn', '5'),
+    'r': '6'
+}
+
+def compact_key(text):
+    """Normalize text and drop all spacing: 'Thank-You' -> 'thankyou'"""
+    return normalize_text(text).replace(' ', '')
+
+def phonetic_key(text):
+    """
+    Soundex-style phonetic key over the whole compact name.
+
+    Unlike classic Soundex the code isn't truncated to four characters, so
+    multi-word names stay distinguishable: 'thank you' and 'tank you' both
+    give 't52'.
+    """
+    key = compact_key(text)
+    if not key:
+        return ''
+
+    code = [key[0]]
+    previous = _SOUNDEX_CODES.get(key[0], '')
+    for ch in key[1:]:
+        digit = _SOUNDEX_CODES.get(ch, '')
+        if digit and digit != previous:
+            code.append(digit)
+        # h and w don't separate letters with the same code; vowels do
+        if ch not in 'hw':
+            previous = digit
+    return ''.join(code)
+
+def trigrams(text):
+    """Character trigrams of the compact key, with word-boundary markers"""
+    key = f"^{compact_key(text)}$"
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+def build_voice_index(sign_ids):
+    """
+    Build the voice lookup index for a list of sign ids.
+
+    The index contains:
+        ids:       sign ids in posting order
+        aliases:   compact key -> sign (exact, spacing-insensitive matches)
+        phonetic:  phonetic key -> candidate signs
+        trigrams:  trigram -> candidate signs
+        sizes:     trigram count per sign, for Dice scoring
+    """
+    ids = list(sign_ids)
+    aliases, phonetic, grams = {}, {}, {}
+    sizes = []
+
+    for ordinal, sign_id in enumerate(ids):
+        aliases.setdefault(compact_key(sign_id), ordinal)
+        phonetic.setdefault(phonetic_key(sign_id), []).append(ordinal)
+
+        sign_grams = trigrams(sign_id)
+        sizes.append(len(sign_grams))
+        for gram in sign_grams:
+            grams.setdefault(gram, []).append(ordinal)
+
+    return {
+        'ids': ids,
+        'aliases': dict(sorted(aliases.items())),
+        'phonetic': dict(sorted(phonetic.items())),
+        'trigrams': dict(sorted(grams.items())),
+        'sizes': sizes
+    }
+
+def resolve(index, transcript, limit=3, min_similarity=DEFAULT_MIN_SIMILARITY):
+    """
+    Resolve a voice transcript to candidate sign ids, best first.
+
+    Tries an exact compact-key alias, then the phonetic bucket, then ranks
+    trigram candidates by Dice similarity. Work is bounded by the posting
+    lists of the transcript's trigrams, so common trigrams still cost more
+    as the vocabulary grows; there is no scan over every sign.
+    """
+    alias = index['aliases'].get(compact_key(transcript))
+    if alias is not None:
+        return [index['ids'][alias]]
+
+    query_grams = trigrams(transcript)
+    shared = {}
+    for gram in query_grams:
+        for ordinal in index['trigrams'].get(gram, []):
+            shared[ordinal] = shared.get(ordinal, 0) + 1
+
+    def dice(ordinal):
+        return 2.0 * shared.get(ordinal, 0) / (len(query_grams) + index['sizes'][ordinal])
+
+    phonetic_hits = index['phonetic'].get(phonetic_key(transcript), [])
+    candidates = {ordinal: dice(ordinal) + 1.0 for ordinal in phonetic_hits}
+    for ordinal in shared:
+        score = dice(ordinal)
+        if score >= min_similarity:
+            candidates[ordinal] = max(candidates.get(ordinal, 0.0), score)
+
+    ranked = sorted(candidates, key=lambda ordinal: (-candidates[ordinal], ordinal))
+    return [index['ids'][ordinal] for ordinal in ranked[:limit]]